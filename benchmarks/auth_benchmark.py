@@ -0,0 +1,235 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+from uuid_extensions import uuid7
+
+ENDPOINTS = ('register', 'login', 'logout')
+PASSWORD = 'benchmark-pass'
+
+
+class EndpointResult:
+    def __init__(self, endpoint: str):
+        self.endpoint: str = endpoint
+        self.latencies: list[float] = []
+        self.errors: int = 0
+        self.duration: float = 0.0
+
+    def report(self) -> dict:
+        latencies = sorted(self.latencies)
+        percentiles = (
+            statistics.quantiles(latencies, n=100, method='inclusive')
+            if len(latencies) > 1
+            else latencies * 99
+        )
+        return {
+            'requests': len(latencies) + self.errors,
+            'errors': self.errors,
+            'rps': len(latencies) / self.duration if self.duration else 0.0,
+            'p50_ms': percentiles[49] * 1000 if percentiles else 0.0,
+            'p90_ms': percentiles[89] * 1000 if percentiles else 0.0,
+            'p99_ms': percentiles[98] * 1000 if percentiles else 0.0,
+            'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        }
+
+
+@asynccontextmanager
+async def get_client(base_url: str | None):
+    if base_url:
+        async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+            yield client
+        return
+
+    from src.main import app
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url='http://benchmark',
+            timeout=60,
+        ) as client:
+            yield client
+
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    requests: list[dict],
+    concurrency: int,
+) -> tuple[EndpointResult, list[httpx.Response | None]]:
+    result = EndpointResult(endpoint=endpoint)
+    responses: list[httpx.Response | None] = [None] * len(requests)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(index: int, request: dict):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.post(f'/user/{endpoint}', **request)
+            except httpx.HTTPError:
+                result.errors += 1
+                return
+            if response.status_code >= 400:
+                result.errors += 1
+                return
+            result.latencies.append(time.perf_counter() - start)
+            responses[index] = response
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(send(index, request) for index, request in enumerate(requests))
+    )
+    result.duration = time.perf_counter() - start
+    return result, responses
+
+
+def get_cookie_header(response: httpx.Response | None) -> dict:
+    if response is None:
+        return {}
+    cookies = '; '.join(
+        f'{name}={response.cookies[name]}'
+        for name in ('stuffr_access', 'stuffr_refresh')
+        if name in response.cookies
+    )
+    return {'headers': {'Cookie': cookies}}
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    run_id = uuid7().hex[-12:]
+    credentials = [
+        {'email': f'bench-{run_id}-{index}@example.com', 'password': PASSWORD}
+        for index in range(args.users)
+    ]
+    results = {}
+
+    async with get_client(base_url=args.base_url) as client:
+        result, _ = await run_phase(
+            client=client,
+            endpoint='register',
+            requests=[
+                {'json': {**credential, 'name': f'Bench {index}'}}
+                for index, credential in enumerate(credentials)
+            ],
+            concurrency=args.concurrency,
+        )
+        results['register'] = result.report()
+
+        result, responses = await run_phase(
+            client=client,
+            endpoint='login',
+            requests=[{'json': credential} for credential in credentials],
+            concurrency=args.concurrency,
+        )
+        results['login'] = result.report()
+
+        result, _ = await run_phase(
+            client=client,
+            endpoint='logout',
+            requests=[
+                get_cookie_header(response=response)
+                for response in responses
+                if response is not None
+            ],
+            concurrency=args.concurrency,
+        )
+        results['logout'] = result.report()
+
+    return {
+        'run_id': run_id,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'concurrency': args.concurrency,
+        'users': args.users,
+        'target': args.base_url or 'in-process',
+        'endpoints': results,
+    }
+
+
+def compare(result: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for endpoint in ENDPOINTS:
+        current = result['endpoints'].get(endpoint)
+        previous = baseline['endpoints'].get(endpoint)
+        if not current or not previous:
+            continue
+        if current['p99_ms'] > previous['p99_ms'] * (1 + threshold):
+            regressions.append(
+                f'{endpoint}: p99 {current["p99_ms"]:.1f} ms '
+                f'> baseline {previous["p99_ms"]:.1f} ms'
+            )
+        if current['rps'] < previous['rps'] * (1 - threshold):
+            regressions.append(
+                f'{endpoint}: {current["rps"]:.1f} rps '
+                f'< baseline {previous["rps"]:.1f} rps'
+            )
+        if current['errors'] > previous['errors']:
+            regressions.append(
+                f'{endpoint}: {current["errors"]} errors '
+                f'> baseline {previous["errors"]}'
+            )
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Load benchmark for /user/register, /user/login and /user/logout'
+    )
+    parser.add_argument(
+        '--base-url',
+        default=None,
+        help='URL of a running server; the app is driven in-process if omitted',
+    )
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument(
+        '--output', type=Path, default=Path('benchmarks/results/latest.json')
+    )
+    parser.add_argument(
+        '--baseline', type=Path, default=Path('benchmarks/baseline.json')
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='Allowed relative regression against the baseline',
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='Store this run as the new baseline',
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    result = asyncio.run(run_benchmark(args=args))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2))
+    sys.stdout.write(json.dumps(result['endpoints'], indent=2) + '\n')
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(result, indent=2))
+        return 0
+
+    if not args.baseline.exists():
+        return 0
+
+    regressions = compare(
+        result=result,
+        baseline=json.loads(args.baseline.read_text()),
+        threshold=args.threshold,
+    )
+    for regression in regressions:
+        sys.stderr.write(f'Regression: {regression}\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
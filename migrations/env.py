@@ -9,6 +9,8 @@ from src.database.models.announcement_image_model import AnnouncementImage  # no
 from src.database.models.announcement_model import Announcement  # noqa
 from src.database.models.base_model import BaseModel
 from src.database.models.category_model import Category  # noqa
+from src.database.models.image_model import Image  # noqa
+from src.database.models.refresh_token_model import RefreshToken  # noqa
 from src.database.models.review_model import Review  # noqa
 from src.database.models.role_model import Role  # noqa
 from src.database.models.user_model import User  # noqa
@@ -0,0 +1,29 @@
+"""user token version
+
+Revision ID: 3f1c9a2b7d41
+Revises: a73210a6ca22
+Create Date: 2026-10-18 10:10:42.118305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a2b7d41'
+down_revision: Union[str, None] = 'a73210a6ca22'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'user',
+        sa.Column('token_version', sa.INTEGER(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('user', 'token_version')
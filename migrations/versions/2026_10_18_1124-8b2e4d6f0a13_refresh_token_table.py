@@ -0,0 +1,69 @@
+"""refresh token table
+
+Revision ID: 8b2e4d6f0a13
+Revises: 3f1c9a2b7d41
+Create Date: 2026-10-18 11:24:05.734910
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f0a13'
+down_revision: Union[str, None] = '3f1c9a2b7d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'refresh_token',
+        sa.Column('token_hash', sa.VARCHAR(length=64), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('family_id', sa.UUID(), nullable=False),
+        sa.Column('expires_at', postgresql.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column(
+            'created_at',
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('token_hash'),
+    )
+    op.create_index(
+        op.f('ix_refresh_token_user_id'), 'refresh_token', ['user_id'], unique=False
+    )
+    op.create_index(
+        op.f('ix_refresh_token_family_id'),
+        'refresh_token',
+        ['family_id'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_refresh_token_expires_at'),
+        'refresh_token',
+        ['expires_at'],
+        unique=False,
+    )
+    op.drop_column('user', 'refresh_tokens')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'user',
+        sa.Column(
+            'refresh_tokens',
+            postgresql.ARRAY(sa.TEXT()),
+            server_default='{}',
+            nullable=False,
+        ),
+    )
+    op.drop_index(op.f('ix_refresh_token_expires_at'), table_name='refresh_token')
+    op.drop_index(op.f('ix_refresh_token_family_id'), table_name='refresh_token')
+    op.drop_index(op.f('ix_refresh_token_user_id'), table_name='refresh_token')
+    op.drop_table('refresh_token')
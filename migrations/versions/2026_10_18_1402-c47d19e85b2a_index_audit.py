@@ -0,0 +1,86 @@
+"""index audit
+
+Revision ID: c47d19e85b2a
+Revises: 8b2e4d6f0a13
+Create Date: 2026-10-18 14:02:51.904117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47d19e85b2a'
+down_revision: Union[str, None] = '8b2e4d6f0a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PK_INDEXES = {
+    'ix_category_id': 'category',
+    'ix_role_id': 'role',
+    'ix_user_id': 'user',
+    'ix_announcement_id': 'announcement',
+    'ix_review_id': 'review',
+}
+
+FK_INDEXES = {
+    'ix_announcement_user_id': ('announcement', 'user_id'),
+    'ix_announcement_category_id': ('announcement', 'category_id'),
+    'ix_review_user_to_id': ('review', 'user_to_id'),
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_email_lower',
+            'user',
+            [sa.text('lower(email)')],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for index_name, (table_name, column_name) in FK_INDEXES.items():
+            op.create_index(
+                index_name,
+                table_name,
+                [column_name],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for index_name, table_name in PK_INDEXES.items():
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name in PK_INDEXES.items():
+            op.create_index(
+                index_name,
+                table_name,
+                ['id'],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for index_name, (table_name, _) in FK_INDEXES.items():
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        op.drop_index(
+            'ix_user_email_lower',
+            table_name='user',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
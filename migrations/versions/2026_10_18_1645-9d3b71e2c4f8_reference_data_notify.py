@@ -0,0 +1,48 @@
+"""reference data notify
+
+Revision ID: 9d3b71e2c4f8
+Revises: 5e8a0c3f9d27
+Create Date: 2026-10-18 16:45:38.215964
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3b71e2c4f8'
+down_revision: Union[str, None] = '5e8a0c3f9d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('category', 'role')
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_reference_data() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('reference_data', TG_TABLE_NAME);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table_name in TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table_name}_notify_reference_data
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table_name}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_reference_data()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table_name in TABLES:
+        op.execute(
+            f'DROP TRIGGER IF EXISTS {table_name}_notify_reference_data ON {table_name}'
+        )
+    op.execute('DROP FUNCTION IF EXISTS notify_reference_data()')
@@ -0,0 +1,45 @@
+"""review score rating counters
+
+Revision ID: e61f4a8b2c93
+Revises: 9d3b71e2c4f8
+Create Date: 2026-10-18 17:50:04.682291
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e61f4a8b2c93'
+down_revision: Union[str, None] = '9d3b71e2c4f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('review', sa.Column('score', postgresql.SMALLINT(), nullable=True))
+    op.create_check_constraint(
+        'ck_review_score_range', 'review', 'score BETWEEN 1 AND 5'
+    )
+    op.add_column(
+        'user',
+        sa.Column(
+            'rating_sum', postgresql.INTEGER(), server_default='0', nullable=False
+        ),
+    )
+    op.add_column(
+        'user',
+        sa.Column(
+            'rating_count', postgresql.INTEGER(), server_default='0', nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('user', 'rating_count')
+    op.drop_column('user', 'rating_sum')
+    op.drop_constraint('ck_review_score_range', 'review', type_='check')
+    op.drop_column('review', 'score')
@@ -0,0 +1,87 @@
+"""image table
+
+Revision ID: b7c2e9f41a06
+Revises: e61f4a8b2c93
+Create Date: 2026-10-18 19:05:27.903614
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c2e9f41a06'
+down_revision: Union[str, None] = 'e61f4a8b2c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'image',
+        sa.Column('hash', postgresql.BYTEA(), nullable=False),
+        sa.Column('size', postgresql.INTEGER(), nullable=False),
+        sa.Column('width', postgresql.INTEGER(), nullable=False),
+        sa.Column('height', postgresql.INTEGER(), nullable=False),
+        sa.Column('format', postgresql.SMALLINT(), nullable=False),
+        sa.Column(
+            'created_at',
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('hash'),
+    )
+    op.add_column(
+        'announcement_image',
+        sa.Column(
+            'position', postgresql.SMALLINT(), server_default='0', nullable=False
+        ),
+    )
+    op.alter_column('announcement_image', 'position', server_default=None)
+    op.add_column(
+        'announcement_image',
+        sa.Column('image_hash', postgresql.BYTEA(), nullable=True),
+    )
+    op.alter_column(
+        'announcement_image', 'image_url', existing_type=sa.TEXT(), nullable=True
+    )
+    op.create_foreign_key(
+        'announcement_image_image_hash_fkey',
+        'announcement_image',
+        'image',
+        ['image_hash'],
+        ['hash'],
+    )
+    op.create_index(
+        'ix_announcement_image_image_hash',
+        'announcement_image',
+        ['image_hash'],
+        unique=False,
+    )
+    op.drop_constraint('announcement_image_pkey', 'announcement_image')
+    op.create_primary_key(
+        'announcement_image_pkey', 'announcement_image', ['announcement_id', 'position']
+    )
+
+
+def downgrade() -> None:
+    op.execute('DELETE FROM announcement_image WHERE image_url IS NULL')
+    op.execute('DELETE FROM announcement_image WHERE position > 0')
+    op.drop_constraint('announcement_image_pkey', 'announcement_image')
+    op.create_primary_key(
+        'announcement_image_pkey', 'announcement_image', ['announcement_id']
+    )
+    op.drop_index('ix_announcement_image_image_hash', table_name='announcement_image')
+    op.drop_constraint(
+        'announcement_image_image_hash_fkey', 'announcement_image', type_='foreignkey'
+    )
+    op.alter_column(
+        'announcement_image', 'image_url', existing_type=sa.TEXT(), nullable=False
+    )
+    op.drop_column('announcement_image', 'image_hash')
+    op.drop_column('announcement_image', 'position')
+    op.drop_table('image')
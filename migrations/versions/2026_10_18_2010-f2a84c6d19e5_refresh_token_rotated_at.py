@@ -0,0 +1,37 @@
+"""refresh token rotated at
+
+Revision ID: f2a84c6d19e5
+Revises: b7c2e9f41a06
+Create Date: 2026-10-18 20:10:43.156208
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a84c6d19e5'
+down_revision: Union[str, None] = 'b7c2e9f41a06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'refresh_token',
+        sa.Column('rotated_at', postgresql.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.create_index(
+        op.f('ix_refresh_token_rotated_at'),
+        'refresh_token',
+        ['rotated_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_refresh_token_rotated_at'), table_name='refresh_token')
+    op.drop_column('refresh_token', 'rotated_at')
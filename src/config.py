@@ -9,11 +9,67 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int
 
     POSTGRES_URL: str
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 30.0
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = False
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100
+    POSTGRES_REPLICA_URLS: list[str] = []
+    POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL: int = 10
+    POSTGRES_REPLICA_HEALTH_CHECK_TIMEOUT: float = 2.0
 
     TOKEN_SECRET: str
     TOKEN_ALGORITHM: str
     ACCESS_TOKEN_EXPIRATION: int
     REFRESH_TOKEN_EXPIRATION: int
+    REFRESH_TOKEN_SWEEP_INTERVAL: int = 3600
+    REFRESH_TOKEN_SWEEP_BATCH_SIZE: int = 5000
+    REFRESH_TOKEN_MAX_PER_USER: int = 0
+    REFRESH_TOKEN_REUSE_GRACE: int = 10
+    TOKEN_CACHE_SIZE: int = 10000
+    ADMIN_ROLE_IDS: list[int] = [2]
+
+    REDIS_URL: str | None = None
+    ENTITY_CACHE_SIZE: int = 10000
+    ENTITY_CACHE_TTL: int = 30
+    ENTITY_CACHE_REDIS_TTL: int = 300
+
+    REFERENCE_DATA_RECONNECT_INTERVAL: int = 5
+
+    RATING_RECONCILE_INTERVAL: int = 86400
+    RATING_RECONCILE_BATCH_SIZE: int = 1000
+
+    PAGE_DEFAULT_LIMIT: int = 20
+    PAGE_MAX_LIMIT: int = 100
+
+    EXPORT_FETCH_SIZE: int = 1000
+
+    BULK_BATCH_SIZE: int = 5000
+    BULK_COPY_THRESHOLD: int = 10000
+
+    IMAGE_STORAGE_PATH: str = 'media'
+    IMAGE_MEDIA_URL: str = '/media'
+    IMAGE_MAX_SIZE: int = 10 * 1024 * 1024
+    IMAGE_MAX_PIXELS: int = 40_000_000
+    IMAGE_WRITE_BUFFER_SIZE: int = 1024 * 1024
+    IMAGE_THUMBNAIL_SIZES: list[int] = [200, 800]
+    IMAGE_MAX_PER_ANNOUNCEMENT: int = 10
+    IMAGE_WORKERS: int = 2
+    IMAGE_MAX_QUEUE: int = 16
+
+    PASSWORD_HASH_EXECUTOR: str = 'thread'
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    LOG_LEVEL: str = 'INFO'
+    LOG_FORMAT: str = 'json'
+    TRACE_LOG_LEVEL: str = 'DEBUG'
+    TRACE_SAMPLE_RATE: float = 1.0
+    SERVER_TIMING_ENABLED: bool = False
+    QUERY_COUNTER_ENABLED: bool = False
+    QUERY_MAX_PER_REQUEST: int = 0
+    QUERY_REPEAT_WARNING_THRESHOLD: int = 3
 
     model_config = SettingsConfigDict(env_file='.env')
 
@@ -0,0 +1,18 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import func, select
+
+from src.database.database import engine
+
+
+@asynccontextmanager
+async def advisory_lock(key: int) -> AsyncIterator[bool]:
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level='AUTOCOMMIT')
+        acquired = await connection.scalar(select(func.pg_try_advisory_lock(key)))
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await connection.execute(select(func.pg_advisory_unlock(key)))
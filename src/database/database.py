@@ -1,14 +1,71 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from src.config import settings
+from src.database.pool_metrics import InstrumentedQueuePool
+from src.database.query_events import register_query_events
+from src.database.replica_router import ReplicaRouter, RoutingSession
+from src.utils.entity_cache import EntityCache
+from src.utils.request_timing import RequestTiming
 
-engine = create_async_engine(url=settings.POSTGRES_URL)
 
-session_maker = async_sessionmaker(bind=engine, class_=AsyncSession)
+def create_engine(url: str, name: str) -> AsyncEngine:
+    new_engine = create_async_engine(
+        url=url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+        pool_logging_name=name,
+        connect_args={
+            'prepared_statement_cache_size': settings.POSTGRES_STATEMENT_CACHE_SIZE,
+            'statement_cache_size': settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        },
+    )
+    register_query_events(engine=new_engine)
+    return new_engine
+
+
+engine = create_engine(url=settings.POSTGRES_URL, name='primary')
+
+replica_router = ReplicaRouter(
+    engines=[
+        create_engine(url=url, name=f'replica_{index}')
+        for index, url in enumerate(settings.POSTGRES_REPLICA_URLS)
+    ]
+)
+
+
+class StuffrSession(RoutingSession):
+    primary = engine
+    replica_router = replica_router
+
+
+session_maker = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    sync_session_class=StuffrSession,
+    expire_on_commit=False,
+)
 
 
 async def get_async_session():
     session: AsyncSession
     async with session_maker() as session:
-        yield session
-        await session.commit()
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            await EntityCache.run_committed_invalidations(session=session)
+            raise
+
+        if session.in_transaction():
+            with RequestTiming.measure(phase='db'):
+                await session.commit()
+        await EntityCache.run_committed_invalidations(session=session)
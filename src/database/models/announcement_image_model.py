@@ -1,7 +1,7 @@
 import uuid
 
 from sqlalchemy import ForeignKey
-from sqlalchemy.dialects.postgresql import TEXT
+from sqlalchemy.dialects.postgresql import BYTEA, SMALLINT, TEXT
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..models.base_model import BaseModel
@@ -13,4 +13,8 @@ class AnnouncementImage(BaseModel):
     announcement_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey('announcement.id'), nullable=False, primary_key=True
     )
-    image_url: Mapped[str] = mapped_column(TEXT, nullable=False)
+    position: Mapped[int] = mapped_column(SMALLINT, nullable=False, primary_key=True)
+    image_hash: Mapped[bytes] = mapped_column(
+        BYTEA, ForeignKey('image.hash'), nullable=True, index=True
+    )
+    image_url: Mapped[str] = mapped_column(TEXT, nullable=True)
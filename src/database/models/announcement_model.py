@@ -1,12 +1,14 @@
 import uuid
 
-from sqlalchemy import ForeignKey
-from sqlalchemy.dialects.postgresql import INTEGER, TEXT, VARCHAR
+from sqlalchemy import Computed, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import INTEGER, TEXT, TSVECTOR, VARCHAR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ...schemas.announcement_schemas import AnnouncementStatus
 from ..models.base_model import BaseModel, CreatedAtMixin, IdPkUUIDMixin, UpdatedAtMixin
 
+SEARCH_CONFIG = 'russian'
+
 
 class Announcement(BaseModel, IdPkUUIDMixin, CreatedAtMixin, UpdatedAtMixin):
     __tablename__ = 'announcement'
@@ -18,5 +20,32 @@ class Announcement(BaseModel, IdPkUUIDMixin, CreatedAtMixin, UpdatedAtMixin):
     status: Mapped[str] = mapped_column(
         VARCHAR(15), nullable=False, default=AnnouncementStatus.UNDER_REVIEW
     )
-    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('user.id'), nullable=False)
-    category_id: Mapped[int] = mapped_column(ForeignKey('category.id'), nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey('user.id'), nullable=False, index=True
+    )
+    category_id: Mapped[int] = mapped_column(
+        ForeignKey('category.id'), nullable=False, index=True
+    )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A')"
+            f" || setweight(to_tsvector('{SEARCH_CONFIG}', "
+            "coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+
+Index(
+    'ix_announcement_search_vector',
+    Announcement.search_vector,
+    postgresql_using='gin',
+)
+Index(
+    'ix_announcement_title_trgm',
+    Announcement.title,
+    postgresql_using='gin',
+    postgresql_ops={'title': 'gin_trgm_ops'},
+)
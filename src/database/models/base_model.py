@@ -15,11 +15,11 @@ class BaseModel:
 
 
 class IdPkUUIDMixin:
-    id: Mapped[str] = mapped_column(UUID, default=uuid7, primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(UUID, default=uuid7, primary_key=True)
 
 
 class IdPkIntegerMixin:
-    id: Mapped[int] = mapped_column(INTEGER, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(INTEGER, primary_key=True)
 
 
 class CreatedAtMixin:
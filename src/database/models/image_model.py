@@ -0,0 +1,14 @@
+from sqlalchemy.dialects.postgresql import BYTEA, INTEGER, SMALLINT
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..models.base_model import BaseModel, CreatedAtMixin
+
+
+class Image(BaseModel, CreatedAtMixin):
+    __tablename__ = 'image'
+
+    hash: Mapped[bytes] = mapped_column(BYTEA, primary_key=True)
+    size: Mapped[int] = mapped_column(INTEGER, nullable=False)
+    width: Mapped[int] = mapped_column(INTEGER, nullable=False)
+    height: Mapped[int] = mapped_column(INTEGER, nullable=False)
+    format: Mapped[int] = mapped_column(SMALLINT, nullable=False)
@@ -0,0 +1,24 @@
+import datetime
+import uuid
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID, VARCHAR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..models.base_model import BaseModel, CreatedAtMixin
+
+
+class RefreshToken(BaseModel, CreatedAtMixin):
+    __tablename__ = 'refresh_token'
+
+    token_hash: Mapped[str] = mapped_column(VARCHAR(64), primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey('user.id', ondelete='CASCADE'), nullable=False, index=True
+    )
+    family_id: Mapped[uuid.UUID] = mapped_column(UUID, nullable=False, index=True)
+    expires_at: Mapped[datetime.datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, index=True
+    )
+    rotated_at: Mapped[datetime.datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True, index=True
+    )
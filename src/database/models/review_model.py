@@ -1,7 +1,7 @@
 import uuid
 
-from sqlalchemy import ForeignKey
-from sqlalchemy.dialects.postgresql import TEXT
+from sqlalchemy import CheckConstraint, ForeignKey
+from sqlalchemy.dialects.postgresql import SMALLINT, TEXT
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..models.base_model import BaseModel, CreatedAtMixin, IdPkUUIDMixin
@@ -9,9 +9,15 @@ from ..models.base_model import BaseModel, CreatedAtMixin, IdPkUUIDMixin
 
 class Review(BaseModel, IdPkUUIDMixin, CreatedAtMixin):
     __tablename__ = 'review'
+    __table_args__ = (
+        CheckConstraint('score BETWEEN 1 AND 5', name='ck_review_score_range'),
+    )
 
     text: Mapped[str] = mapped_column(TEXT, nullable=True)
-    user_to_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('user.id'), nullable=False)
+    score: Mapped[int] = mapped_column(SMALLINT, nullable=True)
+    user_to_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey('user.id'), nullable=False, index=True
+    )
     user_from_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey('user.id'), nullable=False
     )
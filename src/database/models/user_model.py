@@ -1,10 +1,8 @@
-from typing import List
-
-from sqlalchemy import ForeignKey
-from sqlalchemy.dialects.postgresql import ARRAY, FLOAT, TEXT, VARCHAR
+from sqlalchemy import ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import FLOAT, INTEGER, TEXT, VARCHAR
 from sqlalchemy.orm import Mapped, mapped_column
 
-from ..models.base_model import BaseModel, IdPkUUIDMixin, MutableList
+from ..models.base_model import BaseModel, IdPkUUIDMixin
 
 
 class User(BaseModel, IdPkUUIDMixin):
@@ -17,9 +15,20 @@ class User(BaseModel, IdPkUUIDMixin):
         ForeignKey('role.id'), nullable=False, default=1
     )
     rating: Mapped[float] = mapped_column(FLOAT, nullable=True)
+    rating_sum: Mapped[int] = mapped_column(
+        INTEGER, nullable=False, default=0, server_default='0'
+    )
+    rating_count: Mapped[int] = mapped_column(
+        INTEGER, nullable=False, default=0, server_default='0'
+    )
     phone: Mapped[str] = mapped_column(VARCHAR(20), nullable=True)
     email: Mapped[str] = mapped_column(VARCHAR(50), nullable=False)
-    hashed_password: Mapped[str] = mapped_column(TEXT, nullable=False)
-    refresh_tokens: Mapped[List[str]] = mapped_column(
-        MutableList.as_mutable(ARRAY(TEXT)), nullable=False, default=[]
+    hashed_password: Mapped[str] = mapped_column(
+        TEXT, nullable=False, info={'cached': False}
     )
+    token_version: Mapped[int] = mapped_column(
+        INTEGER, nullable=False, default=0, server_default='0'
+    )
+
+
+Index('ix_user_email_lower', func.lower(User.email), unique=True)
@@ -0,0 +1,71 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.utils.metrics import POOL_CHECKOUT_WAIT
+
+
+class PoolStats:
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+    def __init__(self):
+        self.checkouts: int = 0
+        self.wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+        self.bucket_counts: list[int] = [0] * (len(self.BUCKETS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_time += seconds
+        self.max_wait_time = max(self.max_wait_time, seconds)
+        for index, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                self.bucket_counts[index] += 1
+                return
+        self.bucket_counts[-1] += 1
+
+    def snapshot(self, pool: QueuePool) -> dict:
+        return {
+            'size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': pool.overflow(),
+            'checkouts': self.checkouts,
+            'wait_time_total': self.wait_time,
+            'wait_time_max': self.max_wait_time,
+            'checkout_latency_buckets': {
+                **{
+                    str(bound): count
+                    for bound, count in zip(self.BUCKETS, self.bucket_counts)
+                },
+                '+Inf': self.bucket_counts[-1],
+            },
+        }
+
+
+class PoolMetrics:
+    _stats: dict[str, PoolStats] = {}
+    _pools: dict[str, QueuePool] = {}
+
+    @classmethod
+    def observe(cls, pool: QueuePool, seconds: float) -> None:
+        name = pool._orig_logging_name or 'default'
+        cls._pools[name] = pool
+        cls._stats.setdefault(name, PoolStats()).observe(seconds)
+        POOL_CHECKOUT_WAIT.labels(name).observe(seconds)
+
+    @classmethod
+    def snapshot(cls) -> dict[str, dict]:
+        return {
+            name: stats.snapshot(pool=cls._pools[name])
+            for name, stats in cls._stats.items()
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            PoolMetrics.observe(pool=self, seconds=time.perf_counter() - start)
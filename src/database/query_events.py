@@ -0,0 +1,31 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.utils.metrics import SQL_QUERIES, SQL_QUERY_DURATION, current_method_var
+from src.utils.query_counter import QueryCounter
+from src.utils.request_timing import RequestTiming
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info['query_start'] = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop('query_start', time.perf_counter())
+
+    method = current_method_var.get()
+    SQL_QUERY_DURATION.labels(method).observe(elapsed)
+    SQL_QUERIES.labels(method).inc()
+    QueryCounter.record_statement(statement=statement)
+
+    timing = RequestTiming.current()
+    if timing is not None:
+        timing.add(phase='db', seconds=elapsed)
+        timing.db_queries += 1
+
+
+def register_query_events(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine.sync_engine, 'after_cursor_execute', after_cursor_execute)
@@ -0,0 +1,84 @@
+import asyncio
+import itertools
+
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.logging import logger
+
+
+class ReplicaRouter:
+    def __init__(self, engines: list[AsyncEngine]):
+        self.engines: list[AsyncEngine] = engines
+        self.healthy: list[AsyncEngine] = list(engines)
+        self._counter = itertools.count()
+        self._task: asyncio.Task | None = None
+
+    def choose(self) -> AsyncEngine | None:
+        healthy = self.healthy
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    async def check_health(self) -> None:
+        healthy = []
+        for engine in self.engines:
+            try:
+                async with asyncio.timeout(
+                    settings.POSTGRES_REPLICA_HEALTH_CHECK_TIMEOUT
+                ):
+                    async with engine.connect() as connection:
+                        await connection.execute(text('SELECT 1'))
+                healthy.append(engine)
+            except Exception:
+                logger.warning(
+                    'Replica %s is unhealthy',
+                    engine.url.render_as_string(hide_password=True),
+                )
+        self.healthy = healthy
+
+    def start(self) -> None:
+        if self.engines and not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.check_health()
+            await asyncio.sleep(settings.POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL)
+
+
+class RoutingSession(Session):
+    primary: AsyncEngine
+    replica_router: ReplicaRouter
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        if not self._is_read(clause=clause):
+            self.info['wrote'] = True
+        elif (
+            not self.info.get('wrote')
+            and not self.info.get('use_primary')
+            and not clause.get_execution_options().get('use_primary', False)
+        ):
+            replica = self.info.get('replica') or self.replica_router.choose()
+            if replica:
+                self.info['replica'] = replica
+                return replica.sync_engine
+        return self.primary.sync_engine
+
+    def _is_read(self, clause) -> bool:
+        return (
+            isinstance(clause, Select)
+            and not self._flushing
+            and clause._for_update_arg is None
+        )
@@ -1,67 +1,111 @@
-from datetime import datetime
-
-from fastapi import Request, Response
-from jwt.exceptions import ExpiredSignatureError, InvalidKeyError
+from fastapi import Depends, Request, Response
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.database import session_maker
+from src.config import settings
+from src.database.database import get_async_session, session_maker
+from src.database.models.refresh_token_model import RefreshToken
 from src.database.models.user_model import User
 from src.exceptions import (
+    AccessDeniedException,
     GetTokenException,
+    RefreshTokenReusedException,
     TokenExpiredException,
     UnauthorizedException,
 )
 from src.logging import logger
-from src.utils.token_manager import TokenManager
+from src.services.refresh_token_service import get_refresh_token_service
+from src.utils.metrics import TOKEN_REFRESHES
+from src.utils.principal import Principal
+from src.utils.token_manager import TokenManager, TokenRevokedError
+
 
+async def get_current_principal(
+    response: Response,
+    request: Request,
+    session: AsyncSession = Depends(get_async_session),
+) -> Principal:
+    try:
+        if not request.cookies.get('stuffr_access', None):
+            raise UnauthorizedException
 
-async def get_current_user(response: Response, request: Request) -> User | None:
-    session: AsyncSession
-    async with session_maker() as session:
         try:
-            if not request.cookies.get('stuffr_access', None):
-                raise UnauthorizedException
             payload = TokenManager.decode_token(token=request.cookies['stuffr_access'])
+        except ExpiredSignatureError:
+            return await refresh_principal(request=request, session=session)
 
-            user: User | None = await session.get(User, payload['sub'])
-            if datetime.fromtimestamp(payload['exp']) < datetime.now():
-                payload = TokenManager.decode_token(
-                    token=request.cookies['stuffr_refresh']
-                )
-                if datetime.fromtimestamp(payload['exp']) < datetime.now():
-                    raise ExpiredSignatureError
-                user.refresh_tokens.remove(['stuffr_refresh'])
+        return Principal.from_payload(payload=payload, session=session)
+    except ExpiredSignatureError:
+        logger.error('Token expired error')
+        response.delete_cookie('stuffr_access')
+        response.delete_cookie('stuffr_refresh')
+        raise TokenExpiredException
+    except TokenRevokedError:
+        logger.error('Revoked token error')
+        response.delete_cookie('stuffr_access')
+        response.delete_cookie('stuffr_refresh')
+        raise UnauthorizedException
+    except InvalidTokenError:
+        logger.error('Invalid token error')
+        response.delete_cookie('stuffr_access')
+        response.delete_cookie('stuffr_refresh')
+        raise GetTokenException
 
-                access_token, refresh_token = TokenManager.get_tokens(
-                    {
-                        'sub': str(user.id),
-                    }
-                )
 
-                response.set_cookie(
-                    key='stuffr_access',
-                    value=access_token,
-                    secure=True,
-                    httponly=True,
-                    samesite='strict',
-                )
-                response.set_cookie(
-                    key='stuffr_refresh',
-                    value=refresh_token,
-                    secure=True,
-                    httponly=True,
-                    samesite='strict',
+async def refresh_principal(request: Request, session: AsyncSession) -> Principal:
+    old_refresh_token = request.cookies.get('stuffr_refresh', None)
+    if not old_refresh_token:
+        raise ExpiredSignatureError
+
+    payload = TokenManager.decode_token(token=old_refresh_token)
+    refresh_token_service = get_refresh_token_service()
+    async with session_maker(info={'use_primary': True}) as refresh_session:
+        stored_token: RefreshToken | None = await refresh_token_service.rotate(
+            token=old_refresh_token, session=refresh_session
+        )
+        rotated_concurrently = False
+        if not stored_token:
+            stored_token = await refresh_token_service.get_recently_rotated(
+                token=old_refresh_token, session=refresh_session
+            )
+            rotated_concurrently = True
+        if not stored_token:
+            if payload.get('fam', None):
+                await refresh_token_service.revoke_family(
+                    family_id=payload['fam'], session=refresh_session
                 )
-                user.refresh_tokens.append(refresh_token)
+                await refresh_session.commit()
+            TOKEN_REFRESHES.labels('reused').inc()
+            raise RefreshTokenReusedException
 
-            return user
-        except ExpiredSignatureError:
-            logger.error('Token expired error')
-            response.delete_cookie('stuffr_access')
-            response.delete_cookie('stuffr_refresh')
-            raise TokenExpiredException
-        except InvalidKeyError:
-            logger.error('Invalid token error')
-            response.delete_cookie('stuffr_access')
-            response.delete_cookie('stuffr_refresh')
-            raise GetTokenException
+        user: User | None = await refresh_session.get(User, stored_token.user_id)
+        if not user or payload.get('ver', 0) != user.token_version:
+            TOKEN_REFRESHES.labels('invalid').inc()
+            raise InvalidTokenError
+
+        if rotated_concurrently:
+            TOKEN_REFRESHES.labels('concurrent').inc()
+        else:
+            request.state.refreshed_tokens = await refresh_token_service.issue_tokens(
+                user=user, session=refresh_session, family_id=stored_token.family_id
+            )
+            await refresh_session.commit()
+            TOKEN_REFRESHES.labels('success').inc()
+
+    return Principal.from_payload(
+        payload=TokenManager.get_claims(user), session=session, user=user
+    )
+
+
+async def get_admin_principal(
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
+    if principal.role_id not in settings.ADMIN_ROLE_IDS:
+        raise AccessDeniedException
+    return principal
+
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+) -> User | None:
+    return await principal.get_user()
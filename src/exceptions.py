@@ -21,11 +21,26 @@ class BadRequestException(HTTPException):
         super().__init__(status_code=status_code if status_code else 402, detail=detail)
 
 
+class ForbiddenException(HTTPException):
+    def __init__(self, status_code: int = None, detail='Forbidden'):
+        super().__init__(status_code=status_code if status_code else 403, detail=detail)
+
+
+class PayloadTooLargeException(HTTPException):
+    def __init__(self, status_code: int = None, detail='Payload too large'):
+        super().__init__(status_code=status_code if status_code else 413, detail=detail)
+
+
 class NotFoundException(HTTPException):
     def __init__(self, status_code: int = None, detail='Not found'):
         super().__init__(status_code=status_code if status_code else 404, detail=detail)
 
 
+class ServiceUnavailableException(HTTPException):
+    def __init__(self, status_code: int = None, detail='Service unavailable'):
+        super().__init__(status_code=status_code if status_code else 503, detail=detail)
+
+
 class TokenExpiredException(InvalidHTTPException):
     def __init__(self, detail='Время действия токена истекло'):
         super().__init__(detail=detail)
@@ -36,6 +51,11 @@ class GetTokenException(InvalidHTTPException):
         super().__init__(detail=detail)
 
 
+class RefreshTokenReusedException(UnauthorizedException):
+    def __init__(self, detail='Токен обновления уже использован'):
+        super().__init__(detail=detail)
+
+
 class UserAlreadyExistsException(ConflictException):
     def __init__(self, detail='Пользователь с таким email уже существует'):
         super().__init__(detail=detail)
@@ -49,3 +69,58 @@ class UserDoesNotExistsException(NotFoundException):
 class InvalidCredentialsException(BadRequestException):
     def __init__(self, detail='Неправильная почта или пароль'):
         super().__init__(detail=detail)
+
+
+class CategoryDoesNotExistsException(BadRequestException):
+    def __init__(self, detail='Категории с таким id не существует'):
+        super().__init__(detail=detail)
+
+
+class RoleDoesNotExistsException(BadRequestException):
+    def __init__(self, detail='Роли с таким id не существует'):
+        super().__init__(detail=detail)
+
+
+class AccessDeniedException(ForbiddenException):
+    def __init__(self, detail='Недостаточно прав'):
+        super().__init__(detail=detail)
+
+
+class AnnouncementDoesNotExistsException(NotFoundException):
+    def __init__(self, detail='Объявления с таким id не существует'):
+        super().__init__(detail=detail)
+
+
+class AnnouncementAccessDeniedException(ForbiddenException):
+    def __init__(self, detail='Нет доступа к объявлению'):
+        super().__init__(detail=detail)
+
+
+class InvalidImageException(BadRequestException):
+    def __init__(self, detail='Файл не является изображением'):
+        super().__init__(detail=detail)
+
+
+class ImageTooLargeException(PayloadTooLargeException):
+    def __init__(self, detail='Изображение слишком большое'):
+        super().__init__(detail=detail)
+
+
+class ImageLimitExceededException(ConflictException):
+    def __init__(self, detail='Достигнут лимит изображений объявления'):
+        super().__init__(detail=detail)
+
+
+class ImageProcessorBusyException(ServiceUnavailableException):
+    def __init__(self, detail='Сервер перегружен, попробуйте позже'):
+        super().__init__(detail=detail)
+
+
+class InvalidCursorException(BadRequestException):
+    def __init__(self, detail='Некорректный курсор пагинации'):
+        super().__init__(detail=detail)
+
+
+class PasswordHasherBusyException(ServiceUnavailableException):
+    def __init__(self, detail='Сервер перегружен, попробуйте позже'):
+        super().__init__(detail=detail)
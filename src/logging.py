@@ -1,4 +1,14 @@
+import atexit
+import copy
+import json
 import logging
+import queue
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+
+from src.config import settings
+
+request_id_var: ContextVar[str | None] = ContextVar('request_id', default=None)
 
 
 class CustomFormatter(logging.Formatter):
@@ -9,18 +19,62 @@ class CustomFormatter(logging.Formatter):
     reset = '\x1b[0m'
     format = '%(asctime)s - %(filename)s:%(lineno)d - %(message)s'
 
-    FORMATS = {
-        logging.DEBUG: grey + format + reset,
-        logging.INFO: grey + format + reset,
-        logging.WARNING: yellow + format + reset,
-        logging.ERROR: red + format + reset,
-        logging.CRITICAL: bold_red + format + reset,
+    FORMATTERS = {
+        logging.DEBUG: logging.Formatter(grey + format + reset),
+        logging.INFO: logging.Formatter(grey + format + reset),
+        logging.WARNING: logging.Formatter(yellow + format + reset),
+        logging.ERROR: logging.Formatter(red + format + reset),
+        logging.CRITICAL: logging.Formatter(bold_red + format + reset),
     }
 
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+        return self.FORMATTERS.get(
+            record.levelno, self.FORMATTERS[logging.INFO]
+        ).format(record)
+
+
+class JsonFormatter(logging.Formatter):
+    RECORD_ATTRIBUTES = set(
+        logging.LogRecord('', 0, '', 0, '', None, None).__dict__
+    ) | {'message', 'asctime', 'request_id'}
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'location': f'{record.filename}:{record.lineno}',
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', None),
+        }
+        entry.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in self.RECORD_ATTRIBUTES
+        )
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class StructuredQueueHandler(QueueHandler):
+    exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self.exception_formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
 
 
 logging.basicConfig(
@@ -28,7 +82,16 @@ logging.basicConfig(
 )
 ch = logging.StreamHandler()
 ch.setLevel(logging.DEBUG)
-ch.setFormatter(CustomFormatter())
+ch.setFormatter(JsonFormatter() if settings.LOG_FORMAT == 'json' else CustomFormatter())
+
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+queue_handler = StructuredQueueHandler(log_queue)
+queue_handler.addFilter(RequestIdFilter())
+listener = QueueListener(log_queue, ch, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+
 logger = logging.getLogger(__name__)
-logger.setLevel(level=logging.DEBUG)
-logger.addHandler(ch)
+logger.setLevel(level=settings.LOG_LEVEL)
+logger.addHandler(queue_handler)
+logger.propagate = False
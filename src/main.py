@@ -1,18 +1,59 @@
 from fastapi import FastAPI
 from fastapi.concurrency import asynccontextmanager
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.staticfiles import StaticFiles
 
-from src.middlewares.logging_middleware import logging_middleware
+from src.config import settings
+from src.database.database import replica_router
+from src.middlewares.logging_middleware import LoggingMiddleware
+from src.middlewares.query_counter_middleware import QueryCounterMiddleware
+from src.middlewares.refresh_cookie_middleware import RefreshCookieMiddleware
+from src.routers.announcement_router import announcement_router
+from src.routers.category_router import category_router
+from src.routers.export_router import export_router
+from src.routers.metrics_router import metrics_router
 from src.routers.user_router import user_router
+from src.services.reference_data_service import ReferenceDataService
+from src.utils.image_processor import ImageProcessor
+from src.utils.metrics import Metrics
+from src.utils.password_manager import PasswordManager
+from src.utils.rating_reconciler import RatingReconciler
+from src.utils.token_sweeper import TokenSweeper
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
+    replica_router.start()
+    await ReferenceDataService.start()
+    TokenSweeper.start()
+    RatingReconciler.start()
     yield
+    await RatingReconciler.stop()
+    await TokenSweeper.stop()
+    await ReferenceDataService.stop()
+    await replica_router.stop()
+    PasswordManager.shutdown()
+    ImageProcessor.shutdown()
+    Metrics.shutdown()
 
 
-app = FastAPI(title='Stuffr 🐶', lifespan=lifespan)
+app = FastAPI(
+    title='Stuffr 🐶', lifespan=lifespan, default_response_class=ORJSONResponse
+)
 
-app.add_middleware(BaseHTTPMiddleware, dispatch=logging_middleware)
+app.add_middleware(RefreshCookieMiddleware)
+if settings.QUERY_COUNTER_ENABLED:
+    app.add_middleware(QueryCounterMiddleware)
+app.add_middleware(LoggingMiddleware)
+
+app.mount(
+    settings.IMAGE_MEDIA_URL,
+    StaticFiles(directory=settings.IMAGE_STORAGE_PATH, check_dir=False),
+    name='media',
+)
 
 app.include_router(user_router)
+app.include_router(announcement_router)
+app.include_router(category_router)
+app.include_router(export_router)
+app.include_router(metrics_router)
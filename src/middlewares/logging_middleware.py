@@ -1,12 +1,63 @@
-from fastapi import Request
+import time
 
-from src.logging import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from uuid_extensions import uuid7
+
+from src.config import settings
+from src.logging import logger, request_id_var
+from src.utils.request_timing import RequestTiming, request_timing_var
 
 
 class LoggingMiddleware:
-    async def __call__(self, request: Request, call_next):
-        logger.info(f'Call {request.url}')
-        return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        request_id = self._get_request_id(scope=scope)
+        token = request_id_var.set(request_id)
+        timing = RequestTiming() if settings.SERVER_TIMING_ENABLED else None
+        timing_token = request_timing_var.set(timing)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                message['headers'] = [
+                    *message.get('headers', []),
+                    (b'x-request-id', request_id.encode()),
+                ]
+                if timing is not None:
+                    message['headers'].append(
+                        (b'server-timing', timing.server_timing_header().encode())
+                    )
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            logger.info(
+                'Call %s %s',
+                scope['method'],
+                scope['path'],
+                extra={
+                    'method': scope['method'],
+                    'path': scope['path'],
+                    'status_code': status_code,
+                    'duration_ms': round((time.perf_counter() - start) * 1000, 3),
+                    **({'timing': timing.as_dict()} if timing is not None else {}),
+                },
+            )
+            request_timing_var.reset(timing_token)
+            request_id_var.reset(token)
 
-logging_middleware = LoggingMiddleware()
+    @staticmethod
+    def _get_request_id(scope: Scope) -> str:
+        for name, value in scope['headers']:
+            if name == b'x-request-id':
+                return value.decode('latin-1')[:64]
+        return str(uuid7())
@@ -0,0 +1,38 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import settings
+from src.logging import logger
+from src.utils.query_counter import QueryCounter
+
+
+class QueryCounterMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        with QueryCounter() as counter:
+            await self.app(scope, receive, send)
+
+        if settings.QUERY_MAX_PER_REQUEST and (
+            counter.count > settings.QUERY_MAX_PER_REQUEST
+        ):
+            logger.warning(
+                'Request %s %s issued %s queries, budget is %s',
+                scope['method'],
+                scope['path'],
+                counter.count,
+                settings.QUERY_MAX_PER_REQUEST,
+            )
+        for statement, count in counter.repeated(
+            threshold=settings.QUERY_REPEAT_WARNING_THRESHOLD
+        ).items():
+            logger.warning(
+                'Possible N+1: statement executed %s times in %s %s: %s',
+                count,
+                scope['method'],
+                scope['path'],
+                statement,
+            )
@@ -0,0 +1,43 @@
+from fastapi import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.token_manager import TokenManager
+
+
+class RefreshCookieMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        async def send_wrapper(message: Message):
+            tokens = scope.get('state', {}).get('refreshed_tokens', None)
+            if message['type'] == 'http.response.start' and tokens is not None:
+                message['headers'] = [
+                    *message.get('headers', []),
+                    *self._get_cookie_headers(
+                        tokens=tokens, headers=message.get('headers', [])
+                    ),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _get_cookie_headers(
+        tokens: tuple[str, str], headers: list[tuple[bytes, bytes]]
+    ) -> list[tuple[bytes, bytes]]:
+        set_names = {
+            value.split(b'=', 1)[0] for name, value in headers if name == b'set-cookie'
+        }
+        cookies = Response()
+        TokenManager.set_cookies(
+            response=cookies, access_token=tokens[0], refresh_token=tokens[1]
+        )
+        return [
+            (name, value)
+            for name, value in cookies.raw_headers
+            if name == b'set-cookie' and value.split(b'=', 1)[0] not in set_names
+        ]
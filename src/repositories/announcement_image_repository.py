@@ -0,0 +1,50 @@
+import uuid
+
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.announcement_image_model import AnnouncementImage
+from src.repositories.base_repository import BaseRepository
+from src.utils.decorators import trace_decorator
+
+
+class AnnouncementImageRepository(BaseRepository):
+    def __init__(self, model):
+        super().__init__(model=model)
+
+    @trace_decorator
+    async def count_images(
+        self, announcement_id: uuid.UUID, session: AsyncSession
+    ) -> int:
+        result = await session.execute(
+            select(func.count()).where(self.model.announcement_id == announcement_id)
+        )
+        return result.scalar_one()
+
+    @trace_decorator
+    async def add_image(
+        self,
+        announcement_id: uuid.UUID,
+        image_hash: bytes,
+        max_images: int,
+        session: AsyncSession,
+    ) -> AnnouncementImage | None:
+        return await self._execute_scalar_one_or_none(
+            query=insert(self.model)
+            .from_select(
+                ['announcement_id', 'position', 'image_hash'],
+                select(
+                    literal(announcement_id, self.model.announcement_id.type),
+                    func.coalesce(func.max(self.model.position) + 1, 0),
+                    literal(image_hash, self.model.image_hash.type),
+                )
+                .where(self.model.announcement_id == announcement_id)
+                .having(func.count() < max_images),
+            )
+            .returning(self.model),
+            session=session,
+        )
+
+
+def get_announcement_image_repository() -> AnnouncementImageRepository:
+    return AnnouncementImageRepository(model=AnnouncementImage)
@@ -0,0 +1,80 @@
+from sqlalchemy import REAL, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database.models.announcement_model import SEARCH_CONFIG, Announcement
+from src.repositories.base_repository import BaseRepository
+from src.schemas.announcement_schemas import SearchAnnouncementsScheme
+from src.schemas.base_schemas import PageScheme
+from src.utils.decorators import trace_decorator
+from src.utils.pagination import decode_rank_cursor, encode_rank_cursor
+
+
+class AnnouncementRepository(BaseRepository):
+    def __init__(self, model):
+        super().__init__(model=model)
+
+    @trace_decorator
+    async def search(
+        self,
+        search: SearchAnnouncementsScheme,
+        session: AsyncSession,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageScheme:
+        limit = min(
+            max(limit or settings.PAGE_DEFAULT_LIMIT, 1), settings.PAGE_MAX_LIMIT
+        )
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, search.query)
+        rank = (
+            func.ts_rank_cd(self.model.search_vector, ts_query, 32, type_=REAL)
+            + func.similarity(self.model.title, search.query, type_=REAL)
+        ).label('rank')
+
+        query = select(self.model, rank).where(
+            or_(
+                self.model.search_vector.op('@@')(ts_query),
+                self.model.title.op('%')(search.query),
+            )
+        )
+        if search.status is not None:
+            query = query.where(self.model.status == search.status.value)
+        if search.category_id is not None:
+            query = query.where(self.model.category_id == search.category_id)
+        if search.min_price is not None:
+            query = query.where(self.model.price >= search.min_price)
+        if search.max_price is not None:
+            query = query.where(self.model.price <= search.max_price)
+
+        if cursor:
+            last_rank, last_id = decode_rank_cursor(cursor)
+            query = query.where(
+                tuple_(rank, self.model.id)
+                < tuple_(literal(last_rank, REAL), literal(last_id, self.model.id.type))
+            )
+
+        result = await session.execute(
+            query.order_by(rank.desc(), self.model.id.desc()).limit(limit + 1)
+        )
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_rank_cursor(rows[-1].rank, rows[-1][0].id)
+        return PageScheme(items=[row[0] for row in rows], next_cursor=next_cursor)
+
+    @trace_decorator
+    async def get_for_update(
+        self, entity_id: str, session: AsyncSession
+    ) -> Announcement | None:
+        return await self._execute_scalar_one_or_none(
+            query=select(self.model)
+            .where(self.model.id == entity_id)
+            .with_for_update(),
+            session=session,
+        )
+
+
+def get_announcement_repository() -> AnnouncementRepository:
+    return AnnouncementRepository(model=Announcement)
@@ -1,18 +1,24 @@
 from abc import ABC
+from enum import Enum
+from typing import AsyncIterator, Sequence
 
 import pydantic
 from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.database.models.base_model import BaseModel
-from src.utils.decorators import logger_decorator
+from src.schemas.base_schemas import PageScheme
+from src.utils.decorators import trace_decorator
+from src.utils.pagination import decode_cursor, encode_cursor
 
 
 class BaseRepository(ABC):
     def __init__(self, model: BaseModel):
         self.model: BaseModel = model
 
-    @logger_decorator
+    @trace_decorator
     async def add(self, entity: pydantic.BaseModel, session: AsyncSession):
         return await self._execute_scalar_one_or_none(
             query=insert(self.model)
@@ -21,21 +27,135 @@ class BaseRepository(ABC):
             session=session,
         )
 
-    @logger_decorator
+    @trace_decorator
+    async def create_if_absent(
+        self,
+        entity: pydantic.BaseModel,
+        session: AsyncSession,
+        conflict_elements: Sequence | None = None,
+    ) -> BaseModel | None:
+        return await self._execute_scalar_one_or_none(
+            query=pg_insert(self.model)
+            .values(**entity.model_dump())
+            .on_conflict_do_nothing(index_elements=conflict_elements)
+            .returning(self.model),
+            session=session,
+        )
+
+    @trace_decorator
+    async def add_many(
+        self,
+        entities: Sequence[pydantic.BaseModel],
+        session: AsyncSession,
+        returning: bool = False,
+    ) -> Sequence[BaseModel] | None:
+        rows = [entity.model_dump() for entity in entities]
+        if not returning and len(rows) >= settings.BULK_COPY_THRESHOLD:
+            return await self._copy_records(rows=rows, session=session)
+        return await self._execute_many(
+            query=insert(self.model), rows=rows, session=session, returning=returning
+        )
+
+    @trace_decorator
+    async def upsert_many(
+        self,
+        entities: Sequence[pydantic.BaseModel],
+        session: AsyncSession,
+        conflict_elements: Sequence,
+        update_columns: Sequence[str] | None = None,
+        returning: bool = False,
+    ) -> Sequence[BaseModel] | None:
+        rows = [entity.model_dump() for entity in entities]
+        if update_columns is None:
+            conflict_columns = {
+                element if isinstance(element, str) else getattr(element, 'key', None)
+                for element in conflict_elements
+            }
+            update_columns = (
+                [column for column in rows[0] if column not in conflict_columns]
+                if rows
+                else []
+            )
+
+        query = pg_insert(self.model)
+        if update_columns:
+            query = query.on_conflict_do_update(
+                index_elements=conflict_elements,
+                set_={column: query.excluded[column] for column in update_columns},
+            )
+        else:
+            query = query.on_conflict_do_nothing(index_elements=conflict_elements)
+
+        return await self._execute_many(
+            query=query, rows=rows, session=session, returning=returning
+        )
+
+    @trace_decorator
     async def get_one(
-        self, entity_id: int | str, session: AsyncSession
+        self, entity_id: int | str, session: AsyncSession, use_primary: bool = False
     ) -> BaseModel | None:
         return await self._execute_scalar_one_or_none(
-            query=select(self.model).where(self.model.id == entity_id), session=session
+            query=select(self.model)
+            .where(self.model.id == entity_id)
+            .execution_options(use_primary=use_primary),
+            session=session,
         )
 
-    @logger_decorator
+    @trace_decorator
     async def get_all(self, session: AsyncSession):
         return await self._execute_scalars_all(
             query=select(self.model), session=session
         )
 
-    @logger_decorator
+    @trace_decorator
+    async def get_page(
+        self,
+        session: AsyncSession,
+        limit: int | None = None,
+        cursor: str | None = None,
+        filters: dict | None = None,
+        descending: bool = True,
+    ) -> PageScheme:
+        limit = min(
+            max(limit or settings.PAGE_DEFAULT_LIMIT, 1), settings.PAGE_MAX_LIMIT
+        )
+        query = select(self.model).filter_by(**(filters or {}))
+
+        if cursor:
+            last_id = decode_cursor(cursor)
+            query = query.where(
+                self.model.id < last_id if descending else self.model.id > last_id
+            )
+
+        items = await self._execute_scalars_all(
+            query=query.order_by(
+                self.model.id.desc() if descending else self.model.id.asc()
+            ).limit(limit + 1),
+            session=session,
+        )
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1].id)
+        return PageScheme(items=items, next_cursor=next_cursor)
+
+    @trace_decorator
+    def stream_all(
+        self,
+        session: AsyncSession,
+        fetch_size: int | None = None,
+        filters: dict | None = None,
+    ) -> AsyncIterator[BaseModel]:
+        return self._stream_scalars(
+            query=select(self.model)
+            .filter_by(**(filters or {}))
+            .order_by(self.model.id),
+            session=session,
+            fetch_size=fetch_size or settings.EXPORT_FETCH_SIZE,
+        )
+
+    @trace_decorator
     async def update(
         self, entity_id: int | str, entity: pydantic.BaseModel, session: AsyncSession
     ):
@@ -47,7 +167,7 @@ class BaseRepository(ABC):
             session=session,
         )
 
-    @logger_decorator
+    @trace_decorator
     async def delete(self, entity_id: int | str, session: AsyncSession):
         await self._execute_without_result(
             query=delete(self.model).where(self.model.id == entity_id), session=session
@@ -64,6 +184,63 @@ class BaseRepository(ABC):
         result = await session.execute(query)
         return result.scalars().all()
 
+    async def _execute_many(
+        self, query, rows: list[dict], session: AsyncSession, returning: bool
+    ) -> Sequence[BaseModel] | None:
+        result = []
+        for start in range(0, len(rows), settings.BULK_BATCH_SIZE):
+            batch = rows[start : start + settings.BULK_BATCH_SIZE]
+            if returning:
+                scalars = await session.scalars(query.returning(self.model), batch)
+                result.extend(scalars.all())
+            else:
+                await session.execute(query, batch)
+        return result if returning else None
+
+    async def _copy_records(self, rows: list[dict], session: AsyncSession) -> None:
+        table = self.model.__table__
+        defaults = {
+            column.key: column.default
+            for column in table.columns
+            if column.default is not None and column.key not in rows[0]
+        }
+        columns = list(rows[0]) + list(defaults)
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            schema_name=table.schema,
+            columns=columns,
+            records=(
+                tuple(self._copy_value(row[column]) for column in rows[0])
+                + tuple(
+                    self._copy_value(
+                        default.arg(None) if default.is_callable else default.arg
+                    )
+                    for default in defaults.values()
+                )
+                for row in rows
+            ),
+        )
+
+    @staticmethod
+    def _copy_value(value):
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, pydantic.AnyUrl):
+            return str(value)
+        return value
+
+    async def _stream_scalars(
+        self, query, session: AsyncSession, fetch_size: int
+    ) -> AsyncIterator[BaseModel]:
+        result = await session.stream_scalars(
+            query.execution_options(yield_per=fetch_size)
+        )
+        async for row in result:
+            yield row
+
     async def _execute_without_result(self, query, session: AsyncSession):
         await session.execute(query)
 
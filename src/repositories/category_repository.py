@@ -0,0 +1,11 @@
+from src.database.models.category_model import Category
+from src.repositories.base_repository import BaseRepository
+
+
+class CategoryRepository(BaseRepository):
+    def __init__(self, model):
+        super().__init__(model=model)
+
+
+def get_category_repository() -> CategoryRepository:
+    return CategoryRepository(model=Category)
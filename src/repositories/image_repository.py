@@ -0,0 +1,24 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.image_model import Image
+from src.repositories.base_repository import BaseRepository
+from src.utils.decorators import trace_decorator
+
+
+class ImageRepository(BaseRepository):
+    def __init__(self, model):
+        super().__init__(model=model)
+
+    @trace_decorator
+    async def get_by_hash(
+        self, image_hash: bytes, session: AsyncSession
+    ) -> Image | None:
+        return await self._execute_scalar_one_or_none(
+            query=select(self.model).where(self.model.hash == image_hash),
+            session=session,
+        )
+
+
+def get_image_repository() -> ImageRepository:
+    return ImageRepository(model=Image)
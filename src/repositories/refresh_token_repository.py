@@ -0,0 +1,115 @@
+import datetime
+
+import pydantic
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.refresh_token_model import RefreshToken
+from src.repositories.base_repository import BaseRepository
+from src.utils.decorators import trace_decorator
+
+
+class RefreshTokenRepository(BaseRepository):
+    def __init__(self, model):
+        super().__init__(model=model)
+
+    @trace_decorator
+    async def add_token(self, entity: pydantic.BaseModel, session: AsyncSession):
+        await self._execute_without_result(
+            query=insert(self.model).values(**entity.model_dump()), session=session
+        )
+
+    @trace_decorator
+    async def trim_user_tokens(self, user_id: str, keep: int, session: AsyncSession):
+        await self._execute_without_result(
+            query=delete(self.model).where(
+                self.model.token_hash.in_(
+                    select(self.model.token_hash)
+                    .where(
+                        self.model.user_id == user_id, self.model.rotated_at.is_(None)
+                    )
+                    .order_by(self.model.expires_at.desc())
+                    .offset(keep)
+                )
+            ),
+            session=session,
+        )
+
+    @trace_decorator
+    async def get_by_hash(
+        self, token_hash: str, session: AsyncSession
+    ) -> RefreshToken | None:
+        return await session.get(self.model, token_hash)
+
+    @trace_decorator
+    async def rotate_by_hash(
+        self, token_hash: str, session: AsyncSession
+    ) -> RefreshToken | None:
+        return await self._execute_scalar_one_or_none(
+            query=update(self.model)
+            .where(self.model.token_hash == token_hash, self.model.rotated_at.is_(None))
+            .values(rotated_at=func.now())
+            .returning(self.model),
+            session=session,
+        )
+
+    @trace_decorator
+    async def get_rotated_since(
+        self, token_hash: str, grace: datetime.timedelta, session: AsyncSession
+    ) -> RefreshToken | None:
+        return await self._execute_scalar_one_or_none(
+            query=select(self.model).where(
+                self.model.token_hash == token_hash,
+                self.model.rotated_at >= func.now() - grace,
+            ),
+            session=session,
+        )
+
+    @trace_decorator
+    async def delete_by_hash(
+        self, token_hash: str, session: AsyncSession
+    ) -> RefreshToken | None:
+        return await self._execute_scalar_one_or_none(
+            query=delete(self.model)
+            .where(self.model.token_hash == token_hash)
+            .returning(self.model),
+            session=session,
+        )
+
+    @trace_decorator
+    async def delete_family(self, family_id: str, session: AsyncSession):
+        await self._execute_without_result(
+            query=delete(self.model).where(self.model.family_id == family_id),
+            session=session,
+        )
+
+    @trace_decorator
+    async def delete_by_user(self, user_id: str, session: AsyncSession):
+        await self._execute_without_result(
+            query=delete(self.model).where(self.model.user_id == user_id),
+            session=session,
+        )
+
+    @trace_decorator
+    async def delete_expired(
+        self, batch_size: int, grace: datetime.timedelta, session: AsyncSession
+    ) -> int:
+        result = await session.execute(
+            delete(self.model).where(
+                self.model.token_hash.in_(
+                    select(self.model.token_hash)
+                    .where(
+                        or_(
+                            self.model.expires_at < func.now(),
+                            self.model.rotated_at < func.now() - grace,
+                        )
+                    )
+                    .limit(batch_size)
+                )
+            )
+        )
+        return result.rowcount
+
+
+def get_refresh_token_repository() -> RefreshTokenRepository:
+    return RefreshTokenRepository(model=RefreshToken)
@@ -0,0 +1,26 @@
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.review_model import Review
+from src.repositories.base_repository import BaseRepository
+from src.utils.decorators import trace_decorator
+
+
+class ReviewRepository(BaseRepository):
+    def __init__(self, model):
+        super().__init__(model=model)
+
+    @trace_decorator
+    async def delete(
+        self, entity_id: int | str, session: AsyncSession
+    ) -> Review | None:
+        return await self._execute_scalar_one_or_none(
+            query=delete(self.model)
+            .where(self.model.id == entity_id)
+            .returning(self.model),
+            session=session,
+        )
+
+
+def get_review_repository() -> ReviewRepository:
+    return ReviewRepository(model=Review)
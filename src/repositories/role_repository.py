@@ -0,0 +1,11 @@
+from src.database.models.role_model import Role
+from src.repositories.base_repository import BaseRepository
+
+
+class RoleRepository(BaseRepository):
+    def __init__(self, model):
+        super().__init__(model=model)
+
+
+def get_role_repository() -> RoleRepository:
+    return RoleRepository(model=Role)
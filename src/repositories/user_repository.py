@@ -1,21 +1,114 @@
+from typing import Sequence
+
+import pydantic
 from pydantic import EmailStr
-from sqlalchemy import select
+from sqlalchemy import Float, cast, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.models.review_model import Review
 from src.database.models.user_model import User
 from src.repositories.base_repository import BaseRepository
-from src.utils.decorators import logger_decorator
+from src.utils.decorators import trace_decorator
 
 
 class UserRepository(BaseRepository):
     def __init__(self, model):
         super().__init__(model=model)
 
-    @logger_decorator
+    @trace_decorator
+    async def create_if_absent(
+        self,
+        entity: pydantic.BaseModel,
+        session: AsyncSession,
+        conflict_elements: Sequence | None = None,
+    ) -> User | None:
+        return await super().create_if_absent(
+            entity=entity,
+            session=session,
+            conflict_elements=conflict_elements or [func.lower(self.model.email)],
+        )
+
+    @trace_decorator
     async def get_by_email(self, email: EmailStr, session: AsyncSession) -> User | None:
         return await self._execute_scalar_one_or_none(
-            query=select(self.model).where(self.model.email == email), session=session
+            query=select(self.model).where(
+                func.lower(self.model.email) == email.lower()
+            ),
+            session=session,
+        )
+
+    @trace_decorator
+    async def apply_rating(
+        self,
+        user_id: str,
+        score_delta: int,
+        count_delta: int,
+        session: AsyncSession,
+    ) -> None:
+        rating_sum = self.model.rating_sum + score_delta
+        rating_count = self.model.rating_count + count_delta
+        await self._execute_without_result(
+            query=update(self.model)
+            .where(self.model.id == user_id)
+            .values(
+                rating_sum=rating_sum,
+                rating_count=rating_count,
+                rating=cast(rating_sum, Float)
+                / cast(func.nullif(rating_count, 0), Float),
+            ),
+            session=session,
+        )
+
+    @trace_decorator
+    async def reset_ratings(self, session: AsyncSession) -> None:
+        await self._execute_without_result(
+            query=update(self.model)
+            .where(self.model.rating_count != 0)
+            .values(rating_sum=0, rating_count=0, rating=None),
+            session=session,
+        )
+
+    @trace_decorator
+    async def reconcile_ratings(
+        self, session: AsyncSession, after_id: str | None, batch_size: int
+    ) -> tuple[str | None, int]:
+        locked_query = (
+            select(self.model.id, self.model.rating_sum, self.model.rating_count)
+            .order_by(self.model.id)
+            .limit(batch_size)
+            .with_for_update()
+        )
+        if after_id is not None:
+            locked_query = locked_query.where(self.model.id > after_id)
+        locked = (await session.execute(locked_query)).all()
+        if not locked:
+            return None, 0
+
+        result = await session.execute(
+            select(
+                Review.user_to_id,
+                func.sum(Review.score),
+                func.count(Review.score),
+            )
+            .where(Review.user_to_id.in_([row.id for row in locked]))
+            .group_by(Review.user_to_id)
         )
+        stats = {user_id: (score_sum, count) for user_id, score_sum, count in result}
+        changed = []
+        for row in locked:
+            rating_sum, rating_count = stats.get(row.id, (0, 0))
+            if (row.rating_sum, row.rating_count) != (rating_sum, rating_count):
+                changed.append(
+                    {
+                        'id': row.id,
+                        'rating_sum': rating_sum,
+                        'rating_count': rating_count,
+                        'rating': rating_sum / rating_count if rating_count else None,
+                    }
+                )
+        if changed:
+            await session.execute(update(self.model), changed)
+        return locked[-1].id, len(changed)
 
 
 def get_user_repository() -> UserRepository:
@@ -0,0 +1,67 @@
+import uuid
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database.database import get_async_session
+from src.dependencies import get_current_principal
+from src.exceptions import ImageTooLargeException
+from src.routers.timed_route import TimedRoute
+from src.schemas.announcement_image_schemas import UploadedImageScheme
+from src.schemas.announcement_schemas import (
+    GetAnnouncementScheme,
+    SearchAnnouncementsScheme,
+)
+from src.schemas.base_schemas import PageScheme
+from src.services.announcement_service import (
+    AnnouncementService,
+    get_announcement_service,
+)
+from src.services.image_service import ImageService, get_image_service
+from src.utils.principal import Principal
+from src.utils.serializer import SchemeSerializer
+
+announcement_router = APIRouter(
+    prefix='/announcement', tags=['Announcement'], route_class=TimedRoute
+)
+
+announcement_page_serializer = SchemeSerializer(
+    scheme=PageScheme[GetAnnouncementScheme]
+)
+
+uploaded_image_serializer = SchemeSerializer(scheme=UploadedImageScheme)
+
+
+@announcement_router.get('/search')
+async def search_announcements(
+    search: SearchAnnouncementsScheme = Depends(),
+    limit: int | None = Query(default=None, ge=1),
+    cursor: str | None = Query(default=None),
+    announcement_service: AnnouncementService = Depends(get_announcement_service),
+    session: AsyncSession = Depends(get_async_session),
+):
+    page = await announcement_service.search(
+        search=search, session=session, limit=limit, cursor=cursor
+    )
+    return announcement_page_serializer.to_response(page)
+
+
+@announcement_router.post('/{announcement_id}/images')
+async def upload_announcement_image(
+    announcement_id: uuid.UUID,
+    request: Request,
+    principal: Principal = Depends(get_current_principal),
+    image_service: ImageService = Depends(get_image_service),
+    session: AsyncSession = Depends(get_async_session),
+):
+    if int(request.headers.get('content-length', 0)) > settings.IMAGE_MAX_SIZE:
+        raise ImageTooLargeException
+
+    uploaded_image = await image_service.upload(
+        announcement_id=announcement_id,
+        user_id=principal.id,
+        chunks=request.stream(),
+        session=session,
+    )
+    return uploaded_image_serializer.to_response(uploaded_image, status_code=201)
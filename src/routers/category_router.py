@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+
+from src.routers.timed_route import TimedRoute
+from src.schemas.category_schemas import GetCategoryScheme
+from src.services.reference_data_service import ReferenceDataService
+from src.utils.serializer import SchemeSerializer
+
+category_router = APIRouter(
+    prefix='/category', tags=['Category'], route_class=TimedRoute
+)
+
+categories_serializer = SchemeSerializer(scheme=tuple[GetCategoryScheme, ...])
+
+
+@category_router.get('')
+async def get_categories():
+    return categories_serializer.to_response(ReferenceDataService.get_categories())
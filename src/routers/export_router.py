@@ -0,0 +1,50 @@
+from enum import Enum
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from src.config import settings
+from src.dependencies import get_admin_principal
+from src.routers.timed_route import TimedRoute
+from src.services.announcement_service import get_announcement_service
+from src.services.review_service import get_review_service
+from src.services.user_service import get_user_service
+from src.utils.exporter import Exporter, ExportFormat
+from src.utils.principal import Principal
+
+export_router = APIRouter(prefix='/export', tags=['Export'], route_class=TimedRoute)
+
+
+class ExportEntity(Enum):
+    USER = 'user'
+    ANNOUNCEMENT = 'announcement'
+    REVIEW = 'review'
+
+
+EXPORT_SERVICES = {
+    ExportEntity.USER: get_user_service,
+    ExportEntity.ANNOUNCEMENT: get_announcement_service,
+    ExportEntity.REVIEW: get_review_service,
+}
+
+
+@export_router.get('/{entity}')
+async def export_entity(
+    entity: ExportEntity,
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias='format'),
+    fetch_size: int = Query(default=settings.EXPORT_FETCH_SIZE, ge=1, le=10000),
+    _principal: Principal = Depends(get_admin_principal),
+):
+    return StreamingResponse(
+        Exporter.export(
+            service=EXPORT_SERVICES[entity](),
+            export_format=export_format,
+            fetch_size=fetch_size,
+        ),
+        media_type=Exporter.MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="{entity.value}.{export_format.value}"'
+            )
+        },
+    )
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Response
+
+from src.database.pool_metrics import PoolMetrics
+from src.dependencies import get_admin_principal
+from src.routers.timed_route import TimedRoute
+from src.utils.entity_cache import EntityCache
+from src.utils.metrics import Metrics
+from src.utils.token_manager import TokenManager
+from src.utils.tracing import Tracer
+
+metrics_router = APIRouter(prefix='/metrics', tags=['Metrics'], route_class=TimedRoute)
+
+
+@metrics_router.get('')
+async def get_metrics():
+    content, media_type = Metrics.render()
+    return Response(content=content, media_type=media_type)
+
+
+@metrics_router.get('/pool', dependencies=[Depends(get_admin_principal)])
+async def get_pool_metrics():
+    return PoolMetrics.snapshot()
+
+
+@metrics_router.get('/entity-cache', dependencies=[Depends(get_admin_principal)])
+async def get_entity_cache_metrics():
+    return EntityCache.snapshot()
+
+
+@metrics_router.get('/token-cache', dependencies=[Depends(get_admin_principal)])
+async def get_token_cache_metrics():
+    return TokenManager.token_cache.stats()
+
+
+@metrics_router.get('/trace', dependencies=[Depends(get_admin_principal)])
+async def get_trace_metrics():
+    return Tracer.snapshot()
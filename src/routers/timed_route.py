@@ -0,0 +1,38 @@
+import time
+from typing import Callable
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+from src.utils.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+)
+
+
+class TimedRoute(APIRoute):
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            method = request.method
+            in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method, self.path)
+            in_flight.inc()
+            start = time.perf_counter()
+            status_code = 500
+            try:
+                response = await handler(request)
+                status_code = response.status_code
+            except HTTPException as exc:
+                status_code = exc.status_code
+                raise
+            finally:
+                in_flight.dec()
+                HTTP_REQUEST_DURATION.labels(method, self.path).observe(
+                    time.perf_counter() - start
+                )
+                HTTP_REQUESTS.labels(method, self.path, status_code).inc()
+            return response
+
+        return timed_handler
@@ -1,44 +1,48 @@
 from fastapi import APIRouter, Depends, Request, Response
+from jwt.exceptions import InvalidTokenError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.database import get_async_session
 from src.database.models.user_model import User
-from src.dependencies import get_current_user
+from src.dependencies import get_current_principal
 from src.exceptions import (
     InvalidCredentialsException,
     UserAlreadyExistsException,
     UserDoesNotExistsException,
 )
+from src.routers.timed_route import TimedRoute
 from src.schemas.user_schemas import (
     CreateUserScheme,
+    GetUserScheme,
     LoginUserCredentials,
     RegisterUserCredentials,
 )
+from src.services.refresh_token_service import (
+    RefreshTokenService,
+    get_refresh_token_service,
+)
 from src.services.user_service import UserService, get_user_service
 from src.utils.password_manager import PasswordManager
+from src.utils.principal import Principal
+from src.utils.serializer import SchemeSerializer
 from src.utils.token_manager import TokenManager
 
-user_router = APIRouter(prefix='/user', tags=['User'])
+user_router = APIRouter(prefix='/user', tags=['User'], route_class=TimedRoute)
+
+user_serializer = SchemeSerializer(scheme=GetUserScheme)
 
 
-@user_router.post('/register')
+@user_router.post('/register', response_model=GetUserScheme)
 async def register_user(
-    response: Response,
     user_credentials: RegisterUserCredentials,
     user_service: UserService = Depends(get_user_service),
+    refresh_token_service: RefreshTokenService = Depends(get_refresh_token_service),
     session: AsyncSession = Depends(get_async_session),
 ):
-    user_exists: User | None = await user_service.get_by_email(
-        email=user_credentials.email, session=session
-    )
-
-    if user_exists:
-        raise UserAlreadyExistsException
-
-    hashed_password: bytes = PasswordManager.get_password_hash(
+    hashed_password: bytes = await PasswordManager.get_password_hash_async(
         password=user_credentials.password
     )
-    new_user: User = await user_service.add(
+    new_user: User | None = await user_service.create_if_absent(
         entity=CreateUserScheme(
             name=user_credentials.name,
             email=user_credentials.email,
@@ -47,38 +51,25 @@ async def register_user(
         session=session,
     )
 
-    access_token, refresh_token = TokenManager.get_tokens(
-        {
-            'sub': str(new_user.id),
-        }
-    )
-
-    new_user.refresh_tokens.append(refresh_token)
+    if not new_user:
+        raise UserAlreadyExistsException
 
-    response.set_cookie(
-        key='stuffr_access',
-        value=access_token,
-        secure=True,
-        httponly=True,
-        samesite='strict',
+    access_token, refresh_token = await refresh_token_service.issue_tokens(
+        user=new_user, session=session
     )
 
-    response.set_cookie(
-        key='stuffr_refresh',
-        value=refresh_token,
-        secure=True,
-        httponly=True,
-        samesite='strict',
+    response = user_serializer.to_response(obj=new_user)
+    TokenManager.set_cookies(
+        response=response, access_token=access_token, refresh_token=refresh_token
     )
+    return response
 
-    return new_user
 
-
-@user_router.post('/login')
+@user_router.post('/login', response_model=GetUserScheme)
 async def login_user(
-    response: Response,
     user_credentials: LoginUserCredentials,
     user_service: UserService = Depends(get_user_service),
+    refresh_token_service: RefreshTokenService = Depends(get_refresh_token_service),
     session: AsyncSession = Depends(get_async_session),
 ):
     user: User | None = await user_service.get_by_email(
@@ -88,49 +79,45 @@ async def login_user(
     if not user:
         raise UserDoesNotExistsException
 
-    if not PasswordManager.check_password_hash(
+    if not await PasswordManager.check_password_hash_async(
         password=user_credentials.password, hashed=user.hashed_password
     ):
         raise InvalidCredentialsException
 
-    access_token, refresh_token = TokenManager.get_tokens(
-        {
-            'sub': str(user.id),
-        }
+    access_token, refresh_token = await refresh_token_service.issue_tokens(
+        user=user, session=session
     )
 
-    user.refresh_tokens.append(refresh_token)
-
-    response.set_cookie(
-        key='stuffr_access',
-        value=access_token,
-        secure=True,
-        httponly=True,
-        samesite='strict',
-    )
-
-    response.set_cookie(
-        key='stuffr_refresh',
-        value=refresh_token,
-        secure=True,
-        httponly=True,
-        samesite='strict',
+    response = user_serializer.to_response(obj=user)
+    TokenManager.set_cookies(
+        response=response, access_token=access_token, refresh_token=refresh_token
     )
-
-    return user
+    return response
 
 
 @user_router.post('/logout')
 async def logout(
     response: Response,
     request: Request,
-    user: User = Depends(get_current_user),
+    _principal: Principal = Depends(get_current_principal),
+    refresh_token_service: RefreshTokenService = Depends(get_refresh_token_service),
     session: AsyncSession = Depends(get_async_session),
 ):
-    user.refresh_tokens.remove(request.cookies['stuffr_refresh'])
+    refresh_token = request.cookies.get('stuffr_refresh', None)
+    if refresh_token:
+        try:
+            payload = TokenManager.decode_token(token=refresh_token)
+        except InvalidTokenError:
+            payload = {}
+        if payload.get('fam', None):
+            await refresh_token_service.revoke_family(
+                family_id=payload['fam'], session=session
+            )
+        else:
+            await refresh_token_service.revoke(token=refresh_token, session=session)
+        TokenManager.revoke_token(token=refresh_token)
+    TokenManager.revoke_token(token=request.cookies['stuffr_access'])
 
-    session.add(user)
-    await session.commit()
     response.delete_cookie('stuffr_access')
     response.delete_cookie('stuffr_refresh')
     return 200
@@ -1,11 +1,13 @@
 import uuid
+from typing import Optional
 
 from pydantic import BaseModel, HttpUrl
 
 
 class GetAnnouncementImage(BaseModel):
     announcement_id: str | uuid.UUID
-    image_url: HttpUrl
+    position: int
+    image_url: Optional[HttpUrl] = None
 
 
 class CreateAnnouncementImage(BaseModel):
@@ -14,3 +16,13 @@ class CreateAnnouncementImage(BaseModel):
 
 class UpdateAnnouncementImage(CreateAnnouncementImage):
     pass
+
+
+class UploadedImageScheme(BaseModel):
+    announcement_id: str | uuid.UUID
+    position: int
+    url: str
+    thumbnails: dict[int, str]
+    width: int
+    height: int
+    size: int
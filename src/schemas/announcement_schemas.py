@@ -2,7 +2,9 @@ import uuid
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas.base_schemas import BaseSchemas
 
 
 class AnnouncementStatus(Enum):
@@ -13,14 +15,14 @@ class AnnouncementStatus(Enum):
 
 
 class GetAnnouncementScheme(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str | uuid.UUID
     title: str = Field(min_length=3, max_length=100)
     description: str
     price: Optional[int] = None
     currency: Optional[str] = Field(min_length=3, max_length=3, default='RUB')
-    status: Optional[AnnouncementStatus] = Field(
-        max_length=15, default=AnnouncementStatus.UNDER_REVIEW
-    )
+    status: Optional[AnnouncementStatus] = AnnouncementStatus.UNDER_REVIEW
     user_id: str | uuid.UUID
     category_id: int = Field(ge=1)
 
@@ -30,9 +32,7 @@ class CreateAnnouncementScheme(BaseModel):
     description: str
     price: Optional[int] = None
     currency: Optional[str] = Field(min_length=3, max_length=3, default='RUB')
-    status: Optional[AnnouncementStatus] = Field(
-        max_length=15, default=AnnouncementStatus.UNDER_REVIEW
-    )
+    status: Optional[AnnouncementStatus] = AnnouncementStatus.UNDER_REVIEW
     user_id: str | uuid.UUID
     category_id: int = Field(ge=1)
 
@@ -42,7 +42,30 @@ class UpdateAnnouncementScheme(BaseModel):
     description: str
     price: Optional[int] = None
     currency: Optional[str] = Field(min_length=3, max_length=3, default='RUB')
-    status: Optional[AnnouncementStatus] = Field(
-        max_length=15, default=AnnouncementStatus.UNDER_REVIEW
-    )
+    status: Optional[AnnouncementStatus] = AnnouncementStatus.UNDER_REVIEW
     category_id: int = Field(ge=1)
+
+
+class SearchAnnouncementsScheme(BaseModel):
+    query: str = Field(min_length=2, max_length=200)
+    status: Optional[AnnouncementStatus] = AnnouncementStatus.PUBLISHED
+    category_id: Optional[int] = Field(ge=1, default=None)
+    min_price: Optional[int] = Field(ge=0, default=None)
+    max_price: Optional[int] = Field(ge=0, default=None)
+
+
+class AnnouncementSchemas(BaseSchemas):
+    def __init__(
+        self, get_scheme: BaseModel, crate_scheme: BaseModel, update_scheme: BaseModel
+    ):
+        self.get_scheme = get_scheme
+        self.crate_scheme = crate_scheme
+        self.update_scheme = update_scheme
+
+
+def get_announcement_schemas() -> AnnouncementSchemas:
+    return AnnouncementSchemas(
+        get_scheme=GetAnnouncementScheme,
+        crate_scheme=CreateAnnouncementScheme,
+        update_scheme=UpdateAnnouncementScheme,
+    )
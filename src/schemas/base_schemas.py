@@ -1,5 +1,9 @@
+from typing import Generic, List, Optional, TypeVar
+
 from pydantic import BaseModel
 
+T = TypeVar('T')
+
 
 class GetBaseScheme(BaseModel):
     pass
@@ -13,6 +17,11 @@ class UpdateBaseScheme(BaseModel):
     pass
 
 
+class PageScheme(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
 class BaseSchemas:
     def __init__(
         self, get_scheme: BaseModel, crate_scheme: BaseModel, update_scheme: BaseModel
@@ -0,0 +1,55 @@
+from enum import IntEnum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas.base_schemas import BaseSchemas
+
+
+class ImageFormat(IntEnum):
+    JPEG = 1
+    PNG = 2
+    WEBP = 3
+    GIF = 4
+
+
+IMAGE_EXTENSIONS = {
+    ImageFormat.JPEG: 'jpg',
+    ImageFormat.PNG: 'png',
+    ImageFormat.WEBP: 'webp',
+    ImageFormat.GIF: 'gif',
+}
+
+
+class GetImageScheme(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    hash: bytes = Field(min_length=32, max_length=32)
+    size: int = Field(ge=1)
+    width: int = Field(ge=1)
+    height: int = Field(ge=1)
+    format: ImageFormat
+
+
+class CreateImageScheme(GetImageScheme):
+    pass
+
+
+class UpdateImageScheme(BaseModel):
+    pass
+
+
+class ImageSchemas(BaseSchemas):
+    def __init__(
+        self, get_scheme: BaseModel, crate_scheme: BaseModel, update_scheme: BaseModel
+    ):
+        self.get_scheme = get_scheme
+        self.crate_scheme = crate_scheme
+        self.update_scheme = update_scheme
+
+
+def get_image_schemas() -> ImageSchemas:
+    return ImageSchemas(
+        get_scheme=GetImageScheme,
+        crate_scheme=CreateImageScheme,
+        update_scheme=UpdateImageScheme,
+    )
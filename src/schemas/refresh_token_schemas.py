@@ -0,0 +1,38 @@
+import datetime
+import uuid
+
+from pydantic import BaseModel, Field
+
+from src.schemas.base_schemas import BaseSchemas
+
+
+class GetRefreshTokenScheme(BaseModel):
+    token_hash: str = Field(min_length=64, max_length=64)
+    user_id: str | uuid.UUID
+    family_id: str | uuid.UUID
+    expires_at: datetime.datetime
+
+
+class CreateRefreshTokenScheme(GetRefreshTokenScheme):
+    pass
+
+
+class UpdateRefreshTokenScheme(BaseModel):
+    expires_at: datetime.datetime
+
+
+class RefreshTokenSchemas(BaseSchemas):
+    def __init__(
+        self, get_scheme: BaseModel, crate_scheme: BaseModel, update_scheme: BaseModel
+    ):
+        self.get_scheme = get_scheme
+        self.crate_scheme = crate_scheme
+        self.update_scheme = update_scheme
+
+
+def get_refresh_token_schemas() -> RefreshTokenSchemas:
+    return RefreshTokenSchemas(
+        get_scheme=GetRefreshTokenScheme,
+        crate_scheme=CreateRefreshTokenScheme,
+        update_scheme=UpdateRefreshTokenScheme,
+    )
@@ -1,21 +1,42 @@
 import uuid
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.schemas.base_schemas import BaseSchemas
 
 
 class GetReviewScheme(BaseModel):
     id: str | uuid.UUID
     text: Optional[str] = None
+    score: Optional[int] = None
     user_to_id: str | uuid.UUID
     user_from_id: str | uuid.UUID
 
 
 class CreateReviewScheme(BaseModel):
     text: Optional[str] = None
+    score: int = Field(ge=1, le=5)
     user_to_id: str | uuid.UUID
     user_from_id: str | uuid.UUID
 
 
 class UpdateReviewScheme(BaseModel):
     text: Optional[str] = None
+
+
+class ReviewSchemas(BaseSchemas):
+    def __init__(
+        self, get_scheme: BaseModel, crate_scheme: BaseModel, update_scheme: BaseModel
+    ):
+        self.get_scheme = get_scheme
+        self.crate_scheme = crate_scheme
+        self.update_scheme = update_scheme
+
+
+def get_review_schemas() -> ReviewSchemas:
+    return ReviewSchemas(
+        get_scheme=GetReviewScheme,
+        crate_scheme=CreateReviewScheme,
+        update_scheme=UpdateReviewScheme,
+    )
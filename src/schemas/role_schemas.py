@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GetRoleScheme(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     name: str = Field(min_length=3, max_length=30)
 
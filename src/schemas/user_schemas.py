@@ -1,7 +1,7 @@
 import uuid
-from typing import List, Optional
+from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, HttpUrl
 
 from src.schemas.base_schemas import BaseSchemas
 
@@ -17,15 +17,17 @@ class RegisterUserCredentials(LoginUserCredentials):
 
 
 class GetUserScheme(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str | uuid.UUID
     name: str = Field(min_length=3, max_length=30)
     second_name: Optional[str] = Field(min_length=3, max_length=30, default=None)
     avatar_url: Optional[HttpUrl] = None
     role_id: int = Field(ge=1, default=1)
     rating: Optional[float] = None
+    rating_count: int = 0
     email: EmailStr = Field(max_length=50)
     phone: Optional[str] = Field(max_length=20, default=None)
-    refresh_tokens: List[str] = []
 
 
 class CreateUserScheme(BaseModel):
@@ -37,7 +39,6 @@ class CreateUserScheme(BaseModel):
     phone: Optional[str] = Field(max_length=20, default=None)
     email: EmailStr = Field(max_length=50)
     hashed_password: str
-    refresh_tokens: List[str] = []
 
 
 class UpdateUserScheme(BaseModel):
@@ -46,7 +47,6 @@ class UpdateUserScheme(BaseModel):
     avatar_url: Optional[HttpUrl] = None
     phone: Optional[str] = Field(max_length=20, default=None)
     email: EmailStr = Field(max_length=50)
-    refresh_tokens: List[str] = []
 
 
 class UserSchemas(BaseSchemas):
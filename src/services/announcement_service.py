@@ -0,0 +1,59 @@
+import pydantic
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.announcement_model import Announcement
+from src.database.models.base_model import BaseModel
+from src.repositories.announcement_repository import get_announcement_repository
+from src.schemas.announcement_schemas import (
+    SearchAnnouncementsScheme,
+    get_announcement_schemas,
+)
+from src.schemas.base_schemas import PageScheme
+from src.services.base_service import BaseService
+from src.services.reference_data_service import ReferenceDataService
+from src.utils.decorators import trace_decorator
+from src.utils.entity_cache import EntityCache
+
+
+class AnnouncementService(BaseService):
+    def __init__(self, repository, schemas, cache=None):
+        super().__init__(repository=repository, schemas=schemas, cache=cache)
+
+    @trace_decorator
+    async def add(self, entity: pydantic.BaseModel, session: AsyncSession) -> BaseModel:
+        ReferenceDataService.validate_category(category_id=entity.category_id)
+        return await super().add(entity=entity, session=session)
+
+    @trace_decorator
+    async def create_if_absent(
+        self, entity: pydantic.BaseModel, session: AsyncSession
+    ) -> BaseModel | None:
+        ReferenceDataService.validate_category(category_id=entity.category_id)
+        return await super().create_if_absent(entity=entity, session=session)
+
+    @trace_decorator
+    async def update(
+        self, entity_id: int | str, entity: pydantic.BaseModel, session: AsyncSession
+    ):
+        ReferenceDataService.validate_category(category_id=entity.category_id)
+        return await super().update(entity_id=entity_id, entity=entity, session=session)
+
+    @trace_decorator
+    async def search(
+        self,
+        search: SearchAnnouncementsScheme,
+        session: AsyncSession,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageScheme:
+        return await self.repository.search(
+            search=search, session=session, limit=limit, cursor=cursor
+        )
+
+
+def get_announcement_service() -> AnnouncementService:
+    return AnnouncementService(
+        repository=get_announcement_repository(),
+        schemas=get_announcement_schemas(),
+        cache=EntityCache.for_model(model=Announcement),
+    )
@@ -1,49 +1,147 @@
 from abc import ABC
-from typing import List
+from typing import AsyncIterator, List, Sequence
 
 import pydantic
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.base_model import BaseModel
 from src.repositories.base_repository import BaseRepository, get_base_repository
-from src.schemas.base_schemas import BaseSchemas, get_base_schemas
-from src.utils.decorators import logger_decorator
+from src.schemas.base_schemas import BaseSchemas, PageScheme, get_base_schemas
+from src.utils.decorators import trace_decorator
+from src.utils.entity_cache import EntityCache
 
 
 class BaseService(ABC):
-    def __init__(self, repository: BaseRepository, schemas: BaseSchemas) -> BaseModel:
+    def __init__(
+        self,
+        repository: BaseRepository,
+        schemas: BaseSchemas,
+        cache: EntityCache | None = None,
+    ) -> BaseModel:
         self.repository: BaseRepository = repository
         self.schemas: BaseSchemas = schemas
+        self.cache: EntityCache | None = cache
 
-    @logger_decorator
+    @trace_decorator
     async def add(self, entity: pydantic.BaseModel, session: AsyncSession) -> BaseModel:
         return await self.repository.add(entity=entity, session=session)
 
-    @logger_decorator
+    @trace_decorator
+    async def create_if_absent(
+        self, entity: pydantic.BaseModel, session: AsyncSession
+    ) -> BaseModel | None:
+        return await self.repository.create_if_absent(entity=entity, session=session)
+
+    @trace_decorator
+    async def add_many(
+        self,
+        entities: Sequence[pydantic.BaseModel],
+        session: AsyncSession,
+        returning: bool = False,
+    ) -> Sequence[BaseModel] | None:
+        return await self.repository.add_many(
+            entities=entities, session=session, returning=returning
+        )
+
+    @trace_decorator
+    async def upsert_many(
+        self,
+        entities: Sequence[pydantic.BaseModel],
+        session: AsyncSession,
+        conflict_elements: Sequence,
+        update_columns: Sequence[str] | None = None,
+        returning: bool = False,
+    ) -> Sequence[BaseModel] | None:
+        upserted_entities = await self.repository.upsert_many(
+            entities=entities,
+            session=session,
+            conflict_elements=conflict_elements,
+            update_columns=update_columns,
+            returning=returning,
+        )
+        if self.cache is not None:
+            if upserted_entities is None:
+                self.cache.invalidate_after_commit(session=session)
+            for entity in upserted_entities or []:
+                self.cache.invalidate_after_commit(session=session, entity_id=entity.id)
+        return upserted_entities
+
+    @trace_decorator
     async def get_one(
         self, entity_id: int | str, session: AsyncSession
     ) -> BaseModel | None:
-        return await self.repository.get_one(entity_id=entity_id, session=session)
+        if self.cache is None or session.info.get('wrote'):
+            return await self.repository.get_one(entity_id=entity_id, session=session)
+
+        cached_entity = await self.cache.get(entity_id=entity_id)
+        if cached_entity is not None:
+            return await session.merge(cached_entity, load=False)
 
-    @logger_decorator
+        entity = await self.repository.get_one(
+            entity_id=entity_id, session=session, use_primary=True
+        )
+        if entity is not None:
+            await self.cache.set(entity=entity)
+        return entity
+
+    @trace_decorator
     async def get_all(self, session: AsyncSession) -> List[BaseModel]:
         return await self.repository.get_all(session=session)
 
-    @logger_decorator
+    @trace_decorator
+    async def get_page(
+        self,
+        session: AsyncSession,
+        limit: int | None = None,
+        cursor: str | None = None,
+        filters: dict | None = None,
+        descending: bool = True,
+    ) -> PageScheme:
+        return await self.repository.get_page(
+            session=session,
+            limit=limit,
+            cursor=cursor,
+            filters=filters,
+            descending=descending,
+        )
+
+    @trace_decorator
+    def stream_all(
+        self,
+        session: AsyncSession,
+        fetch_size: int | None = None,
+        filters: dict | None = None,
+    ) -> AsyncIterator[BaseModel]:
+        return self.repository.stream_all(
+            session=session, fetch_size=fetch_size, filters=filters
+        )
+
+    @trace_decorator
     async def update(
         self, entity_id: int | str, entity: pydantic.BaseModel, session: AsyncSession
     ):
-        return await self.repository.update(
+        updated_entity = await self.repository.update(
             entity_id=entity_id, entity=entity, session=session
         )
+        if self.cache is not None:
+            self.cache.invalidate_after_commit(session=session, entity_id=entity_id)
+        return updated_entity
 
-    @logger_decorator
+    @trace_decorator
     async def delete(self, entity_id: int | str, session: AsyncSession):
-        return await self.repository.delete(entity_id=entity_id, session=session)
+        deleted_entity = await self.repository.delete(
+            entity_id=entity_id, session=session
+        )
+        if self.cache is not None:
+            self.cache.invalidate_after_commit(session=session, entity_id=entity_id)
+        return deleted_entity
 
-    @logger_decorator
+    @trace_decorator
     async def delete_all(self, session: AsyncSession):
-        return await self.repository.delete_all(session=session)
+        result = await self.repository.delete_all(session=session)
+        if self.cache is not None:
+            self.cache.invalidate_after_commit(session=session)
+        return result
 
 
 def get_base_service() -> BaseService:
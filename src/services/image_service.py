@@ -0,0 +1,132 @@
+import uuid
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.exceptions import (
+    AnnouncementAccessDeniedException,
+    AnnouncementDoesNotExistsException,
+    ImageLimitExceededException,
+)
+from src.repositories.announcement_image_repository import (
+    AnnouncementImageRepository,
+    get_announcement_image_repository,
+)
+from src.repositories.announcement_repository import (
+    AnnouncementRepository,
+    get_announcement_repository,
+)
+from src.repositories.image_repository import get_image_repository
+from src.schemas.announcement_image_schemas import UploadedImageScheme
+from src.schemas.image_schemas import CreateImageScheme, get_image_schemas
+from src.services.base_service import BaseService
+from src.utils.decorators import trace_decorator
+from src.utils.image_processor import ImageProcessor
+from src.utils.image_storage import ImageStorage
+
+
+class ImageService(BaseService):
+    def __init__(
+        self,
+        repository,
+        schemas,
+        announcement_repository: AnnouncementRepository,
+        announcement_image_repository: AnnouncementImageRepository,
+    ):
+        super().__init__(repository=repository, schemas=schemas)
+        self.announcement_repository: AnnouncementRepository = announcement_repository
+        self.announcement_image_repository: AnnouncementImageRepository = (
+            announcement_image_repository
+        )
+
+    @trace_decorator
+    async def upload(
+        self,
+        announcement_id: uuid.UUID,
+        user_id: str,
+        chunks: AsyncIterator[bytes],
+        session: AsyncSession,
+    ) -> UploadedImageScheme:
+        await self._check_owner(
+            announcement_id=announcement_id, user_id=user_id, session=session
+        )
+        images_count = await self.announcement_image_repository.count_images(
+            announcement_id=announcement_id, session=session
+        )
+        if images_count >= settings.IMAGE_MAX_PER_ANNOUNCEMENT:
+            raise ImageLimitExceededException
+        await session.commit()
+
+        source, digest, size = await ImageStorage.receive(chunks=chunks)
+        try:
+            image = await self.repository.get_by_hash(
+                image_hash=digest, session=session
+            )
+            if image is None:
+                await session.commit()
+                metadata = await ImageProcessor.process(source=source, digest=digest)
+                image = CreateImageScheme(hash=digest, size=size, **metadata)
+                await self.repository.create_if_absent(entity=image, session=session)
+        finally:
+            await ImageStorage.discard(path=source)
+
+        await self._check_owner(
+            announcement_id=announcement_id,
+            user_id=user_id,
+            session=session,
+            for_update=True,
+        )
+        announcement_image = await self.announcement_image_repository.add_image(
+            announcement_id=announcement_id,
+            image_hash=digest,
+            max_images=settings.IMAGE_MAX_PER_ANNOUNCEMENT,
+            session=session,
+        )
+        if announcement_image is None:
+            raise ImageLimitExceededException
+
+        return UploadedImageScheme(
+            announcement_id=announcement_id,
+            position=announcement_image.position,
+            url=ImageStorage.get_url(
+                digest=digest,
+                suffix=ImageProcessor.get_original_suffix(image_format=image.format),
+            ),
+            thumbnails={
+                size: ImageStorage.get_url(digest=digest, suffix=suffix)
+                for size, suffix in ImageProcessor.get_thumbnail_suffixes().items()
+            },
+            width=image.width,
+            height=image.height,
+            size=image.size,
+        )
+
+    async def _check_owner(
+        self,
+        announcement_id: uuid.UUID,
+        user_id: str,
+        session: AsyncSession,
+        for_update: bool = False,
+    ) -> None:
+        if for_update:
+            announcement = await self.announcement_repository.get_for_update(
+                entity_id=announcement_id, session=session
+            )
+        else:
+            announcement = await self.announcement_repository.get_one(
+                entity_id=announcement_id, session=session
+            )
+        if announcement is None:
+            raise AnnouncementDoesNotExistsException
+        if str(announcement.user_id) != str(user_id):
+            raise AnnouncementAccessDeniedException
+
+
+def get_image_service() -> ImageService:
+    return ImageService(
+        repository=get_image_repository(),
+        schemas=get_image_schemas(),
+        announcement_repository=get_announcement_repository(),
+        announcement_image_repository=get_announcement_image_repository(),
+    )
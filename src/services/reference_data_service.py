@@ -0,0 +1,132 @@
+import asyncio
+from types import MappingProxyType
+from typing import Mapping
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.config import settings
+from src.database.database import session_maker
+from src.exceptions import CategoryDoesNotExistsException, RoleDoesNotExistsException
+from src.logging import logger
+from src.repositories.category_repository import get_category_repository
+from src.repositories.role_repository import get_role_repository
+from src.schemas.category_schemas import GetCategoryScheme
+from src.schemas.role_schemas import GetRoleScheme
+
+
+class ReferenceDataService:
+    CHANNEL = 'reference_data'
+
+    _categories: Mapping[int, GetCategoryScheme] = MappingProxyType({})
+    _roles: Mapping[int, GetRoleScheme] = MappingProxyType({})
+    _stale: bool = False
+    _task: asyncio.Task | None = None
+    _reload_task: asyncio.Task | None = None
+
+    @classmethod
+    def get_categories(cls) -> tuple[GetCategoryScheme, ...]:
+        return tuple(cls._categories.values())
+
+    @classmethod
+    def get_category(cls, category_id: int) -> GetCategoryScheme | None:
+        return cls._categories.get(category_id)
+
+    @classmethod
+    def validate_category(cls, category_id: int) -> GetCategoryScheme:
+        category = cls._categories.get(category_id)
+        if category is None:
+            raise CategoryDoesNotExistsException
+        return category
+
+    @classmethod
+    def get_roles(cls) -> tuple[GetRoleScheme, ...]:
+        return tuple(cls._roles.values())
+
+    @classmethod
+    def get_role(cls, role_id: int) -> GetRoleScheme | None:
+        return cls._roles.get(role_id)
+
+    @classmethod
+    def validate_role(cls, role_id: int) -> GetRoleScheme:
+        role = cls._roles.get(role_id)
+        if role is None:
+            raise RoleDoesNotExistsException
+        return role
+
+    @classmethod
+    async def load(cls) -> None:
+        async with session_maker(info={'use_primary': True}) as session:
+            categories = await get_category_repository().get_all(session=session)
+            roles = await get_role_repository().get_all(session=session)
+
+        cls._categories = MappingProxyType(
+            {
+                category.id: GetCategoryScheme.model_validate(category)
+                for category in sorted(categories, key=lambda category: category.id)
+            }
+        )
+        cls._roles = MappingProxyType(
+            {
+                role.id: GetRoleScheme.model_validate(role)
+                for role in sorted(roles, key=lambda role: role.id)
+            }
+        )
+        logger.info(
+            'Loaded %s categories and %s roles', len(cls._categories), len(cls._roles)
+        )
+
+    @classmethod
+    async def start(cls) -> None:
+        await cls.load()
+        if not cls._task:
+            cls._task = asyncio.create_task(cls._listen())
+
+    @classmethod
+    async def stop(cls) -> None:
+        for task in (cls._task, cls._reload_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        cls._task = None
+        cls._reload_task = None
+
+    @classmethod
+    def _on_notify(cls, *_args) -> None:
+        cls._stale = True
+        if cls._reload_task is None or cls._reload_task.done():
+            cls._reload_task = asyncio.create_task(cls._reload())
+
+    @classmethod
+    async def _reload(cls) -> None:
+        while cls._stale:
+            cls._stale = False
+            try:
+                await cls.load()
+            except Exception:
+                logger.exception('Reference data reload failed')
+
+    @classmethod
+    async def _listen(cls) -> None:
+        dsn = (
+            make_url(settings.POSTGRES_URL)
+            .set(drivername='postgresql')
+            .render_as_string(hide_password=False)
+        )
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn=dsn)
+                await connection.add_listener(cls.CHANNEL, cls._on_notify)
+                cls._on_notify()
+                while not connection.is_closed():
+                    await asyncio.sleep(settings.REFERENCE_DATA_RECONNECT_INTERVAL)
+            except Exception:
+                logger.exception('Reference data listener failed')
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(settings.REFERENCE_DATA_RECONNECT_INTERVAL)
@@ -0,0 +1,95 @@
+import datetime
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_extensions import uuid7
+
+from src.config import settings
+from src.database.models.refresh_token_model import RefreshToken
+from src.database.models.user_model import User
+from src.repositories.refresh_token_repository import get_refresh_token_repository
+from src.schemas.refresh_token_schemas import (
+    CreateRefreshTokenScheme,
+    get_refresh_token_schemas,
+)
+from src.services.base_service import BaseService
+from src.utils.decorators import trace_decorator
+from src.utils.token_manager import TokenManager
+
+
+class RefreshTokenService(BaseService):
+    def __init__(self, repository, schemas):
+        super().__init__(repository=repository, schemas=schemas)
+
+    @trace_decorator
+    async def issue_tokens(
+        self,
+        user: User,
+        session: AsyncSession,
+        family_id: str | uuid.UUID | None = None,
+    ) -> tuple[str, str]:
+        family_id = family_id or uuid7()
+        access_token, refresh_token = TokenManager.get_tokens(
+            {**TokenManager.get_claims(user), 'fam': str(family_id)}
+        )
+        await self.repository.add_token(
+            entity=CreateRefreshTokenScheme(
+                token_hash=TokenManager.hash_token(token=refresh_token),
+                user_id=user.id,
+                family_id=family_id,
+                expires_at=TokenManager.get_expiration(token=refresh_token),
+            ),
+            session=session,
+        )
+        if settings.REFRESH_TOKEN_MAX_PER_USER:
+            await self.repository.trim_user_tokens(
+                user_id=user.id,
+                keep=settings.REFRESH_TOKEN_MAX_PER_USER,
+                session=session,
+            )
+        return access_token, refresh_token
+
+    @trace_decorator
+    async def rotate(self, token: str, session: AsyncSession) -> RefreshToken | None:
+        return await self.repository.rotate_by_hash(
+            token_hash=TokenManager.hash_token(token=token), session=session
+        )
+
+    @trace_decorator
+    async def get_recently_rotated(
+        self, token: str, session: AsyncSession
+    ) -> RefreshToken | None:
+        return await self.repository.get_rotated_since(
+            token_hash=TokenManager.hash_token(token=token),
+            grace=datetime.timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE),
+            session=session,
+        )
+
+    @trace_decorator
+    async def revoke(self, token: str, session: AsyncSession) -> RefreshToken | None:
+        return await self.repository.delete_by_hash(
+            token_hash=TokenManager.hash_token(token=token), session=session
+        )
+
+    @trace_decorator
+    async def revoke_family(self, family_id: str, session: AsyncSession):
+        return await self.repository.delete_family(family_id=family_id, session=session)
+
+    @trace_decorator
+    async def revoke_user(self, user_id: str, session: AsyncSession):
+        return await self.repository.delete_by_user(user_id=user_id, session=session)
+
+    @trace_decorator
+    async def delete_expired(self, batch_size: int, session: AsyncSession) -> int:
+        return await self.repository.delete_expired(
+            batch_size=batch_size,
+            grace=datetime.timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE),
+            session=session,
+        )
+
+
+def get_refresh_token_service() -> RefreshTokenService:
+    return RefreshTokenService(
+        repository=get_refresh_token_repository(),
+        schemas=get_refresh_token_schemas(),
+    )
@@ -0,0 +1,66 @@
+import pydantic
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.base_model import BaseModel
+from src.database.models.user_model import User
+from src.repositories.review_repository import get_review_repository
+from src.repositories.user_repository import UserRepository, get_user_repository
+from src.schemas.review_schemas import get_review_schemas
+from src.services.base_service import BaseService
+from src.utils.decorators import trace_decorator
+from src.utils.entity_cache import EntityCache
+
+
+class ReviewService(BaseService):
+    def __init__(self, repository, schemas, user_repository: UserRepository):
+        super().__init__(repository=repository, schemas=schemas)
+        self.user_repository: UserRepository = user_repository
+        self.user_cache: EntityCache = EntityCache.for_model(model=User)
+
+    @trace_decorator
+    async def add(self, entity: pydantic.BaseModel, session: AsyncSession) -> BaseModel:
+        review = await super().add(entity=entity, session=session)
+        await self._apply_rating(
+            user_id=review.user_to_id,
+            score_delta=review.score,
+            count_delta=1,
+            session=session,
+        )
+        return review
+
+    @trace_decorator
+    async def delete(self, entity_id: int | str, session: AsyncSession):
+        review = await super().delete(entity_id=entity_id, session=session)
+        if review is not None and review.score is not None:
+            await self._apply_rating(
+                user_id=review.user_to_id,
+                score_delta=-review.score,
+                count_delta=-1,
+                session=session,
+            )
+        return review
+
+    @trace_decorator
+    async def delete_all(self, session: AsyncSession):
+        await super().delete_all(session=session)
+        await self.user_repository.reset_ratings(session=session)
+        self.user_cache.invalidate_after_commit(session=session)
+
+    async def _apply_rating(
+        self, user_id: str, score_delta: int, count_delta: int, session: AsyncSession
+    ) -> None:
+        await self.user_repository.apply_rating(
+            user_id=user_id,
+            score_delta=score_delta,
+            count_delta=count_delta,
+            session=session,
+        )
+        self.user_cache.invalidate_after_commit(session=session, entity_id=user_id)
+
+
+def get_review_service() -> ReviewService:
+    return ReviewService(
+        repository=get_review_repository(),
+        schemas=get_review_schemas(),
+        user_repository=get_user_repository(),
+    )
@@ -1,18 +1,34 @@
+import pydantic
 from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.base_model import BaseModel
+from src.database.models.user_model import User
 from src.repositories.user_repository import get_user_repository
 from src.schemas.user_schemas import get_user_schemas
 from src.services.base_service import BaseService
-from src.utils.decorators import logger_decorator
+from src.services.reference_data_service import ReferenceDataService
+from src.utils.decorators import trace_decorator
+from src.utils.entity_cache import EntityCache
 
 
 class UserService(BaseService):
-    def __init__(self, repository, schemas):
-        super().__init__(repository=repository, schemas=schemas)
+    def __init__(self, repository, schemas, cache=None):
+        super().__init__(repository=repository, schemas=schemas, cache=cache)
 
-    @logger_decorator
+    @trace_decorator
+    async def add(self, entity: pydantic.BaseModel, session: AsyncSession) -> BaseModel:
+        ReferenceDataService.validate_role(role_id=entity.role_id)
+        return await super().add(entity=entity, session=session)
+
+    @trace_decorator
+    async def create_if_absent(
+        self, entity: pydantic.BaseModel, session: AsyncSession
+    ) -> BaseModel | None:
+        ReferenceDataService.validate_role(role_id=entity.role_id)
+        return await super().create_if_absent(entity=entity, session=session)
+
+    @trace_decorator
     async def get_by_email(
         self, email: EmailStr, session: AsyncSession
     ) -> BaseModel | None:
@@ -20,4 +36,8 @@ class UserService(BaseService):
 
 
 def get_user_service() -> UserService:
-    return UserService(repository=get_user_repository(), schemas=get_user_schemas())
+    return UserService(
+        repository=get_user_repository(),
+        schemas=get_user_schemas(),
+        cache=EntityCache.for_model(model=User),
+    )
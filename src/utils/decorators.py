@@ -1,13 +1,58 @@
+import inspect
+import logging
+import random
 from functools import wraps
 from typing import Callable
 
+from src.config import settings
 from src.logging import logger
+from src.utils.metrics import current_method_var
+from src.utils.tracing import LazyArguments, Tracer
 
+TRACE_LOG_LEVEL = logging.getLevelName(settings.TRACE_LOG_LEVEL)
+
+
+def trace_decorator(func: Callable):
+    def get_name(args: tuple) -> str:
+        return f'{type(args[0]).__name__}.{func.__name__}' if args else func.__name__
+
+    def finish(name: str, args: tuple, kwargs: dict, start: float):
+        elapsed = Tracer.now() - start
+        Tracer.record(name=name, seconds=elapsed)
+
+        if logger.isEnabledFor(TRACE_LOG_LEVEL) and (
+            random.random() < settings.TRACE_SAMPLE_RATE
+        ):
+            logger.log(
+                TRACE_LOG_LEVEL,
+                'Call %s took %.3f ms with parameters: %s',
+                name,
+                elapsed * 1000,
+                LazyArguments(args=args, kwargs=kwargs),
+            )
+
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            name = get_name(args=args)
+            token = current_method_var.set(name)
+            start = Tracer.now()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                current_method_var.reset(token)
+                finish(name=name, args=args, kwargs=kwargs, start=start)
+
+        return async_wrapper
 
-def logger_decorator(func: Callable):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger.info(f'Call {func.__name__}\nWith parameters: {args, kwargs}')
-        return func(*args, **kwargs)
+        name = get_name(args=args)
+        start = Tracer.now()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            finish(name=name, args=args, kwargs=kwargs, start=start)
 
     return wrapper
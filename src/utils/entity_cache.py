@@ -0,0 +1,238 @@
+import datetime
+import time
+import uuid
+from collections import OrderedDict
+
+import orjson
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.config import settings
+from src.database.models.base_model import BaseModel
+from src.logging import logger
+
+try:
+    from redis import asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+PENDING_INVALIDATIONS = 'entity_cache_pending_invalidations'
+COMMITTED_INVALIDATIONS = 'entity_cache_committed_invalidations'
+
+RESTORERS = {
+    uuid.UUID: uuid.UUID,
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.date: datetime.date.fromisoformat,
+}
+
+
+class CacheTierStats:
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def snapshot(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / requests if requests else 0.0,
+        }
+
+
+class LocalCacheTier:
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size: int = max_size
+        self.ttl: int = ttl
+        self.stats = CacheTierStats()
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    async def get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self._entries.pop(key, None)
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry[1]
+
+    async def set(self, key: str, value: dict) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheTier:
+    def __init__(self, client, namespace: str, ttl: int):
+        self.client = client
+        self.namespace: str = namespace
+        self.ttl: int = ttl
+        self.stats = CacheTierStats()
+
+    async def get(self, key: str) -> dict | None:
+        raw = await self.client.get(self._key(key))
+        if raw is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return orjson.loads(raw)
+
+    async def set(self, key: str, value: dict) -> None:
+        await self.client.set(self._key(key), orjson.dumps(value), ex=self.ttl)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self._key(key))
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=self._key('*'))]
+        for start in range(0, len(keys), 500):
+            await self.client.delete(*keys[start : start + 500])
+
+    def _key(self, key: str) -> str:
+        return f'stuffr:{self.namespace}:{key}'
+
+
+class EntityCache:
+    _caches: dict[str, 'EntityCache'] = {}
+    _redis_client = None
+
+    def __init__(self, model: BaseModel):
+        self.model: BaseModel = model
+        self.namespace: str = model.__tablename__
+        self.columns: dict[str, type | None] = {
+            attribute.key: EntityCache._get_python_type(attribute=attribute)
+            for attribute in inspect(model).column_attrs
+            if attribute.columns[0].info.get('cached', True)
+        }
+        self.tiers: list[LocalCacheTier | RedisCacheTier] = [
+            LocalCacheTier(
+                max_size=settings.ENTITY_CACHE_SIZE, ttl=settings.ENTITY_CACHE_TTL
+            )
+        ]
+        redis_client = EntityCache.get_redis_client()
+        if redis_client is not None:
+            self.tiers.append(
+                RedisCacheTier(
+                    client=redis_client,
+                    namespace=self.namespace,
+                    ttl=settings.ENTITY_CACHE_REDIS_TTL,
+                )
+            )
+
+    @classmethod
+    def for_model(cls, model: BaseModel) -> 'EntityCache':
+        if model.__tablename__ not in cls._caches:
+            cls._caches[model.__tablename__] = cls(model=model)
+        return cls._caches[model.__tablename__]
+
+    @classmethod
+    def configure_redis(cls, client) -> None:
+        cls._redis_client = client
+        cls._caches.clear()
+
+    @classmethod
+    def get_redis_client(cls):
+        if cls._redis_client is None and settings.REDIS_URL:
+            if aioredis is None:
+                logger.warning('REDIS_URL is set but the redis package is missing')
+                return None
+            cls._redis_client = aioredis.from_url(settings.REDIS_URL)
+        return cls._redis_client
+
+    @classmethod
+    def snapshot(cls) -> dict[str, list[dict]]:
+        return {
+            namespace: [
+                {'tier': type(tier).__name__, **tier.stats.snapshot()}
+                for tier in cache.tiers
+            ]
+            for namespace, cache in cls._caches.items()
+        }
+
+    async def get(self, entity_id: int | str) -> BaseModel | None:
+        key = str(entity_id)
+        for index, tier in enumerate(self.tiers):
+            value = await tier.get(key=key)
+            if value is not None:
+                for upper_tier in self.tiers[:index]:
+                    await upper_tier.set(key=key, value=value)
+                return self._load(value=value)
+        return None
+
+    async def set(self, entity: BaseModel) -> None:
+        value = self._dump(entity=entity)
+        for tier in self.tiers:
+            await tier.set(key=str(entity.id), value=value)
+
+    def invalidate_after_commit(
+        self, session: AsyncSession, entity_id: int | str | None = None
+    ) -> None:
+        session.info.setdefault(PENDING_INVALIDATIONS, []).append((self, entity_id))
+
+    @staticmethod
+    async def run_committed_invalidations(session: AsyncSession) -> None:
+        for cache, entity_id in session.info.pop(COMMITTED_INVALIDATIONS, []):
+            if entity_id is None:
+                await cache.invalidate_all()
+            else:
+                await cache.invalidate(entity_id=entity_id)
+
+    async def invalidate(self, entity_id: int | str) -> None:
+        for tier in self.tiers:
+            await tier.delete(key=str(entity_id))
+
+    async def invalidate_all(self) -> None:
+        for tier in self.tiers:
+            await tier.clear()
+
+    def _dump(self, entity: BaseModel) -> dict:
+        loaded = inspect(entity).dict
+        return {key: loaded[key] for key in self.columns if key in loaded}
+
+    def _load(self, value: dict) -> BaseModel:
+        entity = self.model(
+            **{
+                key: self._restore(key=key, value=item)
+                for key, item in value.items()
+                if key in self.columns
+            }
+        )
+        make_transient_to_detached(entity)
+        return entity
+
+    def _restore(self, key: str, value):
+        python_type = self.columns[key]
+        if value is None or python_type is None or isinstance(value, python_type):
+            return value
+        return RESTORERS[python_type](value)
+
+    @staticmethod
+    def _get_python_type(attribute) -> type | None:
+        try:
+            python_type = attribute.columns[0].type.python_type
+        except NotImplementedError:
+            return None
+        return python_type if python_type in RESTORERS else None
+
+
+@event.listens_for(Session, 'after_commit')
+def _on_commit(session: Session) -> None:
+    pending = session.info.pop(PENDING_INVALIDATIONS, None)
+    if pending:
+        session.info.setdefault(COMMITTED_INVALIDATIONS, []).extend(pending)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _on_rollback(session: Session) -> None:
+    session.info.pop(PENDING_INVALIDATIONS, None)
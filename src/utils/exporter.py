@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import AsyncIterator, List
+
+from src.database.database import session_maker
+from src.services.base_service import BaseService
+
+
+class ExportFormat(Enum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
+class Exporter:
+    EXCLUDED_FIELDS = {'hashed_password'}
+    MEDIA_TYPES = {
+        ExportFormat.NDJSON: 'application/x-ndjson',
+        ExportFormat.CSV: 'text/csv',
+    }
+
+    @staticmethod
+    def get_fields(service: BaseService) -> List[str]:
+        return [
+            field
+            for field in service.schemas.get_scheme.model_fields
+            if field not in Exporter.EXCLUDED_FIELDS
+        ]
+
+    @staticmethod
+    async def export(
+        service: BaseService, export_format: ExportFormat, fetch_size: int
+    ) -> AsyncIterator[str]:
+        fields = Exporter.get_fields(service=service)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if export_format == ExportFormat.CSV:
+            writer.writerow(fields)
+
+        async with session_maker() as session:
+            rows_in_buffer = 0
+            async for row in service.stream_all(session=session, fetch_size=fetch_size):
+                values = [getattr(row, field) for field in fields]
+                if export_format == ExportFormat.CSV:
+                    writer.writerow(values)
+                else:
+                    buffer.write(json.dumps(dict(zip(fields, values)), default=str))
+                    buffer.write('\n')
+
+                rows_in_buffer += 1
+                if rows_in_buffer >= fetch_size:
+                    yield Exporter._flush(buffer=buffer)
+                    rows_in_buffer = 0
+
+        if rows_in_buffer or export_format == ExportFormat.CSV:
+            yield Exporter._flush(buffer=buffer)
+
+    @staticmethod
+    def _flush(buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
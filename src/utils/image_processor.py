@@ -0,0 +1,126 @@
+import asyncio
+import contextlib
+import os
+import tempfile
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from src.config import settings
+from src.exceptions import ImageProcessorBusyException, InvalidImageException
+from src.schemas.image_schemas import IMAGE_EXTENSIONS, ImageFormat
+from src.utils.image_storage import ImageStorage
+from src.utils.metrics import IMAGE_PROCESSING_QUEUE_DEPTH
+from src.utils.request_timing import RequestTiming
+
+PIL_FORMATS = {
+    'JPEG': ImageFormat.JPEG,
+    'PNG': ImageFormat.PNG,
+    'WEBP': ImageFormat.WEBP,
+    'GIF': ImageFormat.GIF,
+}
+
+
+def save_atomically(image: Image.Image, path: str) -> None:
+    descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            image.save(file, format='WEBP', quality=80)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+
+
+def process_image(
+    source: str, original_stem: str, thumbnails: dict[int, str], max_pixels: int
+) -> dict | None:
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    warnings.simplefilter('error', Image.DecompressionBombWarning)
+    try:
+        with Image.open(source) as image:
+            image_format = PIL_FORMATS.get(image.format)
+            if image_format is None or image.width * image.height > max_pixels:
+                return None
+            image.verify()
+
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            width, height = image.size
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+
+            os.makedirs(os.path.dirname(original_stem), exist_ok=True)
+            for size, path in thumbnails.items():
+                thumbnail = image.copy()
+                thumbnail.thumbnail((size, size))
+                save_atomically(image=thumbnail, path=path)
+    except (
+        UnidentifiedImageError,
+        Image.DecompressionBombError,
+        Image.DecompressionBombWarning,
+        OSError,
+    ):
+        return None
+
+    os.replace(source, f'{original_stem}.{IMAGE_EXTENSIONS[image_format]}')
+    return {'width': width, 'height': height, 'format': image_format}
+
+
+class ImageProcessor:
+    _executor: Executor | None = None
+    _pending: int = 0
+
+    @classmethod
+    async def process(cls, source: str, digest: bytes) -> dict:
+        if cls._pending >= settings.IMAGE_MAX_QUEUE:
+            raise ImageProcessorBusyException
+
+        cls._pending += 1
+        IMAGE_PROCESSING_QUEUE_DEPTH.inc()
+        try:
+            with RequestTiming.measure(phase='image'):
+                metadata = await asyncio.get_running_loop().run_in_executor(
+                    cls._get_executor(),
+                    process_image,
+                    str(source),
+                    str(ImageStorage.get_path(digest=digest)),
+                    {
+                        size: str(ImageStorage.get_path(digest=digest, suffix=suffix))
+                        for size, suffix in cls.get_thumbnail_suffixes().items()
+                    },
+                    settings.IMAGE_MAX_PIXELS,
+                )
+        finally:
+            cls._pending -= 1
+            IMAGE_PROCESSING_QUEUE_DEPTH.dec()
+
+        if metadata is None:
+            raise InvalidImageException
+        return metadata
+
+    @staticmethod
+    def get_thumbnail_suffixes() -> dict[int, str]:
+        return {size: f'_{size}.webp' for size in settings.IMAGE_THUMBNAIL_SIZES}
+
+    @staticmethod
+    def get_original_suffix(image_format: ImageFormat) -> str:
+        return f'.{IMAGE_EXTENSIONS[image_format]}'
+
+    @classmethod
+    def queue_depth(cls) -> int:
+        return cls._pending
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        if not cls._executor:
+            cls._executor = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS)
+        return cls._executor
@@ -0,0 +1,73 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator
+
+from src.config import settings
+from src.exceptions import ImageTooLargeException, InvalidImageException
+
+
+class ImageStorage:
+    @staticmethod
+    def get_path(digest: bytes, suffix: str = '') -> Path:
+        return Path(settings.IMAGE_STORAGE_PATH) / ImageStorage._get_key(
+            digest=digest, suffix=suffix
+        )
+
+    @staticmethod
+    def get_url(digest: bytes, suffix: str = '') -> str:
+        return (
+            f'{settings.IMAGE_MEDIA_URL}/'
+            f'{ImageStorage._get_key(digest=digest, suffix=suffix)}'
+        )
+
+    @staticmethod
+    async def receive(chunks: AsyncIterator[bytes]) -> tuple[Path, bytes, int]:
+        temp_directory = Path(settings.IMAGE_STORAGE_PATH) / 'tmp'
+        await asyncio.to_thread(temp_directory.mkdir, parents=True, exist_ok=True)
+        file = await asyncio.to_thread(
+            tempfile.NamedTemporaryFile, dir=temp_directory, delete=False
+        )
+
+        digest = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > settings.IMAGE_MAX_SIZE:
+                    raise ImageTooLargeException
+                digest.update(chunk)
+                buffer += chunk
+                if len(buffer) >= settings.IMAGE_WRITE_BUFFER_SIZE:
+                    await asyncio.to_thread(file.write, buffer)
+                    buffer.clear()
+            if buffer:
+                await asyncio.to_thread(file.write, buffer)
+            await asyncio.to_thread(file.close)
+            if not size:
+                raise InvalidImageException
+        except BaseException:
+            await asyncio.to_thread(file.close)
+            await ImageStorage.discard(path=Path(file.name))
+            raise
+
+        return Path(file.name), digest.digest(), size
+
+    @staticmethod
+    async def discard(path: Path) -> None:
+        await asyncio.to_thread(ImageStorage._unlink, path)
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _get_key(digest: bytes, suffix: str) -> str:
+        hex_digest = digest.hex()
+        return f'{hex_digest[:2]}/{hex_digest[2:4]}/{hex_digest}{suffix}'
@@ -0,0 +1,82 @@
+import os
+from contextvars import ContextVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+current_method_var: ContextVar[str] = ContextVar('current_method', default='unknown')
+
+HTTP_REQUEST_DURATION = Histogram(
+    'stuffr_http_request_duration_seconds',
+    'HTTP request latency by route template',
+    ['method', 'route'],
+)
+HTTP_REQUESTS = Counter(
+    'stuffr_http_requests_total',
+    'HTTP requests by route template and status code',
+    ['method', 'route', 'status_code'],
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    'stuffr_http_requests_in_flight',
+    'HTTP requests currently being handled',
+    ['method', 'route'],
+    multiprocess_mode='livesum',
+)
+SQL_QUERY_DURATION = Histogram(
+    'stuffr_sql_query_duration_seconds',
+    'SQL statement latency by repository method',
+    ['method'],
+)
+SQL_QUERIES = Counter(
+    'stuffr_sql_queries_total',
+    'SQL statements by repository method',
+    ['method'],
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    'stuffr_db_pool_checkout_wait_seconds',
+    'Time spent waiting for a pooled connection',
+    ['pool'],
+)
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    'stuffr_password_hash_queue_depth',
+    'Password hashing calls queued or running',
+    multiprocess_mode='livesum',
+)
+
+IMAGE_PROCESSING_QUEUE_DEPTH = Gauge(
+    'stuffr_image_processing_queue_depth',
+    'Image processing calls queued or running',
+    multiprocess_mode='livesum',
+)
+TOKEN_REFRESHES = Counter(
+    'stuffr_token_refreshes_total',
+    'Access token refreshes in get_current_principal by result',
+    ['result'],
+)
+
+
+class Metrics:
+    @staticmethod
+    def is_multiprocess() -> bool:
+        return bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+    @staticmethod
+    def render() -> tuple[bytes, str]:
+        registry = REGISTRY
+        if Metrics.is_multiprocess():
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    @staticmethod
+    def shutdown() -> None:
+        if Metrics.is_multiprocess():
+            multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,31 @@
+import base64
+import json
+
+from src.exceptions import InvalidCursorException
+
+
+def encode_cursor(value: int | str) -> str:
+    raw = json.dumps({'id': value if isinstance(value, int) else str(value)})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int | str:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))['id']
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorException
+
+
+def encode_rank_cursor(rank: float, value: int | str) -> str:
+    raw = json.dumps(
+        {'rank': rank, 'id': value if isinstance(value, int) else str(value)}
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int | str]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(payload['rank']), payload['id']
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorException
@@ -1,7 +1,18 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
 import bcrypt
 
+from src.config import settings
+from src.exceptions import PasswordHasherBusyException
+from src.utils.metrics import PASSWORD_HASH_QUEUE_DEPTH
+from src.utils.request_timing import RequestTiming
+
 
 class PasswordManager:
+    _executor: Executor | None = None
+    _pending: int = 0
+
     @staticmethod
     def get_password_hash(password: str) -> bytes:
         return bcrypt.hashpw(password=password.encode(), salt=bcrypt.gensalt())
@@ -11,3 +22,48 @@ class PasswordManager:
         return bcrypt.checkpw(
             password=password.encode(), hashed_password=hashed.encode()
         )
+
+    @classmethod
+    async def get_password_hash_async(cls, password: str) -> bytes:
+        return await cls._run(bcrypt.hashpw, password.encode(), bcrypt.gensalt())
+
+    @classmethod
+    async def check_password_hash_async(cls, password: str, hashed: str) -> bool:
+        return await cls._run(bcrypt.checkpw, password.encode(), hashed.encode())
+
+    @classmethod
+    def queue_depth(cls) -> int:
+        return cls._pending
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+
+    @classmethod
+    async def _run(cls, func, *args):
+        if cls._pending >= settings.PASSWORD_HASH_MAX_QUEUE:
+            raise PasswordHasherBusyException
+
+        cls._pending += 1
+        PASSWORD_HASH_QUEUE_DEPTH.inc()
+        try:
+            with RequestTiming.measure(phase='hash'):
+                return await asyncio.get_running_loop().run_in_executor(
+                    cls._get_executor(), func, *args
+                )
+        finally:
+            cls._pending -= 1
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        if not cls._executor:
+            executor_class = (
+                ProcessPoolExecutor
+                if settings.PASSWORD_HASH_EXECUTOR == 'process'
+                else ThreadPoolExecutor
+            )
+            cls._executor = executor_class(max_workers=settings.PASSWORD_HASH_WORKERS)
+        return cls._executor
@@ -0,0 +1,36 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.user_model import User
+
+
+class Principal:
+    def __init__(
+        self,
+        user_id: str,
+        role_id: int,
+        token_version: int,
+        session: AsyncSession,
+        user: User | None = None,
+    ):
+        self.id: str = user_id
+        self.role_id: int = role_id
+        self.token_version: int = token_version
+        self._session: AsyncSession = session
+        self._user: User | None = user
+
+    @classmethod
+    def from_payload(
+        cls, payload: dict, session: AsyncSession, user: User | None = None
+    ) -> 'Principal':
+        return cls(
+            user_id=payload['sub'],
+            role_id=payload.get('role_id', 1),
+            token_version=payload.get('ver', 0),
+            session=session,
+            user=user,
+        )
+
+    async def get_user(self) -> User | None:
+        if self._user is None:
+            self._user = await self._session.get(User, self.id)
+        return self._user
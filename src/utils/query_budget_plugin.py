@@ -0,0 +1,15 @@
+from contextlib import contextmanager
+
+import pytest
+
+from src.utils.query_counter import QueryCounter
+
+
+@pytest.fixture
+def query_budget():
+    @contextmanager
+    def budget(max_queries: int):
+        with QueryCounter(max_queries=max_queries, global_scope=True) as counter:
+            yield counter
+
+    return budget
@@ -0,0 +1,69 @@
+from collections import Counter
+from contextvars import ContextVar
+
+query_counter_var: ContextVar['QueryCounter | None'] = ContextVar(
+    'query_counter', default=None
+)
+
+
+class QueryBudgetExceededError(AssertionError):
+    pass
+
+
+class QueryCounter:
+    _global_counters: list['QueryCounter'] = []
+
+    def __init__(self, max_queries: int | None = None, global_scope: bool = False):
+        self.max_queries: int | None = max_queries
+        self.global_scope: bool = global_scope
+        self.statements: list[str] = []
+        self._parent: QueryCounter | None = None
+        self._token = None
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def record(self, statement: str) -> None:
+        counter = self
+        while counter is not None:
+            counter.statements.append(statement)
+            counter = counter._parent
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {
+            statement: count
+            for statement, count in Counter(self.statements).items()
+            if count >= threshold
+        }
+
+    def check(self) -> None:
+        if self.max_queries is not None and self.count > self.max_queries:
+            raise QueryBudgetExceededError(
+                f'Expected at most {self.max_queries} queries, got {self.count}:\n'
+                + '\n'.join(self.statements)
+            )
+
+    def __enter__(self) -> 'QueryCounter':
+        if self.global_scope:
+            QueryCounter._global_counters.append(self)
+        else:
+            self._parent = query_counter_var.get()
+            self._token = query_counter_var.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.global_scope:
+            QueryCounter._global_counters.remove(self)
+        else:
+            query_counter_var.reset(self._token)
+        if exc_type is None:
+            self.check()
+
+    @staticmethod
+    def record_statement(statement: str) -> None:
+        counter = query_counter_var.get()
+        if counter is not None:
+            counter.record(statement=statement)
+        for global_counter in QueryCounter._global_counters:
+            global_counter.record(statement=statement)
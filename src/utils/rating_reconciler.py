@@ -0,0 +1,62 @@
+import asyncio
+
+from src.config import settings
+from src.database.advisory_lock import advisory_lock
+from src.database.database import session_maker
+from src.database.models.user_model import User
+from src.logging import logger
+from src.repositories.user_repository import get_user_repository
+from src.utils.entity_cache import EntityCache
+
+
+class RatingReconciler:
+    LOCK_KEY = 0x53540002
+    _task: asyncio.Task | None = None
+
+    @staticmethod
+    async def reconcile() -> int:
+        repository = get_user_repository()
+        after_id = None
+        total = 0
+        while True:
+            async with session_maker() as session:
+                after_id, updated = await repository.reconcile_ratings(
+                    session=session,
+                    after_id=after_id,
+                    batch_size=settings.RATING_RECONCILE_BATCH_SIZE,
+                )
+                await session.commit()
+            total += updated
+            if after_id is None:
+                break
+
+        if total:
+            await EntityCache.for_model(model=User).invalidate_all()
+        return total
+
+    @classmethod
+    def start(cls) -> None:
+        if not cls._task:
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            try:
+                async with advisory_lock(key=cls.LOCK_KEY) as acquired:
+                    if acquired:
+                        updated = await cls.reconcile()
+                        logger.info('Reconciled rating counters of %s users', updated)
+            except Exception:
+                logger.exception('Rating reconciliation failed')
+            await asyncio.sleep(settings.RATING_RECONCILE_INTERVAL)
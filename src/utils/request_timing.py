@@ -0,0 +1,59 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+request_timing_var: ContextVar['RequestTiming | None'] = ContextVar(
+    'request_timing', default=None
+)
+
+
+class RequestTiming:
+    def __init__(self):
+        self.start: float = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.db_queries: int = 0
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def total(self) -> float:
+        return time.perf_counter() - self.start
+
+    def as_dict(self) -> dict:
+        return {
+            **{
+                f'{phase}_ms': round(value * 1000, 3)
+                for phase, value in self.phases.items()
+            },
+            'db_queries': self.db_queries,
+            'total_ms': round(self.total() * 1000, 3),
+        }
+
+    def server_timing_header(self) -> str:
+        metrics = [
+            f'{phase};dur={value * 1000:.3f}' for phase, value in self.phases.items()
+        ]
+        if 'db' in self.phases:
+            metrics[list(self.phases).index('db')] += (
+                f';desc="{self.db_queries} queries"'
+            )
+        metrics.append(f'total;dur={self.total() * 1000:.3f}')
+        return ', '.join(metrics)
+
+    @staticmethod
+    def current() -> 'RequestTiming | None':
+        return request_timing_var.get()
+
+    @staticmethod
+    @contextmanager
+    def measure(phase: str):
+        timing = request_timing_var.get()
+        if timing is None:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing.add(phase=phase, seconds=time.perf_counter() - start)
@@ -0,0 +1,24 @@
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from src.utils.request_timing import RequestTiming
+
+
+class SchemeSerializer:
+    def __init__(self, scheme: Any):
+        self.adapter: TypeAdapter = TypeAdapter(scheme)
+
+    def to_json(self, obj: Any) -> bytes:
+        with RequestTiming.measure(phase='serialize'):
+            return self.adapter.dump_json(
+                self.adapter.validate_python(obj, from_attributes=True)
+            )
+
+    def to_response(self, obj: Any, status_code: int = 200) -> Response:
+        return Response(
+            content=self.to_json(obj=obj),
+            status_code=status_code,
+            media_type='application/json',
+        )
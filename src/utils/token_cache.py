@@ -0,0 +1,79 @@
+import heapq
+import time
+from collections import OrderedDict
+
+
+class TokenCache:
+    def __init__(self, max_size: int):
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._revoked: dict[str, float] = {}
+        self._revoked_expirations: list[tuple[float, str]] = []
+
+    def get(self, key: str) -> dict | None:
+        payload = self._entries.get(key)
+        if payload is None:
+            self.misses += 1
+            return None
+
+        if payload['exp'] <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(payload)
+
+    def put(self, key: str, payload: dict) -> None:
+        if not self.max_size or not isinstance(payload.get('exp'), (int, float)):
+            return
+
+        self._entries[key] = dict(payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def revoke(self, key: str, expires_at: float) -> None:
+        self._entries.pop(key, None)
+        self._purge_revoked()
+        if expires_at <= time.time():
+            return
+
+        self._revoked[key] = expires_at
+        heapq.heappush(self._revoked_expirations, (expires_at, key))
+
+    def is_revoked(self, key: str) -> bool:
+        expires_at = self._revoked.get(key)
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.time():
+            self._purge_revoked()
+            return False
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._revoked.clear()
+        self._revoked_expirations.clear()
+
+    def stats(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'revoked': len(self._revoked),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / requests if requests else 0.0,
+        }
+
+    def _purge_revoked(self) -> None:
+        now = time.time()
+        while self._revoked_expirations and self._revoked_expirations[0][0] <= now:
+            expires_at, key = heapq.heappop(self._revoked_expirations)
+            if self._revoked.get(key) == expires_at:
+                del self._revoked[key]
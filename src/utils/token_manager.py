@@ -1,32 +1,99 @@
-from datetime import datetime, timedelta
+import hashlib
+from datetime import datetime, timedelta, timezone
 
 import jwt
+from fastapi import Response
+from jwt.exceptions import InvalidTokenError
+from uuid_extensions import uuid7
 
 from src.config import settings
+from src.utils.request_timing import RequestTiming
+from src.utils.token_cache import TokenCache
+
+
+class TokenRevokedError(InvalidTokenError):
+    pass
 
 
 class TokenManager:
+    token_cache = TokenCache(max_size=settings.TOKEN_CACHE_SIZE)
+
+    @staticmethod
+    def get_claims(user) -> dict:
+        return {
+            'sub': str(user.id),
+            'role_id': user.role_id,
+            'ver': user.token_version,
+        }
+
     @staticmethod
     def get_tokens(payload: dict) -> tuple[str, str]:
-        payload['exp'] = datetime.now() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRATION
-        )
-        access_token = jwt.encode(
-            payload, settings.TOKEN_SECRET, algorithm=settings.TOKEN_ALGORITHM
+        with RequestTiming.measure(phase='token'):
+            payload['exp'] = datetime.now() + timedelta(
+                minutes=settings.ACCESS_TOKEN_EXPIRATION
+            )
+            access_token = jwt.encode(
+                payload, settings.TOKEN_SECRET, algorithm=settings.TOKEN_ALGORITHM
+            )
+            payload['exp'] = datetime.now() + timedelta(
+                days=settings.REFRESH_TOKEN_EXPIRATION
+            )
+            payload['jti'] = str(uuid7())
+            refresh_token = jwt.encode(
+                payload, settings.TOKEN_SECRET, algorithm=settings.TOKEN_ALGORITHM
+            )
+            return access_token, refresh_token
+
+    @staticmethod
+    def decode_token(token: str):
+        with RequestTiming.measure(phase='token'):
+            key = TokenManager.hash_token(token=token)
+            if TokenManager.token_cache.is_revoked(key=key):
+                raise TokenRevokedError('Token has been revoked')
+            payload = TokenManager.token_cache.get(key=key)
+            if payload is None:
+                payload = jwt.decode(
+                    token,
+                    settings.TOKEN_SECRET,
+                    algorithm=settings.TOKEN_ALGORITHM,
+                    algorithms=[settings.TOKEN_ALGORITHM],
+                )
+                TokenManager.token_cache.put(key=key, payload=payload)
+            return payload
+
+    @staticmethod
+    def revoke_token(token: str):
+        try:
+            expires_at = TokenManager.get_expiration(token=token)
+        except (InvalidTokenError, KeyError):
+            return
+        TokenManager.token_cache.revoke(
+            key=TokenManager.hash_token(token=token),
+            expires_at=expires_at.timestamp(),
         )
-        payload['exp'] = datetime.now() + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRATION
+
+    @staticmethod
+    def set_cookies(response: Response, access_token: str, refresh_token: str):
+        response.set_cookie(
+            key='stuffr_access',
+            value=access_token,
+            secure=True,
+            httponly=True,
+            samesite='strict',
         )
-        refresh_token = jwt.encode(
-            payload, settings.TOKEN_SECRET, algorithm=settings.TOKEN_ALGORITHM
+        response.set_cookie(
+            key='stuffr_refresh',
+            value=refresh_token,
+            secure=True,
+            httponly=True,
+            samesite='strict',
         )
-        return access_token, refresh_token
 
     @staticmethod
-    def decode_token(token: str):
-        return jwt.decode(
-            token,
-            settings.TOKEN_SECRET,
-            algorithm=settings.TOKEN_ALGORITHM,
-            algorithms=[settings.TOKEN_ALGORITHM],
-        )
+    def hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @staticmethod
+    def get_expiration(token: str) -> datetime:
+        payload = jwt.decode(token, options={'verify_signature': False})
+        return datetime.fromtimestamp(payload['exp'], tz=timezone.utc)
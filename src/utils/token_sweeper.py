@@ -0,0 +1,54 @@
+import asyncio
+
+from src.config import settings
+from src.database.advisory_lock import advisory_lock
+from src.database.database import session_maker
+from src.logging import logger
+from src.services.refresh_token_service import get_refresh_token_service
+
+
+class TokenSweeper:
+    LOCK_KEY = 0x53540001
+    _task: asyncio.Task | None = None
+
+    @staticmethod
+    async def sweep() -> int:
+        service = get_refresh_token_service()
+        total = 0
+        while True:
+            async with session_maker() as session:
+                deleted = await service.delete_expired(
+                    batch_size=settings.REFRESH_TOKEN_SWEEP_BATCH_SIZE,
+                    session=session,
+                )
+                await session.commit()
+            total += deleted
+            if deleted < settings.REFRESH_TOKEN_SWEEP_BATCH_SIZE:
+                return total
+
+    @classmethod
+    def start(cls) -> None:
+        if not cls._task:
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            try:
+                async with advisory_lock(key=cls.LOCK_KEY) as acquired:
+                    if acquired:
+                        deleted = await cls.sweep()
+                        logger.info('Deleted %s expired refresh tokens', deleted)
+            except Exception:
+                logger.exception('Refresh token sweep failed')
+            await asyncio.sleep(settings.REFRESH_TOKEN_SWEEP_INTERVAL)
@@ -0,0 +1,75 @@
+import reprlib
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class MethodStats:
+    __slots__ = ('calls', 'total_time', 'max_time')
+
+    def __init__(self):
+        self.calls: int = 0
+        self.total_time: float = 0.0
+        self.max_time: float = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            'calls': self.calls,
+            'total_ms': self.total_time * 1000,
+            'avg_ms': self.total_time * 1000 / self.calls if self.calls else 0.0,
+            'max_ms': self.max_time * 1000,
+        }
+
+
+class Tracer:
+    _stats: dict[str, MethodStats] = {}
+
+    @classmethod
+    def record(cls, name: str, seconds: float) -> None:
+        stats = cls._stats.get(name)
+        if stats is None:
+            stats = cls._stats[name] = MethodStats()
+        stats.calls += 1
+        stats.total_time += seconds
+        if seconds > stats.max_time:
+            stats.max_time = seconds
+
+    @classmethod
+    def snapshot(cls) -> dict[str, dict]:
+        return {name: stats.snapshot() for name, stats in cls._stats.items()}
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._stats.clear()
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+
+class ArgumentsRepr(reprlib.Repr):
+    def __init__(self):
+        super().__init__()
+        self.maxstring = 80
+        self.maxother = 80
+        self.maxlist = 5
+        self.maxdict = 5
+
+
+class LazyArguments:
+    _repr = ArgumentsRepr()
+
+    def __init__(self, args: tuple, kwargs: dict):
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return ', '.join(
+            [self._format(value) for value in self.args[1:]]
+            + [f'{key}={self._format(value)}' for key, value in self.kwargs.items()]
+        )
+
+    def _format(self, value) -> str:
+        if isinstance(value, AsyncSession):
+            return '<AsyncSession>'
+        return self._repr.repr(value)
@@ -0,0 +1,172 @@
+import asyncio
+import io
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+from sqlalchemy import insert, text, update
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.config import settings
+from src.database.database import session_maker
+from src.database.models.announcement_model import Announcement
+from src.database.models.base_model import BaseModel
+from src.database.models.category_model import Category
+from src.database.models.role_model import Role
+from src.database.models.user_model import User
+from src.main import app
+from src.services.reference_data_service import ReferenceDataService
+from src.utils.entity_cache import EntityCache
+from src.utils.rating_reconciler import RatingReconciler
+from src.utils.token_manager import TokenManager
+from src.utils.token_sweeper import TokenSweeper
+
+ROLES = [{'id': 1, 'name': 'Пользователь'}, {'id': 2, 'name': 'Менеджер'}]
+CATEGORIES = [{'id': 1, 'title': 'Электроника'}, {'id': 2, 'title': 'Спорт'}]
+TRUNCATED_TABLES = (
+    'announcement_image',
+    'image',
+    'review',
+    'announcement',
+    'refresh_token',
+    '"user"',
+)
+PASSWORD = 'password123'
+
+
+async def create_schema() -> None:
+    schema_engine = create_async_engine(settings.POSTGRES_URL, poolclass=NullPool)
+    async with schema_engine.begin() as connection:
+        await connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        await connection.run_sync(BaseModel.metadata.drop_all)
+        await connection.run_sync(BaseModel.metadata.create_all)
+        await connection.execute(insert(Role), ROLES)
+        await connection.execute(insert(Category), CATEGORIES)
+    await schema_engine.dispose()
+
+
+@pytest.fixture(scope='session')
+def client():
+    asyncio.run(create_schema())
+    with TestClient(app, base_url='https://testserver') as test_client:
+        test_client.portal.call(ReferenceDataService.stop)
+        test_client.portal.call(TokenSweeper.stop)
+        test_client.portal.call(RatingReconciler.stop)
+        yield test_client
+
+
+@pytest.fixture
+def run_db(client):
+    def run(callback):
+        async def run_in_session():
+            async with session_maker(info={'use_primary': True}) as session:
+                result = await callback(session)
+                await session.commit()
+                return result
+
+        return client.portal.call(run_in_session)
+
+    return run
+
+
+@pytest.fixture(autouse=True)
+def clean_state(client, run_db):
+    yield
+    run_db(
+        lambda session: session.execute(
+            text(f'TRUNCATE {", ".join(TRUNCATED_TABLES)} CASCADE')
+        )
+    )
+    for cache in EntityCache._caches.values():
+        client.portal.call(cache.invalidate_all)
+    TokenManager.token_cache.clear()
+    client.cookies.clear()
+
+
+@pytest.fixture
+def register_user(client):
+    def register(name: str = 'Tester') -> dict:
+        client.cookies.clear()
+        response = client.post(
+            '/user/register',
+            json={
+                'name': name,
+                'email': f'{uuid.uuid4().hex}@example.com',
+                'password': PASSWORD,
+            },
+        )
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return register
+
+
+@pytest.fixture
+def login_user(client):
+    def login(email: str) -> dict:
+        client.cookies.clear()
+        response = client.post(
+            '/user/login', json={'email': email, 'password': PASSWORD}
+        )
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return login
+
+
+@pytest.fixture
+def admin_user(register_user, login_user, run_db):
+    user = register_user(name='Admin')
+    run_db(
+        lambda session: session.execute(
+            update(User).where(User.id == user['id']).values(role_id=2)
+        )
+    )
+    return login_user(email=user['email'])
+
+
+def set_cookie(client: TestClient, name: str, value: str) -> None:
+    for cookie in list(client.cookies.jar):
+        if cookie.name == name:
+            client.cookies.delete(name, domain=cookie.domain, path=cookie.path)
+    client.cookies.set(name, value, domain='testserver.local')
+
+
+def expired_access_token(client: TestClient) -> str:
+    claims = TokenManager.decode_token(token=client.cookies['stuffr_refresh'])
+    claims.pop('jti', None)
+    claims['exp'] = datetime.now(tz=timezone.utc) - timedelta(minutes=1)
+    return jwt.encode(claims, settings.TOKEN_SECRET, algorithm=settings.TOKEN_ALGORITHM)
+
+
+def png_bytes(width: int = 64, height: int = 48, color: str = 'red') -> bytes:
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), color=color).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def create_announcement(run_db):
+    def create(user_id: str, **values) -> str:
+        return run_db(
+            lambda session: session.scalar(
+                insert(Announcement)
+                .values(
+                    **{
+                        'title': 'Велосипед',
+                        'description': 'Горный велосипед',
+                        'user_id': user_id,
+                        'category_id': 1,
+                        'status': 'PUBLISHED',
+                        **values,
+                    }
+                )
+                .returning(Announcement.id)
+            )
+        )
+
+    return create
@@ -0,0 +1,78 @@
+from sqlalchemy import func, select
+
+from src.config import settings
+from src.database.models.user_model import User
+from src.repositories.user_repository import get_user_repository
+from src.schemas.user_schemas import CreateUserScheme
+
+
+def make_users(*emails: str, name: str = 'Tester') -> list[CreateUserScheme]:
+    return [
+        CreateUserScheme(name=name, email=email, hashed_password='hash')
+        for email in emails
+    ]
+
+
+def get_users(run_db) -> list[tuple]:
+    return run_db(
+        lambda session: session.execute(
+            select(User.email, User.name, User.role_id).order_by(User.email)
+        )
+    ).all()
+
+
+def test_add_many_uses_copy_above_threshold(run_db, monkeypatch):
+    monkeypatch.setattr(settings, 'BULK_COPY_THRESHOLD', 2)
+    emails = [f'user{index}@example.com' for index in range(3)]
+
+    result = run_db(
+        lambda session: get_user_repository().add_many(
+            entities=make_users(*emails), session=session
+        )
+    )
+
+    assert result is None
+    assert get_users(run_db) == [(email, 'Tester', 1) for email in emails]
+
+
+def test_add_many_returns_rows_below_threshold(run_db):
+    users = run_db(
+        lambda session: get_user_repository().add_many(
+            entities=make_users('first@example.com', 'second@example.com'),
+            session=session,
+            returning=True,
+        )
+    )
+
+    assert sorted(user.email for user in users) == [
+        'first@example.com',
+        'second@example.com',
+    ]
+    assert all(user.id is not None for user in users)
+
+
+def test_upsert_many_matches_natural_key(run_db):
+    repository = get_user_repository()
+    run_db(
+        lambda session: repository.add_many(
+            entities=make_users('Buyer@example.com'), session=session
+        )
+    )
+
+    users = run_db(
+        lambda session: repository.upsert_many(
+            entities=make_users(
+                'buyer@example.com', 'seller@example.com', name='Renamed'
+            ),
+            session=session,
+            conflict_elements=[func.lower(User.email)],
+            update_columns=['name'],
+            returning=True,
+        )
+    )
+
+    assert len(users) == 2
+    assert get_users(run_db) == [
+        ('Buyer@example.com', 'Renamed', 1),
+        ('seller@example.com', 'Renamed', 1),
+    ]
@@ -0,0 +1,135 @@
+import uuid
+
+import pydantic
+
+from src.database.database import session_maker
+from src.schemas.user_schemas import UpdateUserScheme
+from src.services.announcement_service import get_announcement_service
+from src.services.user_service import get_user_service
+from src.utils.entity_cache import EntityCache
+
+
+class AnnouncementRow(pydantic.BaseModel):
+    id: uuid.UUID
+    title: str
+    description: str
+    user_id: uuid.UUID
+    category_id: int
+    status: str = 'PUBLISHED'
+
+
+def update_scheme(user: dict, name: str) -> UpdateUserScheme:
+    return UpdateUserScheme(name=name, email=user['email'])
+
+
+def test_get_one_fills_cache_without_credentials(client, register_user):
+    user = register_user()
+    user_service = get_user_service()
+
+    async def scenario():
+        async with session_maker() as session:
+            await user_service.get_one(entity_id=user['id'], session=session)
+        async with session_maker() as session:
+            cached_user = await user_service.cache.get(entity_id=user['id'])
+            merged_user = await user_service.get_one(
+                entity_id=user['id'], session=session
+            )
+        return cached_user, merged_user
+
+    cached_user, merged_user = client.portal.call(scenario)
+
+    assert cached_user is not None
+    assert 'hashed_password' not in cached_user.__dict__
+    assert str(merged_user.id) == user['id']
+
+
+def test_update_invalidates_only_after_commit(client, register_user):
+    user = register_user()
+    user_service = get_user_service()
+
+    async def scenario():
+        async with session_maker() as session:
+            await user_service.get_one(entity_id=user['id'], session=session)
+        async with session_maker() as session:
+            await user_service.update(
+                entity_id=user['id'],
+                entity=update_scheme(user=user, name='Renamed'),
+                session=session,
+            )
+            before_commit = await user_service.cache.get(entity_id=user['id'])
+            await session.commit()
+            await EntityCache.run_committed_invalidations(session=session)
+        after_commit = await user_service.cache.get(entity_id=user['id'])
+        async with session_maker() as session:
+            reloaded_user = await user_service.get_one(
+                entity_id=user['id'], session=session
+            )
+        return before_commit, after_commit, reloaded_user
+
+    before_commit, after_commit, reloaded_user = client.portal.call(scenario)
+
+    assert before_commit is not None
+    assert after_commit is None
+    assert reloaded_user.name == 'Renamed'
+
+
+def test_rollback_keeps_cache(client, register_user):
+    user = register_user()
+    user_service = get_user_service()
+
+    async def scenario():
+        async with session_maker() as session:
+            await user_service.get_one(entity_id=user['id'], session=session)
+        async with session_maker() as session:
+            await user_service.update(
+                entity_id=user['id'],
+                entity=update_scheme(user=user, name='Rolled'),
+                session=session,
+            )
+            await session.rollback()
+            await EntityCache.run_committed_invalidations(session=session)
+            return await user_service.cache.get(entity_id=user['id'])
+
+    cached_user = client.portal.call(scenario)
+
+    assert cached_user is not None
+    assert cached_user.name == 'Tester'
+
+
+def test_upsert_many_invalidates_updated_rows(
+    client, register_user, create_announcement
+):
+    user = register_user()
+    announcement_id = create_announcement(user_id=user['id'])
+    announcement_service = get_announcement_service()
+
+    async def scenario():
+        async with session_maker() as session:
+            await announcement_service.get_one(
+                entity_id=announcement_id, session=session
+            )
+        async with session_maker() as session:
+            await announcement_service.upsert_many(
+                entities=[
+                    AnnouncementRow(
+                        id=announcement_id,
+                        title='Самокат',
+                        description='Городской самокат',
+                        user_id=user['id'],
+                        category_id=1,
+                    )
+                ],
+                session=session,
+                conflict_elements=['id'],
+                returning=True,
+            )
+            await session.commit()
+            await EntityCache.run_committed_invalidations(session=session)
+        async with session_maker() as session:
+            return await announcement_service.get_one(
+                entity_id=announcement_id, session=session
+            )
+
+    announcement = client.portal.call(scenario)
+
+    assert announcement.title == 'Самокат'
@@ -0,0 +1,43 @@
+import csv
+import io
+import json
+
+
+def test_ndjson_export_streams_every_row(client, register_user, admin_user):
+    emails = {register_user()['email'] for _ in range(3)} | {admin_user['email']}
+    client.post(
+        '/user/login', json={'email': admin_user['email'], 'password': 'password123'}
+    )
+
+    response = client.get('/export/user', params={'fetch_size': 2})
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert 'user.ndjson' in response.headers['content-disposition']
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert {row['email'] for row in rows} == emails
+    assert all('hashed_password' not in row for row in rows)
+
+
+def test_csv_export_has_header(client, admin_user):
+    response = client.get('/export/user', params={'format': 'csv'})
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/csv')
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0][0] == 'id'
+    assert 'hashed_password' not in rows[0]
+    assert [row[rows[0].index('email')] for row in rows[1:]] == [admin_user['email']]
+
+
+def test_empty_csv_export_still_has_header(client, admin_user):
+    response = client.get('/export/review', params={'format': 'csv'})
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == ['id,text,score,user_to_id,user_from_id']
+
+
+def test_export_requires_admin(client, register_user):
+    assert client.get('/export/user').status_code == 401
+    register_user()
+    assert client.get('/export/user').status_code == 403
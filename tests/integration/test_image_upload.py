@@ -0,0 +1,104 @@
+from pathlib import Path
+
+from sqlalchemy import func, select
+
+from src.config import settings
+from src.database.database import engine
+from src.database.models.image_model import Image
+from src.utils.image_storage import ImageStorage
+from tests.integration.conftest import png_bytes
+
+
+def upload(client, announcement_id: str, content: bytes):
+    return client.post(f'/announcement/{announcement_id}/images', content=content)
+
+
+def count_images(run_db) -> int:
+    return run_db(lambda session: session.scalar(select(func.count(Image.hash))))
+
+
+def test_upload_stores_original_and_thumbnails(
+    client, register_user, create_announcement
+):
+    user = register_user()
+    announcement_id = create_announcement(user_id=user['id'])
+
+    response = upload(client, announcement_id, png_bytes(width=1000, height=500))
+
+    assert response.status_code == 201, response.text
+    body = response.json()
+    assert body['position'] == 0
+    assert (body['width'], body['height']) == (1000, 500)
+    assert set(body['thumbnails']) == {'200', '800'}
+    media_path = Path(settings.IMAGE_STORAGE_PATH)
+    for url in [body['url'], *body['thumbnails'].values()]:
+        key = url.removeprefix(f'{settings.IMAGE_MEDIA_URL}/')
+        assert (media_path / key).stat().st_size > 0
+    assert not list(media_path.glob('**/*.tmp'))
+    assert not list((media_path / 'tmp').iterdir())
+
+
+def test_same_image_is_stored_once(client, register_user, create_announcement, run_db):
+    user = register_user()
+    first_id = create_announcement(user_id=user['id'])
+    second_id = create_announcement(user_id=user['id'])
+
+    assert upload(client, first_id, png_bytes()).status_code == 201
+    response = upload(client, second_id, png_bytes())
+
+    assert response.status_code == 201
+    assert response.json()['position'] == 0
+    assert count_images(run_db) == 1
+
+
+def test_upload_releases_connection_while_streaming(
+    client, register_user, create_announcement, monkeypatch
+):
+    user = register_user()
+    announcement_id = create_announcement(user_id=user['id'])
+    checked_out = []
+    receive = ImageStorage.receive
+
+    async def receive_and_check(chunks):
+        checked_out.append(engine.pool.checkedout())
+        return await receive(chunks=chunks)
+
+    monkeypatch.setattr(ImageStorage, 'receive', receive_and_check)
+
+    assert upload(client, announcement_id, png_bytes()).status_code == 201
+    assert checked_out == [0]
+
+
+def test_upload_limit(client, register_user, create_announcement, monkeypatch):
+    monkeypatch.setattr(settings, 'IMAGE_MAX_PER_ANNOUNCEMENT', 1)
+    user = register_user()
+    announcement_id = create_announcement(user_id=user['id'])
+
+    assert upload(client, announcement_id, png_bytes()).status_code == 201
+    response = upload(client, announcement_id, png_bytes(color='blue'))
+
+    assert response.status_code == 409
+
+
+def test_upload_to_foreign_announcement_is_denied(
+    client, register_user, create_announcement
+):
+    owner = register_user(name='Owner')
+    announcement_id = create_announcement(user_id=owner['id'])
+    register_user(name='Stranger')
+
+    assert upload(client, announcement_id, png_bytes()).status_code == 403
+
+
+def test_upload_rejects_invalid_and_oversized_images(
+    client, register_user, create_announcement, run_db, monkeypatch
+):
+    user = register_user()
+    announcement_id = create_announcement(user_id=user['id'])
+
+    assert upload(client, announcement_id, b'not an image').status_code == 402
+    monkeypatch.setattr(settings, 'IMAGE_MAX_PIXELS', 100)
+    assert upload(client, announcement_id, png_bytes()).status_code == 402
+    monkeypatch.setattr(settings, 'IMAGE_MAX_SIZE', 10)
+    assert upload(client, announcement_id, png_bytes()).status_code == 413
+    assert count_images(run_db) == 0
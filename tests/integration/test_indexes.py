@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.exc import IntegrityError
+
+from src.database.models.user_model import User
+
+
+def get_indexes(run_db) -> dict[str, str]:
+    rows = run_db(
+        lambda session: session.execute(
+            text(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = 'public'"
+            )
+        )
+    )
+    return dict(rows.all())
+
+
+def test_lookup_and_foreign_key_indexes_exist(run_db):
+    indexes = get_indexes(run_db)
+
+    assert 'UNIQUE' in indexes['ix_user_email_lower']
+    assert 'lower' in indexes['ix_user_email_lower']
+    for name in (
+        'ix_announcement_user_id',
+        'ix_announcement_category_id',
+        'ix_review_user_to_id',
+    ):
+        assert name in indexes
+
+
+def test_primary_keys_have_no_duplicate_index(run_db):
+    indexes = get_indexes(run_db)
+
+    for name in ('ix_user_id', 'ix_announcement_id', 'ix_review_id', 'ix_role_id'):
+        assert name not in indexes
+
+
+def test_email_is_unique_ignoring_case(run_db):
+    run_db(
+        lambda session: session.execute(
+            insert(User).values(
+                name='Tester', email='Case@example.com', hashed_password='hash'
+            )
+        )
+    )
+
+    with pytest.raises(IntegrityError):
+        run_db(
+            lambda session: session.execute(
+                insert(User).values(
+                    name='Tester', email='case@EXAMPLE.com', hashed_password='hash'
+                )
+            )
+        )
+
+
+def test_login_ignores_email_case(client, register_user, login_user):
+    user = register_user()
+
+    assert login_user(email=user['email'].upper())['id'] == user['id']
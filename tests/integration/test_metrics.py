@@ -0,0 +1,48 @@
+from prometheus_client import REGISTRY
+
+from tests.integration.conftest import png_bytes
+
+UPLOAD_ROUTE = '/announcement/{announcement_id}/images'
+
+
+def get_sample(name: str, labels: dict) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_exposes_prometheus_text(client):
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+    assert 'stuffr_http_requests_total' in response.text
+    assert 'stuffr_db_pool_checkout_wait_seconds' in response.text
+
+
+def test_requests_are_labelled_by_route_template(client, register_user):
+    labels = {'method': 'POST', 'route': UPLOAD_ROUTE, 'status_code': '404'}
+    before = get_sample('stuffr_http_requests_total', labels)
+    register_user()
+
+    for _ in range(2):
+        client.post(
+            '/announcement/00000000-0000-0000-0000-000000000000/images',
+            content=png_bytes(),
+        )
+
+    assert get_sample('stuffr_http_requests_total', labels) - before == 2
+    assert (
+        get_sample(
+            'stuffr_http_requests_in_flight', {'method': 'POST', 'route': UPLOAD_ROUTE}
+        )
+        == 0
+    )
+    assert f'route="{UPLOAD_ROUTE}"' in client.get('/metrics').text
+
+
+def test_sql_queries_are_labelled_by_repository_method(client, register_user):
+    labels = {'method': 'UserRepository.create_if_absent'}
+    before = get_sample('stuffr_sql_queries_total', labels)
+
+    register_user()
+
+    assert get_sample('stuffr_sql_queries_total', labels) - before == 1
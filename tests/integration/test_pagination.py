@@ -0,0 +1,61 @@
+import pytest
+
+from src.config import settings
+from src.exceptions import InvalidCursorException
+from src.repositories.announcement_repository import get_announcement_repository
+
+
+def get_page(run_db, **kwargs):
+    return run_db(
+        lambda session: get_announcement_repository().get_page(
+            session=session, **kwargs
+        )
+    )
+
+
+def create_announcements(register_user, create_announcement, count: int) -> list:
+    user = register_user()
+    return [create_announcement(user_id=user['id']) for _ in range(count)]
+
+
+@pytest.mark.parametrize('descending', [True, False])
+def test_pages_cover_all_rows_once(
+    register_user, create_announcement, run_db, descending
+):
+    ids = create_announcements(register_user, create_announcement, count=5)
+
+    seen = []
+    cursor = None
+    while True:
+        page = get_page(run_db, limit=2, cursor=cursor, descending=descending)
+        seen.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == sorted(ids, reverse=descending)
+
+
+def test_page_applies_filters_and_limit_bounds(
+    register_user, create_announcement, run_db, monkeypatch
+):
+    monkeypatch.setattr(settings, 'PAGE_MAX_LIMIT', 3)
+    create_announcements(register_user, create_announcement, count=4)
+    other = register_user(name='Other')
+    create_announcement(user_id=other['id'])
+
+    page = get_page(run_db, limit=100, filters={'user_id': other['id']})
+    assert len(page.items) == 1
+    assert page.next_cursor is None
+
+    page = get_page(run_db, limit=100)
+    assert len(page.items) == 3
+    assert page.next_cursor is not None
+
+    page = get_page(run_db, limit=0, filters={'category_id': 1})
+    assert len(page.items) == 3
+
+
+def test_invalid_cursor_is_rejected(run_db):
+    with pytest.raises(InvalidCursorException):
+        get_page(run_db, cursor='broken')
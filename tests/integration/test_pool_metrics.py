@@ -0,0 +1,27 @@
+from src.config import settings
+from src.database.database import engine
+
+
+def test_engine_uses_configured_pool():
+    pool = engine.sync_engine.pool
+
+    assert pool.size() == settings.POSTGRES_POOL_SIZE
+    assert pool._max_overflow == settings.POSTGRES_MAX_OVERFLOW
+    assert pool._timeout == settings.POSTGRES_POOL_TIMEOUT
+    assert pool._recycle == settings.POSTGRES_POOL_RECYCLE
+
+
+def test_pool_metrics_report_checkouts(client, admin_user):
+    response = client.get('/metrics/pool')
+
+    assert response.status_code == 200
+    primary = response.json()['primary']
+    assert primary['size'] == settings.POSTGRES_POOL_SIZE
+    assert primary['checkouts'] > 0
+    assert sum(primary['checkout_latency_buckets'].values()) == primary['checkouts']
+
+
+def test_pool_metrics_require_admin(client, register_user):
+    register_user()
+
+    assert client.get('/metrics/pool').status_code == 403
@@ -0,0 +1,55 @@
+import pytest
+
+from src.utils.query_counter import QueryBudgetExceededError
+
+
+def test_register_budget(client, query_budget):
+    with query_budget(2):
+        response = client.post(
+            '/user/register',
+            json={
+                'name': 'Budget',
+                'email': 'budget@example.com',
+                'password': 'password123',
+            },
+        )
+    assert response.status_code == 200
+
+
+def test_login_budget(client, register_user, query_budget):
+    user = register_user()
+    client.cookies.clear()
+
+    with query_budget(2):
+        response = client.post(
+            '/user/login', json={'email': user['email'], 'password': 'password123'}
+        )
+    assert response.status_code == 200
+
+
+def test_authenticated_route_reads_principal_from_claims(
+    client, admin_user, query_budget
+):
+    with query_budget(0):
+        response = client.get('/metrics/token-cache')
+    assert response.status_code == 200
+
+
+def test_logout_budget(client, register_user, query_budget):
+    register_user()
+
+    with query_budget(1):
+        response = client.post('/user/logout')
+    assert response.status_code == 200
+
+
+def test_budget_fails_when_exceeded(client, register_user, query_budget):
+    user = register_user()
+    client.cookies.clear()
+
+    with pytest.raises(QueryBudgetExceededError):
+        with query_budget(1):
+            client.post(
+                '/user/login',
+                json={'email': user['email'], 'password': 'password123'},
+            )
@@ -0,0 +1,95 @@
+import asyncio
+
+from sqlalchemy import select, update
+
+from src.config import settings
+from src.database.database import session_maker
+from src.database.models.user_model import User
+from src.schemas.review_schemas import CreateReviewScheme
+from src.services.review_service import get_review_service
+from src.utils.rating_reconciler import RatingReconciler
+
+
+def get_counters(run_db, user_id: str) -> tuple:
+    return run_db(
+        lambda session: session.execute(
+            select(User.rating_sum, User.rating_count, User.rating).where(
+                User.id == user_id
+            )
+        )
+    ).one()
+
+
+def add_review(run_db, user_to_id: str, user_from_id: str, score: int):
+    return run_db(
+        lambda session: get_review_service().add(
+            entity=CreateReviewScheme(
+                score=score, user_to_id=user_to_id, user_from_id=user_from_id
+            ),
+            session=session,
+        )
+    )
+
+
+def test_reviews_update_rating_counters(register_user, run_db):
+    seller = register_user(name='Seller')
+    buyer = register_user(name='Buyer')
+
+    add_review(run_db, seller['id'], buyer['id'], score=5)
+    review = add_review(run_db, seller['id'], buyer['id'], score=2)
+    assert get_counters(run_db, seller['id']) == (7, 2, 3.5)
+
+    run_db(
+        lambda session: get_review_service().delete(
+            entity_id=review.id, session=session
+        )
+    )
+    assert get_counters(run_db, seller['id']) == (5, 1, 5.0)
+
+
+def test_reconcile_fixes_drifted_counters(client, register_user, run_db, monkeypatch):
+    monkeypatch.setattr(settings, 'RATING_RECONCILE_BATCH_SIZE', 1)
+    seller = register_user(name='Seller')
+    buyer = register_user(name='Buyer')
+    add_review(run_db, seller['id'], buyer['id'], score=4)
+    run_db(
+        lambda session: session.execute(
+            update(User)
+            .where(User.id.in_([seller['id'], buyer['id']]))
+            .values(rating_sum=9, rating_count=3, rating=3.0)
+        )
+    )
+
+    assert client.portal.call(RatingReconciler.reconcile) == 2
+    assert get_counters(run_db, seller['id']) == (4, 1, 4.0)
+    assert get_counters(run_db, buyer['id']) == (0, 0, None)
+    assert client.portal.call(RatingReconciler.reconcile) == 0
+
+
+def test_reconcile_waits_for_concurrent_review(client, register_user, run_db):
+    seller = register_user(name='Seller')
+    buyer = register_user(name='Buyer')
+    add_review(run_db, seller['id'], buyer['id'], score=4)
+    run_db(
+        lambda session: session.execute(
+            update(User)
+            .where(User.id == seller['id'])
+            .values(rating_sum=9, rating_count=3, rating=3.0)
+        )
+    )
+
+    async def review_during_reconcile():
+        async with session_maker(info={'use_primary': True}) as session:
+            await get_review_service().add(
+                entity=CreateReviewScheme(
+                    score=3, user_to_id=seller['id'], user_from_id=buyer['id']
+                ),
+                session=session,
+            )
+            reconcile = asyncio.create_task(RatingReconciler.reconcile())
+            await asyncio.sleep(0.2)
+            await session.commit()
+        return await reconcile
+
+    assert client.portal.call(review_during_reconcile) == 1
+    assert get_counters(run_db, seller['id']) == (7, 2, 3.5)
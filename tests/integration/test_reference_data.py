@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from sqlalchemy import delete, func, insert, select
+
+from src.database.database import session_maker
+from src.database.models.category_model import Category
+from src.exceptions import CategoryDoesNotExistsException, RoleDoesNotExistsException
+from src.services.reference_data_service import ReferenceDataService
+
+
+@pytest.fixture
+def extra_category(client, run_db):
+    yield
+    run_db(lambda session: session.execute(delete(Category).where(Category.id == 3)))
+    client.portal.call(ReferenceDataService.load)
+
+
+def add_category(run_db) -> None:
+    run_db(
+        lambda session: session.execute(insert(Category).values(id=3, title='Одежда'))
+    )
+
+
+def test_categories_are_served_from_memory(client, query_budget):
+    with query_budget(max_queries=0):
+        response = client.get('/category')
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {'id': 1, 'title': 'Электроника'},
+        {'id': 2, 'title': 'Спорт'},
+    ]
+
+
+def test_validation_uses_loaded_data():
+    assert ReferenceDataService.validate_role(role_id=2).name == 'Менеджер'
+    assert ReferenceDataService.validate_category(category_id=1).title == 'Электроника'
+    with pytest.raises(RoleDoesNotExistsException):
+        ReferenceDataService.validate_role(role_id=99)
+    with pytest.raises(CategoryDoesNotExistsException):
+        ReferenceDataService.validate_category(category_id=99)
+
+
+def test_load_picks_up_new_rows(client, run_db, extra_category):
+    add_category(run_db)
+    assert ReferenceDataService.get_category(category_id=3) is None
+
+    client.portal.call(ReferenceDataService.load)
+
+    assert ReferenceDataService.get_category(category_id=3).title == 'Одежда'
+
+
+def test_notification_triggers_reload(client, extra_category):
+    async def reload_on_notify():
+        await ReferenceDataService.start()
+        try:
+            while not (
+                ReferenceDataService._reload_task
+                and ReferenceDataService._reload_task.done()
+            ):
+                await asyncio.sleep(0.01)
+            async with session_maker(info={'use_primary': True}) as session:
+                await session.execute(insert(Category).values(id=3, title='Одежда'))
+                await session.execute(
+                    select(func.pg_notify(ReferenceDataService.CHANNEL, ''))
+                )
+                await session.commit()
+            async with asyncio.timeout(5):
+                while ReferenceDataService.get_category(category_id=3) is None:
+                    await asyncio.sleep(0.05)
+        finally:
+            await ReferenceDataService.stop()
+
+    client.portal.call(reload_on_notify)
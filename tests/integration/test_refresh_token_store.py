@@ -0,0 +1,59 @@
+from sqlalchemy import func, select, update
+
+from src.config import settings
+from src.database.models.refresh_token_model import RefreshToken
+from src.utils.token_sweeper import TokenSweeper
+
+
+def count_tokens(run_db, user_id: str, active: bool = False) -> int:
+    query = select(func.count()).where(RefreshToken.user_id == user_id)
+    if active:
+        query = query.where(RefreshToken.rotated_at.is_(None))
+    return run_db(lambda session: session.scalar(query))
+
+
+def test_login_stores_one_token_per_session(register_user, login_user, run_db):
+    user = register_user()
+    login_user(email=user['email'])
+
+    assert count_tokens(run_db, user['id']) == 2
+
+
+def test_tokens_per_user_are_capped(register_user, login_user, run_db, monkeypatch):
+    monkeypatch.setattr(settings, 'REFRESH_TOKEN_MAX_PER_USER', 2)
+    user = register_user()
+    for _ in range(3):
+        login_user(email=user['email'])
+
+    assert count_tokens(run_db, user['id'], active=True) == 2
+
+
+def test_sweeper_deletes_expired_and_rotated_tokens(
+    client, register_user, login_user, run_db, monkeypatch
+):
+    monkeypatch.setattr(settings, 'REFRESH_TOKEN_SWEEP_BATCH_SIZE', 1)
+    user = register_user()
+    for _ in range(2):
+        login_user(email=user['email'])
+    hashes = run_db(
+        lambda session: session.scalars(
+            select(RefreshToken.token_hash).where(RefreshToken.user_id == user['id'])
+        )
+    ).all()
+    run_db(
+        lambda session: session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_hash == hashes[0])
+            .values(expires_at=func.now() - func.make_interval(0, 0, 0, 1))
+        )
+    )
+    run_db(
+        lambda session: session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_hash == hashes[1])
+            .values(rotated_at=func.now() - func.make_interval(0, 0, 0, 1))
+        )
+    )
+
+    assert client.portal.call(TokenSweeper.sweep) == 2
+    assert count_tokens(run_db, user['id']) == 1
@@ -0,0 +1,147 @@
+import jwt
+from sqlalchemy import func, select
+
+from src.config import settings
+from src.database.models.refresh_token_model import RefreshToken
+from tests.integration.conftest import expired_access_token, png_bytes, set_cookie
+
+
+def count_family_tokens(run_db, refresh_token: str) -> int:
+    family_id = jwt.decode(refresh_token, options={'verify_signature': False})['fam']
+    return run_db(
+        lambda session: session.scalar(
+            select(func.count()).where(RefreshToken.family_id == family_id)
+        )
+    )
+
+
+def test_expired_access_token_is_refreshed(client, admin_user):
+    old_refresh = client.cookies['stuffr_refresh']
+    set_cookie(client, 'stuffr_access', expired_access_token(client))
+
+    response = client.get('/metrics/token-cache')
+
+    assert response.status_code == 200
+    assert client.cookies['stuffr_refresh'] != old_refresh
+    assert client.get('/metrics/token-cache').status_code == 200
+
+
+def test_upload_with_expired_access_token_rotates_cookies(
+    client, register_user, create_announcement, monkeypatch
+):
+    user = register_user()
+    announcement_id = create_announcement(user_id=user['id'])
+    old_refresh = client.cookies['stuffr_refresh']
+    set_cookie(client, 'stuffr_access', expired_access_token(client))
+
+    response = client.post(
+        f'/announcement/{announcement_id}/images', content=png_bytes()
+    )
+
+    assert response.status_code == 201, response.text
+    assert {'stuffr_access', 'stuffr_refresh'} <= set(response.cookies)
+    assert client.cookies['stuffr_refresh'] != old_refresh
+
+    monkeypatch.setattr(settings, 'REFRESH_TOKEN_REUSE_GRACE', 0)
+    set_cookie(client, 'stuffr_access', expired_access_token(client))
+    response = client.post(
+        f'/announcement/{announcement_id}/images', content=png_bytes(color='blue')
+    )
+    assert response.status_code == 201, response.text
+
+
+def test_failed_request_still_delivers_rotated_cookies(
+    client, register_user, monkeypatch
+):
+    register_user()
+    old_refresh = client.cookies['stuffr_refresh']
+    set_cookie(client, 'stuffr_access', expired_access_token(client))
+
+    response = client.post(
+        '/announcement/00000000-0000-0000-0000-000000000000/images',
+        content=png_bytes(),
+    )
+
+    assert response.status_code == 404
+    assert {'stuffr_access', 'stuffr_refresh'} <= set(response.cookies)
+    assert client.cookies['stuffr_refresh'] != old_refresh
+
+    monkeypatch.setattr(settings, 'REFRESH_TOKEN_REUSE_GRACE', 0)
+    set_cookie(client, 'stuffr_access', expired_access_token(client))
+    response = client.post('/user/logout')
+
+    assert response.status_code == 200
+    assert 'stuffr_refresh' not in client.cookies
+
+
+def test_export_with_expired_access_token_rotates_cookies(client, admin_user):
+    old_refresh = client.cookies['stuffr_refresh']
+    set_cookie(client, 'stuffr_access', expired_access_token(client))
+
+    response = client.get('/export/user')
+
+    assert response.status_code == 200
+    assert {'stuffr_access', 'stuffr_refresh'} <= set(response.cookies)
+    assert client.cookies['stuffr_refresh'] != old_refresh
+
+
+def test_concurrent_refresh_within_grace_is_allowed(client, admin_user):
+    old_refresh = client.cookies['stuffr_refresh']
+    expired_access = expired_access_token(client)
+    set_cookie(client, 'stuffr_access', expired_access)
+    assert client.get('/metrics/token-cache').status_code == 200
+
+    set_cookie(client, 'stuffr_access', expired_access)
+    set_cookie(client, 'stuffr_refresh', old_refresh)
+    response = client.get('/metrics/token-cache')
+
+    assert response.status_code == 200
+    assert 'stuffr_refresh' not in response.cookies
+
+
+def test_reuse_after_grace_revokes_family(client, admin_user, run_db, monkeypatch):
+    monkeypatch.setattr(settings, 'REFRESH_TOKEN_REUSE_GRACE', 0)
+    old_refresh = client.cookies['stuffr_refresh']
+    expired_access = expired_access_token(client)
+    set_cookie(client, 'stuffr_access', expired_access)
+    assert client.get('/metrics/token-cache').status_code == 200
+    new_refresh = client.cookies['stuffr_refresh']
+
+    set_cookie(client, 'stuffr_access', expired_access)
+    set_cookie(client, 'stuffr_refresh', old_refresh)
+    response = client.get('/metrics/token-cache')
+
+    assert response.status_code == 401
+    assert count_family_tokens(run_db, refresh_token=old_refresh) == 0
+
+    set_cookie(client, 'stuffr_access', expired_access)
+    set_cookie(client, 'stuffr_refresh', new_refresh)
+    assert client.get('/metrics/token-cache').status_code == 401
+
+
+def test_logout_after_refresh_revokes_family(client, register_user, run_db):
+    register_user()
+    old_refresh = client.cookies['stuffr_refresh']
+    expired_access = expired_access_token(client)
+    set_cookie(client, 'stuffr_access', expired_access)
+
+    response = client.post('/user/logout')
+
+    assert response.status_code == 200
+    assert count_family_tokens(run_db, refresh_token=old_refresh) == 0
+
+    issued_refresh = response.cookies.get('stuffr_refresh')
+    if issued_refresh:
+        set_cookie(client, 'stuffr_access', expired_access)
+        set_cookie(client, 'stuffr_refresh', issued_refresh)
+        assert client.post('/user/logout').status_code == 401
+
+
+def test_access_token_is_rejected_after_logout(client, admin_user):
+    access_token = client.cookies['stuffr_access']
+    assert client.post('/user/logout').status_code == 200
+
+    set_cookie(client, 'stuffr_access', access_token)
+    response = client.get('/metrics/token-cache')
+
+    assert response.status_code == 401
@@ -0,0 +1,46 @@
+import asyncio
+
+from sqlalchemy import func, select
+
+from src.database.database import session_maker
+from src.database.models.user_model import User
+from src.schemas.user_schemas import CreateUserScheme
+from src.services.user_service import get_user_service
+
+
+def test_duplicate_email_is_rejected(client, register_user):
+    user = register_user()
+    client.cookies.clear()
+
+    response = client.post(
+        '/user/register',
+        json={
+            'name': 'Tester',
+            'email': user['email'].upper(),
+            'password': 'password123',
+        },
+    )
+
+    assert response.status_code == 409
+    assert 'stuffr_access' not in response.cookies
+
+
+def test_concurrent_registrations_create_one_user(client, run_db):
+    async def create(name: str):
+        async with session_maker() as session:
+            user = await get_user_service().create_if_absent(
+                entity=CreateUserScheme(
+                    name=name, email='race@example.com', hashed_password='hash'
+                ),
+                session=session,
+            )
+            await session.commit()
+            return user
+
+    async def register_concurrently():
+        return await asyncio.gather(create('First'), create('Second'))
+
+    users = client.portal.call(register_concurrently)
+
+    assert len([user for user in users if user is not None]) == 1
+    assert run_db(lambda session: session.scalar(select(func.count(User.id)))) == 1
@@ -0,0 +1,22 @@
+from src.logging import logger
+
+
+def test_request_is_logged_with_request_id(client, monkeypatch):
+    records = []
+    monkeypatch.setattr(
+        logger, 'info', lambda message, *args, **kwargs: records.append(kwargs)
+    )
+
+    response = client.get('/metrics', headers={'x-request-id': 'request-1'})
+
+    assert response.headers['x-request-id'] == 'request-1'
+    assert records[-1]['extra']['path'] == '/metrics'
+    assert records[-1]['extra']['status_code'] == 200
+    assert records[-1]['extra']['duration_ms'] >= 0
+
+
+def test_request_id_is_generated(client):
+    first = client.get('/metrics').headers['x-request-id']
+    second = client.get('/metrics').headers['x-request-id']
+
+    assert first != second
@@ -0,0 +1,47 @@
+from fastapi import Depends
+from sqlalchemy import event
+
+from src.database.database import engine, get_async_session
+from src.dependencies import get_current_principal
+from src.main import app
+from src.utils.principal import Principal
+
+
+def count_checkouts(callback) -> int:
+    checkouts = []
+
+    def on_checkout(*args):
+        checkouts.append(args)
+
+    event.listen(engine.sync_engine.pool, 'checkout', on_checkout)
+    try:
+        callback()
+    finally:
+        event.remove(engine.sync_engine.pool, 'checkout', on_checkout)
+    return len(checkouts)
+
+
+def test_authenticated_write_uses_one_connection(client, register_user):
+    register_user()
+
+    def logout():
+        assert client.post('/user/logout').status_code == 200
+
+    assert count_checkouts(logout) == 1
+
+
+def test_principal_shares_request_session(client, register_user):
+    async def probe(
+        principal: Principal = Depends(get_current_principal),
+        session=Depends(get_async_session),
+    ):
+        return {'shared': principal._session is session}
+
+    app.add_api_route('/test/session-probe', probe)
+    try:
+        register_user()
+        response = client.get('/test/session-probe')
+    finally:
+        app.router.routes.pop()
+
+    assert response.json() == {'shared': True}
@@ -0,0 +1,76 @@
+def search(client, **params):
+    response = client.get('/announcement/search', params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def get_titles(page: dict) -> list[str]:
+    return [item['title'] for item in page['items']]
+
+
+def test_search_matches_word_forms_and_ranks_title_first(
+    client, register_user, create_announcement
+):
+    user = register_user()
+    create_announcement(
+        user_id=user['id'], title='Палатка', description='Влезет в багажник велосипеда'
+    )
+    create_announcement(
+        user_id=user['id'], title='Горный велосипед', description='Почти новый'
+    )
+    create_announcement(user_id=user['id'], title='Ноутбук', description='Рабочий')
+
+    page = search(client, query='велосипеды')
+
+    assert get_titles(page) == ['Горный велосипед', 'Палатка']
+
+
+def test_search_tolerates_typos_in_title(client, register_user, create_announcement):
+    user = register_user()
+    create_announcement(user_id=user['id'], title='Велосипед', description='Синий')
+
+    assert get_titles(search(client, query='Велосепед')) == ['Велосипед']
+
+
+def test_search_filters(client, register_user, create_announcement):
+    user = register_user()
+    create_announcement(user_id=user['id'], price=1000)
+    create_announcement(user_id=user['id'], price=5000, category_id=2)
+    create_announcement(user_id=user['id'], price=3000, status='CLOSED')
+
+    assert len(search(client, query='велосипед')['items']) == 2
+    assert len(search(client, query='велосипед', status='CLOSED')['items']) == 1
+    assert len(search(client, query='велосипед', category_id=2)['items']) == 1
+    prices = [
+        item['price']
+        for item in search(client, query='велосипед', min_price=2000)['items']
+    ]
+    assert prices == [5000]
+
+
+def test_search_pages_with_rank_cursor(client, register_user, create_announcement):
+    user = register_user()
+    ids = {create_announcement(user_id=user['id']) for _ in range(5)}
+
+    seen = []
+    cursor = None
+    while True:
+        params = {'query': 'велосипед', 'limit': 2}
+        if cursor:
+            params['cursor'] = cursor
+        page = search(client, **params)
+        seen.extend(item['id'] for item in page['items'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert set(seen) == {str(announcement_id) for announcement_id in ids}
+
+
+def test_search_rejects_invalid_cursor(client):
+    response = client.get(
+        '/announcement/search', params={'query': 'велосипед', 'cursor': 'broken'}
+    )
+
+    assert response.status_code == 402
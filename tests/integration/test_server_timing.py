@@ -0,0 +1,26 @@
+from src.config import settings
+
+
+def test_login_reports_phase_timings(client, register_user, monkeypatch):
+    user = register_user()
+    client.cookies.clear()
+    monkeypatch.setattr(settings, 'SERVER_TIMING_ENABLED', True)
+
+    response = client.post(
+        '/user/login', json={'email': user['email'], 'password': 'password123'}
+    )
+
+    assert response.status_code == 200
+    phases = {
+        metric.split(';')[0]: metric
+        for metric in response.headers['server-timing'].split(', ')
+    }
+    assert {'db', 'hash', 'token', 'serialize', 'total'} <= set(phases)
+    assert 'desc="2 queries"' in phases['db']
+
+
+def test_server_timing_is_off_by_default(client):
+    response = client.get('/category')
+
+    assert response.status_code == 200
+    assert 'server-timing' not in response.headers
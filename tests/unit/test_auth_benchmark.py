@@ -0,0 +1,44 @@
+from benchmarks.auth_benchmark import EndpointResult, compare
+
+
+def make_run(p99_ms: float, rps: float, errors: int = 0) -> dict:
+    return {
+        'endpoints': {
+            'login': {'p99_ms': p99_ms, 'rps': rps, 'errors': errors},
+        }
+    }
+
+
+def test_report_percentiles():
+    result = EndpointResult(endpoint='login')
+    result.latencies = [index / 1000 for index in range(1, 101)]
+    result.errors = 2
+    result.duration = 2.0
+
+    report = result.report()
+
+    assert report['requests'] == 102
+    assert report['rps'] == 50.0
+    assert round(report['p50_ms'], 1) == 50.5
+    assert round(report['p99_ms'], 1) == 99.0
+    assert report['max_ms'] == 100.0
+
+
+def test_report_without_requests():
+    report = EndpointResult(endpoint='logout').report()
+
+    assert report['requests'] == 0
+    assert report['p99_ms'] == 0.0
+
+
+def test_compare_within_threshold():
+    assert compare(make_run(105, 95), make_run(100, 100), threshold=0.1) == []
+
+
+def test_compare_reports_regressions():
+    regressions = compare(
+        make_run(p99_ms=150, rps=50, errors=1), make_run(100, 100), threshold=0.1
+    )
+
+    assert len(regressions) == 3
+    assert all(regression.startswith('login:') for regression in regressions)
@@ -0,0 +1,128 @@
+import datetime
+import uuid
+
+import orjson
+import pytest
+
+from src.database.models.announcement_model import Announcement
+from src.database.models.user_model import User
+from src.utils.entity_cache import EntityCache, LocalCacheTier, RedisCacheTier
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int) -> None:
+        self.values[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def scan_iter(self, match: str):
+        for key in list(self.values):
+            if key.startswith(match.rstrip('*')):
+                yield key
+
+
+@pytest.fixture
+def redis_client():
+    client = FakeRedis()
+    EntityCache.configure_redis(client=client)
+    yield client
+    EntityCache.configure_redis(client=None)
+
+
+def make_user() -> User:
+    return User(
+        id=uuid.uuid4(),
+        name='Tester',
+        email='tester@example.com',
+        hashed_password='$2b$12$secret',
+        role_id=1,
+        rating_sum=0,
+        rating_count=0,
+        token_version=0,
+    )
+
+
+async def test_local_tier_evicts_least_recently_used():
+    tier = LocalCacheTier(max_size=2, ttl=60)
+    await tier.set(key='a', value={'id': 'a'})
+    await tier.set(key='b', value={'id': 'b'})
+    await tier.get(key='a')
+    await tier.set(key='c', value={'id': 'c'})
+
+    assert await tier.get(key='b') is None
+    assert await tier.get(key='a') == {'id': 'a'}
+    assert tier.stats.snapshot()['hits'] == 2
+
+
+async def test_local_tier_expires_entries():
+    tier = LocalCacheTier(max_size=2, ttl=0)
+    await tier.set(key='a', value={'id': 'a'})
+
+    assert await tier.get(key='a') is None
+
+
+async def test_credentials_are_not_cached():
+    cache = EntityCache(model=User)
+    user = make_user()
+
+    await cache.set(entity=user)
+    cached_user = await cache.get(entity_id=user.id)
+
+    assert 'hashed_password' not in cache.columns
+    assert cached_user.email == user.email
+    assert 'hashed_password' not in cached_user.__dict__
+
+
+async def test_redis_tier_stores_json(redis_client):
+    cache = EntityCache(model=User)
+    user = make_user()
+
+    await cache.set(entity=user)
+
+    assert isinstance(cache.tiers[1], RedisCacheTier)
+    stored = orjson.loads(redis_client.values[f'stuffr:user:{user.id}'])
+    assert stored['id'] == str(user.id)
+    assert 'hashed_password' not in stored
+
+
+async def test_redis_tier_restores_column_types(redis_client):
+    cache = EntityCache(model=Announcement)
+    announcement = Announcement(
+        id=uuid.uuid4(),
+        title='Велосипед',
+        description='Горный велосипед',
+        user_id=uuid.uuid4(),
+        category_id=1,
+        status='PUBLISHED',
+        currency='RUB',
+        created_at=datetime.datetime.now(tz=datetime.timezone.utc),
+    )
+    await cache.set(entity=announcement)
+    await cache.tiers[0].clear()
+
+    cached_announcement = await cache.get(entity_id=announcement.id)
+
+    assert cached_announcement.id == announcement.id
+    assert isinstance(cached_announcement.user_id, uuid.UUID)
+    assert cached_announcement.created_at == announcement.created_at
+    assert await cache.tiers[0].get(key=str(announcement.id)) is not None
+
+
+async def test_invalidate_all_clears_every_tier(redis_client):
+    cache = EntityCache(model=User)
+    await cache.set(entity=make_user())
+
+    await cache.invalidate_all()
+
+    assert redis_client.values == {}
+    assert cache.tiers[0]._entries == {}
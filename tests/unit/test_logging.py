@@ -0,0 +1,62 @@
+import json
+import logging
+import sys
+
+from src.logging import (
+    JsonFormatter,
+    RequestIdFilter,
+    StructuredQueueHandler,
+    request_id_var,
+)
+
+
+def make_record(**kwargs) -> logging.LogRecord:
+    record = logging.LogRecord(
+        'src.logging', logging.ERROR, __file__, 10, 'Failed %s', ('upload',), None
+    )
+    record.__dict__.update(kwargs)
+    return record
+
+
+def test_handler_prepares_record_for_queue():
+    try:
+        raise ValueError('broken')
+    except ValueError:
+        record = make_record(exc_info=sys.exc_info())
+
+    prepared = StructuredQueueHandler(None).prepare(record)
+
+    assert prepared.msg == 'Failed upload'
+    assert prepared.args is None
+    assert prepared.exc_info is None
+    assert 'ValueError: broken' in prepared.exc_text
+
+
+def test_request_id_is_attached():
+    record = make_record()
+    token = request_id_var.set('request-1')
+    try:
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+
+    assert record.request_id == 'request-1'
+
+
+def test_json_formatter_includes_extras_and_exception():
+    try:
+        raise ValueError('broken')
+    except ValueError:
+        record = make_record(
+            exc_info=sys.exc_info(), request_id='request-1', status_code=500
+        )
+    record = StructuredQueueHandler(None).prepare(record)
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry['level'] == 'ERROR'
+    assert entry['message'] == 'Failed upload'
+    assert entry['request_id'] == 'request-1'
+    assert entry['status_code'] == 500
+    assert 'ValueError: broken' in entry['exception']
+    assert 'exc_text' not in entry
@@ -0,0 +1,39 @@
+import uuid
+
+import pytest
+
+from src.exceptions import InvalidCursorException
+from src.utils.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+
+
+def test_cursor_round_trip():
+    entity_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(entity_id)) == str(entity_id)
+    assert decode_cursor(encode_cursor(42)) == 42
+
+
+@pytest.mark.parametrize('cursor', ['not-base64!', 'e30=', 'WzFd', ''])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor)
+
+
+def test_rank_cursor_round_trip():
+    entity_id = uuid.uuid4()
+
+    assert decode_rank_cursor(encode_rank_cursor(0.25, entity_id)) == (
+        0.25,
+        str(entity_id),
+    )
+
+
+@pytest.mark.parametrize('cursor', ['broken', encode_cursor(1)])
+def test_invalid_rank_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorException):
+        decode_rank_cursor(cursor)
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+
+import bcrypt
+import pytest
+
+from src.config import settings
+from src.exceptions import PasswordHasherBusyException
+from src.utils.password_manager import PasswordManager
+
+
+@pytest.fixture(autouse=True)
+def fast_bcrypt(monkeypatch):
+    gensalt = bcrypt.gensalt
+    monkeypatch.setattr(bcrypt, 'gensalt', lambda: gensalt(rounds=4))
+    yield
+    PasswordManager.shutdown()
+
+
+@pytest.mark.anyio
+async def test_async_hash_round_trip():
+    hashed = await PasswordManager.get_password_hash_async(password='password123')
+
+    assert await PasswordManager.check_password_hash_async(
+        password='password123', hashed=hashed.decode()
+    )
+    assert not await PasswordManager.check_password_hash_async(
+        password='password124', hashed=hashed.decode()
+    )
+    assert PasswordManager.check_password_hash(
+        password='password123', hashed=hashed.decode()
+    )
+
+
+@pytest.mark.anyio
+async def test_hashing_does_not_block_event_loop(monkeypatch):
+    loop_ran = threading.Event()
+
+    def slow_hash(password, salt):
+        return b'hash' if loop_ran.wait(timeout=2) else b'blocked'
+
+    async def run_loop():
+        await asyncio.sleep(0.01)
+        loop_ran.set()
+
+    monkeypatch.setattr(bcrypt, 'hashpw', slow_hash)
+
+    result, _ = await asyncio.gather(
+        PasswordManager.get_password_hash_async(password='password123'), run_loop()
+    )
+
+    assert result == b'hash'
+
+
+@pytest.mark.anyio
+async def test_full_queue_is_rejected(monkeypatch):
+    monkeypatch.setattr(settings, 'PASSWORD_HASH_MAX_QUEUE', 1)
+    first = asyncio.create_task(
+        PasswordManager.get_password_hash_async(password='password123')
+    )
+    await asyncio.sleep(0)
+
+    assert PasswordManager.queue_depth() == 1
+    with pytest.raises(PasswordHasherBusyException):
+        await PasswordManager.get_password_hash_async(password='password123')
+
+    await first
+    assert PasswordManager.queue_depth() == 0
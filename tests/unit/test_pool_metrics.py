@@ -0,0 +1,16 @@
+from src.database.pool_metrics import PoolStats
+
+
+def test_pool_stats_buckets_wait_times():
+    stats = PoolStats()
+
+    for seconds in (0.0005, 0.003, 0.003, 10.0):
+        stats.observe(seconds=seconds)
+
+    assert stats.checkouts == 4
+    assert stats.max_wait_time == 10.0
+    assert round(stats.wait_time, 4) == 10.0065
+    assert stats.bucket_counts[0] == 1
+    assert stats.bucket_counts[1] == 2
+    assert stats.bucket_counts[-1] == 1
+    assert sum(stats.bucket_counts) == 4
@@ -0,0 +1,52 @@
+import pytest
+
+from src.utils.principal import Principal
+from src.utils.token_manager import TokenManager
+
+
+class FakeUser:
+    id = 'user-id'
+    role_id = 2
+    token_version = 3
+
+
+class FakeSession:
+    def __init__(self):
+        self.loaded = []
+
+    async def get(self, model, entity_id):
+        self.loaded.append(entity_id)
+        return FakeUser()
+
+
+def test_principal_is_built_from_claims_without_queries():
+    session = FakeSession()
+
+    principal = Principal.from_payload(
+        payload=TokenManager.get_claims(FakeUser()), session=session
+    )
+
+    assert (principal.id, principal.role_id, principal.token_version) == (
+        'user-id',
+        2,
+        3,
+    )
+    assert session.loaded == []
+
+
+def test_principal_defaults_for_old_claims():
+    principal = Principal.from_payload(payload={'sub': 'user-id'}, session=None)
+
+    assert (principal.role_id, principal.token_version) == (1, 0)
+
+
+@pytest.mark.anyio
+async def test_user_is_loaded_once_on_demand():
+    session = FakeSession()
+    principal = Principal.from_payload(payload={'sub': 'user-id'}, session=session)
+
+    first = await principal.get_user()
+    second = await principal.get_user()
+
+    assert first is second
+    assert session.loaded == ['user-id']
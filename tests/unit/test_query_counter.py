@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from src.utils.query_counter import QueryBudgetExceededError, QueryCounter
+
+
+def test_counts_statements_in_context():
+    with QueryCounter() as counter:
+        QueryCounter.record_statement(statement='SELECT 1')
+        QueryCounter.record_statement(statement='SELECT 2')
+
+    assert counter.statements == ['SELECT 1', 'SELECT 2']
+
+
+def test_ignores_statements_outside_context():
+    with QueryCounter() as counter:
+        pass
+    QueryCounter.record_statement(statement='SELECT 1')
+
+    assert counter.count == 0
+
+
+def test_nested_counters_feed_parent():
+    with QueryCounter() as outer:
+        QueryCounter.record_statement(statement='SELECT 1')
+        with QueryCounter() as inner:
+            QueryCounter.record_statement(statement='SELECT 2')
+
+    assert inner.count == 1
+    assert outer.count == 2
+
+
+def test_budget_exceeded():
+    with pytest.raises(QueryBudgetExceededError, match='at most 1 queries, got 2'):
+        with QueryCounter(max_queries=1):
+            QueryCounter.record_statement(statement='SELECT 1')
+            QueryCounter.record_statement(statement='SELECT 2')
+
+
+def test_global_scope_sees_other_threads():
+    with QueryCounter(max_queries=1, global_scope=True) as counter:
+        thread = threading.Thread(
+            target=QueryCounter.record_statement, kwargs={'statement': 'SELECT 1'}
+        )
+        thread.start()
+        thread.join()
+
+    assert counter.statements == ['SELECT 1']
+
+
+def test_repeated_statements():
+    with QueryCounter() as counter:
+        for _ in range(3):
+            QueryCounter.record_statement(statement='SELECT 1')
+        QueryCounter.record_statement(statement='SELECT 2')
+
+    assert counter.repeated(threshold=3) == {'SELECT 1': 3}
@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database.models.user_model import User
+from src.database.replica_router import ReplicaRouter, RoutingSession
+
+primary = create_async_engine('postgresql+asyncpg://primary/stuffr')
+replica = create_async_engine('postgresql+asyncpg://replica/stuffr')
+
+
+class TestSession(RoutingSession):
+    __test__ = False
+    primary = primary
+    replica_router = ReplicaRouter(engines=[replica])
+
+
+@pytest.fixture
+def session():
+    return TestSession()
+
+
+def test_reads_go_to_replica(session):
+    assert session.get_bind(clause=select(User)) is replica.sync_engine
+
+
+def test_writes_pin_session_to_primary(session):
+    assert session.get_bind(clause=update(User)) is primary.sync_engine
+    assert session.get_bind(clause=select(User)) is primary.sync_engine
+
+
+def test_locking_reads_go_to_primary(session):
+    assert session.get_bind(clause=select(User).with_for_update()) is (
+        primary.sync_engine
+    )
+
+
+def test_use_primary_option_does_not_pin_session(session):
+    query = select(User).execution_options(use_primary=True)
+
+    assert session.get_bind(clause=query) is primary.sync_engine
+    assert 'wrote' not in session.info
+    assert session.get_bind(clause=select(User)) is replica.sync_engine
+
+
+def test_use_primary_session(session):
+    session.info['use_primary'] = True
+
+    assert session.get_bind(clause=select(User)) is primary.sync_engine
+
+
+def test_no_healthy_replica_falls_back_to_primary(session):
+    TestSession.replica_router.healthy = []
+    try:
+        assert session.get_bind(clause=select(User)) is primary.sync_engine
+    finally:
+        TestSession.replica_router.healthy = [replica]
+
+
+def test_replicas_are_chosen_round_robin():
+    other = create_async_engine('postgresql+asyncpg://other/stuffr')
+    router = ReplicaRouter(engines=[replica, other])
+
+    assert [router.choose() for _ in range(4)] == [replica, other, replica, other]
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from src.database import database
+from src.utils.request_timing import RequestTiming, request_timing_var
+from src.utils.serializer import SchemeSerializer
+
+
+class ItemScheme(BaseModel):
+    id: int
+    title: str
+
+
+@pytest.fixture
+def timing():
+    timing = RequestTiming()
+    token = request_timing_var.set(timing)
+    yield timing
+    request_timing_var.reset(token)
+
+
+class SlowCommitSession:
+    def __init__(self):
+        self.info = {}
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def in_transaction(self) -> bool:
+        return True
+
+    async def commit(self):
+        await asyncio.sleep(0.05)
+        self.committed = True
+
+
+def test_measure_without_timing_is_noop():
+    with RequestTiming.measure(phase='db'):
+        pass
+
+    assert RequestTiming.current() is None
+
+
+def test_measure_accumulates_phases(timing):
+    with RequestTiming.measure(phase='hash'):
+        pass
+    with RequestTiming.measure(phase='hash'):
+        pass
+    timing.add(phase='db', seconds=0.002)
+    timing.db_queries = 2
+
+    assert set(timing.phases) == {'hash', 'db'}
+    header = timing.server_timing_header()
+    assert 'db;dur=2.000;desc="2 queries"' in header
+    assert header.split(', ')[-1].startswith('total;dur=')
+    assert timing.as_dict()['db_queries'] == 2
+
+
+def test_serializer_records_serialize_phase(timing):
+    serializer = SchemeSerializer(scheme=list[ItemScheme])
+
+    content = serializer.to_json([{'id': 1, 'title': 'Велосипед'}])
+
+    assert content == '[{"id":1,"title":"Велосипед"}]'.encode()
+    assert timing.phases['serialize'] > 0
+
+
+@pytest.mark.anyio
+async def test_commit_is_recorded_as_db(timing, monkeypatch):
+    session = SlowCommitSession()
+    monkeypatch.setattr(database, 'session_maker', lambda: session)
+
+    dependency = database.get_async_session()
+    assert await dependency.__anext__() is session
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    assert session.committed
+    assert timing.phases['db'] >= 0.05
+    assert 'serialize' not in timing.phases
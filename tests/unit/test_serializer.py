@@ -0,0 +1,64 @@
+import json
+import uuid
+
+import pydantic
+import pytest
+
+from src.schemas.base_schemas import PageScheme
+from src.schemas.user_schemas import GetUserScheme
+from src.utils.serializer import SchemeSerializer
+
+
+class UserRow:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+def make_user(**values) -> UserRow:
+    return UserRow(
+        id=uuid.UUID('00000000-0000-0000-0000-000000000001'),
+        name='Tester',
+        second_name=None,
+        avatar_url='https://example.com/avatar.png',
+        role_id=1,
+        rating=4.5,
+        rating_count=2,
+        email='tester@example.com',
+        phone=None,
+        hashed_password='hash',
+        **values,
+    )
+
+
+def test_serializes_attributes_and_drops_unknown_fields():
+    content = json.loads(SchemeSerializer(scheme=GetUserScheme).to_json(make_user()))
+
+    assert content['id'] == '00000000-0000-0000-0000-000000000001'
+    assert content['avatar_url'] == 'https://example.com/avatar.png'
+    assert content['rating'] == 4.5
+    assert 'hashed_password' not in content
+
+
+def test_serializes_generic_pages():
+    serializer = SchemeSerializer(scheme=PageScheme[GetUserScheme])
+
+    content = json.loads(
+        serializer.to_json(PageScheme(items=[make_user()], next_cursor='next'))
+    )
+
+    assert content['next_cursor'] == 'next'
+    assert [item['email'] for item in content['items']] == ['tester@example.com']
+
+
+def test_response_has_status_and_media_type():
+    response = SchemeSerializer(scheme=GetUserScheme).to_response(
+        make_user(), status_code=201
+    )
+
+    assert response.status_code == 201
+    assert response.media_type == 'application/json'
+
+
+def test_invalid_objects_are_rejected():
+    with pytest.raises(pydantic.ValidationError):
+        SchemeSerializer(scheme=GetUserScheme).to_json(UserRow(id='1'))
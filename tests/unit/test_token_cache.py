@@ -0,0 +1,84 @@
+import time
+
+from src.utils.token_cache import TokenCache
+
+
+def payload(ttl: float = 60, subject: str = 'user') -> dict:
+    return {'sub': subject, 'exp': time.time() + ttl}
+
+
+def test_hit_returns_copy():
+    cache = TokenCache(max_size=2)
+    cache.put(key='a', payload=payload())
+
+    cached = cache.get(key='a')
+    cached['sub'] = 'changed'
+
+    assert cache.get(key='a')['sub'] == 'user'
+    assert cache.stats()['hits'] == 2
+
+
+def test_miss():
+    cache = TokenCache(max_size=2)
+
+    assert cache.get(key='a') is None
+    assert cache.stats()['misses'] == 1
+
+
+def test_expired_entry_is_a_miss():
+    cache = TokenCache(max_size=2)
+    cache.put(key='a', payload=payload(ttl=-1))
+
+    assert cache.get(key='a') is None
+    assert cache.stats()['size'] == 0
+
+
+def test_evicts_least_recently_used():
+    cache = TokenCache(max_size=2)
+    cache.put(key='a', payload=payload())
+    cache.put(key='b', payload=payload())
+    cache.get(key='a')
+    cache.put(key='c', payload=payload())
+
+    assert cache.get(key='b') is None
+    assert cache.get(key='a') is not None
+    assert cache.stats()['size'] == 2
+
+
+def test_payload_without_numeric_exp_is_not_cached():
+    cache = TokenCache(max_size=2)
+    cache.put(key='a', payload={'sub': 'user'})
+
+    assert cache.get(key='a') is None
+
+
+def test_revoke_evicts_and_remembers_until_expiry():
+    cache = TokenCache(max_size=2)
+    cache.put(key='a', payload=payload())
+
+    cache.revoke(key='a', expires_at=time.time() + 60)
+
+    assert cache.get(key='a') is None
+    assert cache.is_revoked(key='a')
+    assert cache.stats()['revoked'] == 1
+
+
+def test_revocation_ends_at_expiry():
+    cache = TokenCache(max_size=2)
+    cache.revoke(key='a', expires_at=time.time() + 0.05)
+    cache.revoke(key='b', expires_at=time.time() - 1)
+
+    assert cache.is_revoked(key='a')
+    assert not cache.is_revoked(key='b')
+    time.sleep(0.06)
+    assert not cache.is_revoked(key='a')
+    assert cache.stats()['revoked'] == 0
+
+
+def test_clear_drops_revocations():
+    cache = TokenCache(max_size=2)
+    cache.revoke(key='a', expires_at=time.time() + 60)
+
+    cache.clear()
+
+    assert not cache.is_revoked(key='a')
@@ -0,0 +1,57 @@
+import uuid
+from types import SimpleNamespace
+
+import jwt
+import pytest
+
+from src.utils.token_manager import TokenManager, TokenRevokedError
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    TokenManager.token_cache.clear()
+    yield
+    TokenManager.token_cache.clear()
+
+
+def issue_tokens() -> tuple[str, str]:
+    user = SimpleNamespace(id=uuid.uuid4(), role_id=1, token_version=0)
+    return TokenManager.get_tokens(
+        {**TokenManager.get_claims(user), 'fam': str(uuid.uuid4())}
+    )
+
+
+def test_decode_caches_verified_payload():
+    access_token, _refresh_token = issue_tokens()
+
+    hits = TokenManager.token_cache.stats()['hits']
+    first = TokenManager.decode_token(token=access_token)
+    second = TokenManager.decode_token(token=access_token)
+
+    assert first == second
+    assert TokenManager.token_cache.stats()['hits'] == hits + 1
+
+
+def test_decode_rejects_tampered_token():
+    access_token, _refresh_token = issue_tokens()
+    header, payload, signature = access_token.split('.')
+
+    with pytest.raises(jwt.InvalidTokenError):
+        TokenManager.decode_token(token=f'{header}.{payload}.{signature[::-1]}')
+
+
+def test_revoked_token_is_rejected_even_if_valid():
+    access_token, refresh_token = issue_tokens()
+    TokenManager.decode_token(token=access_token)
+
+    TokenManager.revoke_token(token=access_token)
+
+    with pytest.raises(TokenRevokedError):
+        TokenManager.decode_token(token=access_token)
+    assert TokenManager.decode_token(token=refresh_token)['sub']
+
+
+def test_revoking_garbage_is_ignored():
+    TokenManager.revoke_token(token='not-a-token')
+
+    assert TokenManager.token_cache.stats()['revoked'] == 0
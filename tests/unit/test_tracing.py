@@ -0,0 +1,67 @@
+import pytest
+
+from src.config import settings
+from src.logging import logger
+from src.utils.decorators import TRACE_LOG_LEVEL, trace_decorator
+from src.utils.metrics import current_method_var
+from src.utils.tracing import LazyArguments, Tracer
+
+
+class Repository:
+    @trace_decorator
+    async def load(self, entity_id: int) -> str:
+        return current_method_var.get()
+
+    @trace_decorator
+    def count(self) -> int:
+        return 1
+
+
+@pytest.fixture
+def logged(monkeypatch):
+    calls = []
+    monkeypatch.setattr(logger, 'log', lambda *args: calls.append(args))
+    monkeypatch.setattr(logger, 'isEnabledFor', lambda level: True)
+    Tracer.reset()
+    yield calls
+    Tracer.reset()
+
+
+@pytest.mark.anyio
+async def test_calls_are_recorded(logged):
+    assert await Repository().load(entity_id=1) == 'Repository.load'
+    assert Repository().count() == 1
+    assert Repository().count() == 1
+
+    snapshot = Tracer.snapshot()
+    assert snapshot['Repository.load']['calls'] == 1
+    assert snapshot['Repository.count']['calls'] == 2
+    assert current_method_var.get() == 'unknown'
+    assert [call[0] for call in logged] == [TRACE_LOG_LEVEL] * 3
+
+
+def test_disabled_level_skips_logging(logged, monkeypatch):
+    monkeypatch.setattr(logger, 'isEnabledFor', lambda level: False)
+
+    Repository().count()
+
+    assert logged == []
+    assert Tracer.snapshot()['Repository.count']['calls'] == 1
+
+
+def test_sampling_skips_logging(logged, monkeypatch):
+    monkeypatch.setattr(settings, 'TRACE_SAMPLE_RATE', 0.0)
+
+    Repository().count()
+
+    assert logged == []
+
+
+def test_arguments_are_formatted_lazily_and_truncated():
+    arguments = LazyArguments(args=(Repository(), 'x' * 200), kwargs={'ids': [1] * 20})
+
+    formatted = str(arguments)
+
+    assert len(formatted) < 120
+    assert formatted.startswith("'xxx")
+    assert 'ids=[1, 1, 1, 1, 1, ...]' in formatted